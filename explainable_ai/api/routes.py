@@ -2,30 +2,120 @@
 
 from __future__ import annotations
 
+import asyncio
 import csv
 import io
+import itertools
+import json
+import os
 import time
 import uuid
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict
-
-from fastapi import FastAPI, File, HTTPException, UploadFile
-
+from typing import Any, AsyncIterator, Dict, FrozenSet, Iterator, List, Tuple
+
+import numpy as np
+from fastapi import FastAPI, File, Form, HTTPException, UploadFile
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from PyPDF2.errors import PyPdfError
+
+from explainable_ai.core.audit.audit_analytics import (
+    BUCKET_DAY,
+    BUCKET_WEEK,
+    decision_counts,
+    latency_percentiles,
+    seal_segments,
+)
 from explainable_ai.core.audit.audit_logger import log_decision
+from explainable_ai.core.audit.audit_reader import read_record, update_index
+from explainable_ai.core.audit.audit_writer import close_audit_writers
+from explainable_ai.core.cache.lru_cache import LRUCache
+from explainable_ai.core.engine.clause_index import ClauseIndex, segment_clauses
 from explainable_ai.core.engine.main import evaluate_contract
-from explainable_ai.core.engine.rule_engine import RuleEngine
-from explainable_ai.core.governance.governance import apply_governance_layer
+from explainable_ai.core.engine.policy_registry import get_rule_engine
+from explainable_ai.core.engine.result_cache import get_result_cache_stats
+from explainable_ai.core.engine.revision_store import get_revision_store_stats
+from explainable_ai.core.engine.rule_engine import RuleEngine, deterministic_label_codes
+from explainable_ai.core.explanation.explanation_cache import get_explanation_cache_stats
+from explainable_ai.core.explanation.explanation_jobs import (
+    get_explanation_future,
+    get_explanation_job,
+    job_payload,
+    submit_explanation,
+)
+from explainable_ai.core.governance.governance import RISK_LABELS, apply_governance_layers
+from explainable_ai.core.ingestion.pdf_text import extract_pdf_text
 from explainable_ai.core.logging.logger import get_logger
-from explainable_ai.core.metrics.metrics import record_decision
-from explainable_ai.core.scoring.scoring import calculate_confidence_vector
-from explainable_ai.core.trace.decision_trace import generate_decision_trace
-
-
-app = FastAPI(title="Explainable AI Governance API")
+from explainable_ai.core.metrics.metrics import (
+    get_prometheus_metrics,
+    record_decision,
+    record_stage_timings,
+)
+from explainable_ai.core.metrics.stage_timer import (
+    NULL_STAGE_TIMER,
+    STAGE_TIMING_ENABLED,
+    StageTimer,
+    stage_timings_reported,
+)
+from explainable_ai.core.scoring.scoring import (
+    calculate_confidence_vector,
+    calculate_confidence_vectors,
+    invalid_confidence_rows,
+)
+
+
+@asynccontextmanager
+async def _lifespan(_: FastAPI) -> AsyncIterator[None]:
+    # Index records the decision lookup cannot find yet, e.g. after the index file was lost.
+    indexed = await asyncio.to_thread(update_index)
+    if indexed:
+        logger.info(f"Audit index updated with {indexed} records")
+    # Summarise segments left unsealed by workers that did not shut down cleanly.
+    await asyncio.to_thread(seal_segments)
+    yield
+    # Drain queued audit records before the worker exits.
+    close_audit_writers()
+
+
+app = FastAPI(title="Explainable AI Governance API", lifespan=_lifespan)
 logger = get_logger(__name__)
 
 BASE_DIR = Path(__file__).resolve().parents[1]
 POLICY_PATH = BASE_DIR / "policies" / "rules.yaml"
+BATCH_SIZE = 256
+SSE_KEEPALIVE_SECONDS = 15.0
+ANALYTICS_DEFAULT_DAYS = 30
+CLAUSE_PAGE_DEFAULT = 100
+CLAUSE_PAGE_MAX = 1000
+# Each entry holds a whole document, so the default is kept small.
+CLAUSE_INDEX_CACHE_ENTRIES = int(os.getenv("CLAUSE_INDEX_CACHE_SIZE", "32"))
+_CLAUSE_INDEXES = LRUCache(max_entries=CLAUSE_INDEX_CACHE_ENTRIES)
+
+EXPLANATION_MODE_ASYNC = "async"
+EXPLANATION_MODE_SYNC = "sync"
+EXPLANATION_MODES = (EXPLANATION_MODE_ASYNC, EXPLANATION_MODE_SYNC)
+
+TRACE_DOCUMENT_INLINE = "inline"
+TRACE_DOCUMENT_HASH = "hash"
+TRACE_DOCUMENT_MODES = (TRACE_DOCUMENT_INLINE, TRACE_DOCUMENT_HASH)
+
+# Evaluation response fields selectable with ``include``; the id and decision are always returned.
+ALWAYS_INCLUDED_FIELDS = ("decision_id", "decision")
+RESPONSE_FIELDS = (
+    "deterministic_label",
+    "confidence_vector",
+    "trace",
+    "risk_keywords_found",
+    "risk_flag_count",
+    "ai_explanation",
+    "explanation_job_id",
+    "policy_digest",
+    "cache_hit",
+    "latency_ms",
+    "reused_clauses",
+    "stage_timings_ms",
+)
 
 
 @app.get("/health")
@@ -36,7 +126,6 @@ def health() -> Dict[str, str]:
 @app.post("/evaluate")
 def evaluate(request_data: Dict[str, Any]) -> Dict[str, Any]:
     start = time.perf_counter()
-    decision_id: str | None = None
 
     enable_ai_explanation = request_data.get("enable_ai_explanation", False)
     if not isinstance(enable_ai_explanation, bool):
@@ -45,6 +134,89 @@ def evaluate(request_data: Dict[str, Any]) -> Dict[str, Any]:
             detail="enable_ai_explanation must be a boolean.",
         )
 
+    explanation_mode = request_data.get("explanation_mode", EXPLANATION_MODE_ASYNC)
+    if explanation_mode not in EXPLANATION_MODES:
+        raise HTTPException(
+            status_code=400,
+            detail="explanation_mode must be 'async' or 'sync'.",
+        )
+
+    include_stage_timings = request_data.get("include_stage_timings", False)
+    if not isinstance(include_stage_timings, bool):
+        raise HTTPException(
+            status_code=400,
+            detail="include_stage_timings must be a boolean.",
+        )
+
+    track_revision = request_data.get("track_revision", False)
+    if not isinstance(track_revision, bool):
+        raise HTTPException(
+            status_code=400,
+            detail="track_revision must be a boolean.",
+        )
+
+    include, document_reference = _response_options(
+        request_data.get("include"),
+        request_data.get("trace_document", TRACE_DOCUMENT_INLINE),
+    )
+
+    document_text = request_data.get("document_text")
+    if not isinstance(document_text, str) or not document_text.strip():
+        raise HTTPException(
+            status_code=400,
+            detail="document_text must be a non-empty string.",
+        )
+
+    return _evaluate_document(
+        document_text,
+        enable_ai_explanation,
+        explanation_mode,
+        start,
+        "/evaluate",
+        StageTimer(),
+        report_timings=stage_timings_reported(include_stage_timings),
+        track_revision=track_revision,
+        include=include,
+        document_reference=document_reference,
+    )
+
+
+@app.post("/evaluate/revision")
+def evaluate_revision(request_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Evaluate an edited contract, rescanning only clauses changed since a prior revision.
+
+    The prior revision is given either as ``previous_decision_id`` of its
+    audited evaluation or as ``previous_document_text``. The decision is
+    identical to ``/evaluate`` on the same text.
+    """
+    start = time.perf_counter()
+
+    enable_ai_explanation = request_data.get("enable_ai_explanation", False)
+    if not isinstance(enable_ai_explanation, bool):
+        raise HTTPException(
+            status_code=400,
+            detail="enable_ai_explanation must be a boolean.",
+        )
+
+    explanation_mode = request_data.get("explanation_mode", EXPLANATION_MODE_ASYNC)
+    if explanation_mode not in EXPLANATION_MODES:
+        raise HTTPException(
+            status_code=400,
+            detail="explanation_mode must be 'async' or 'sync'.",
+        )
+
+    include_stage_timings = request_data.get("include_stage_timings", False)
+    if not isinstance(include_stage_timings, bool):
+        raise HTTPException(
+            status_code=400,
+            detail="include_stage_timings must be a boolean.",
+        )
+
+    include, document_reference = _response_options(
+        request_data.get("include"),
+        request_data.get("trace_document", TRACE_DOCUMENT_INLINE),
+    )
+
     document_text = request_data.get("document_text")
     if not isinstance(document_text, str) or not document_text.strip():
         raise HTTPException(
@@ -52,21 +224,247 @@ def evaluate(request_data: Dict[str, Any]) -> Dict[str, Any]:
             detail="document_text must be a non-empty string.",
         )
 
+    previous_decision_id = request_data.get("previous_decision_id")
+    previous_document_text = request_data.get("previous_document_text")
+    if (previous_decision_id is None) == (previous_document_text is None):
+        raise HTTPException(
+            status_code=400,
+            detail="Provide exactly one of previous_decision_id or previous_document_text.",
+        )
+
+    if previous_decision_id is not None:
+        if not isinstance(previous_decision_id, str):
+            raise HTTPException(status_code=400, detail="previous_decision_id must be a string.")
+        previous_document_text = _audited_document_text(previous_decision_id)
+    elif not isinstance(previous_document_text, str):
+        raise HTTPException(status_code=400, detail="previous_document_text must be a string.")
+
+    return _evaluate_document(
+        document_text,
+        enable_ai_explanation,
+        explanation_mode,
+        start,
+        "/evaluate/revision",
+        StageTimer(),
+        report_timings=stage_timings_reported(include_stage_timings),
+        previous_document_text=previous_document_text,
+        previous_decision_id=previous_decision_id,
+        track_revision=True,
+        include=include,
+        document_reference=document_reference,
+    )
+
+
+@app.post("/evaluate_pdf")
+def evaluate_pdf(
+    file: UploadFile = File(...),
+    enable_ai_explanation: bool = Form(False),
+    explanation_mode: str = Form(EXPLANATION_MODE_ASYNC),
+    include_stage_timings: bool = Form(False),
+    include: str = Form(""),
+    trace_document: str = Form(TRACE_DOCUMENT_INLINE),
+) -> Dict[str, Any]:
+    start = time.perf_counter()
+    timer = StageTimer()
+
+    if not file.filename or not file.filename.lower().endswith(".pdf"):
+        raise HTTPException(status_code=400, detail="Please upload a PDF file.")
+
+    if explanation_mode not in EXPLANATION_MODES:
+        raise HTTPException(
+            status_code=400,
+            detail="explanation_mode must be 'async' or 'sync'.",
+        )
+
+    include_fields, document_reference = _response_options(include, trace_document)
+
+    try:
+        with timer.stage("pdf_extract"):
+            document_text = extract_pdf_text(file.file.read())
+    except PyPdfError as exc:
+        logger.error(f"PDF extraction error: {str(exc)}", exc_info=True)
+        raise HTTPException(status_code=400, detail="PDF file could not be read.") from exc
+
+    if not document_text.strip():
+        raise HTTPException(status_code=400, detail="PDF file contains no extractable text.")
+
+    return _evaluate_document(
+        document_text,
+        enable_ai_explanation,
+        explanation_mode,
+        start,
+        "/evaluate_pdf",
+        timer,
+        report_timings=stage_timings_reported(include_stage_timings),
+        include=include_fields,
+        document_reference=document_reference,
+    )
+
+
+@app.post("/batch_evaluate")
+def batch_evaluate(file: UploadFile = File(...)) -> StreamingResponse:
+    if not file.filename or not file.filename.lower().endswith(".csv"):
+        raise HTTPException(status_code=400, detail="Please upload a CSV file.")
+
+    try:
+        rule_engine = get_rule_engine(POLICY_PATH)
+        reader = csv.DictReader(io.TextIOWrapper(file.file, encoding="utf-8", newline=""))
+        first_batch = list(itertools.islice(reader, BATCH_SIZE))
+    except UnicodeDecodeError as exc:
+        raise HTTPException(status_code=400, detail="CSV file must be UTF-8 encoded.") from exc
+    except (csv.Error, ValueError, TypeError, FileNotFoundError) as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+    if not first_batch:
+        raise HTTPException(status_code=400, detail="CSV file contains no data rows.")
+
+    return StreamingResponse(
+        _stream_batch_results(reader, first_batch, rule_engine),
+        media_type="application/x-ndjson",
+    )
+
+
+@app.get("/decisions/{decision_id}")
+def decision_record(decision_id: str) -> Dict[str, Any]:
+    record = read_record(decision_id)
+    if record is None:
+        raise HTTPException(status_code=404, detail="Unknown decision id.")
+    return record
+
+
+@app.get("/decisions/{decision_id}/clauses")
+def decision_clauses(decision_id: str, offset: int = 0, limit: int = CLAUSE_PAGE_DEFAULT) -> Dict[str, Any]:
+    """Return one page of the clauses of an audited contract, with their offsets."""
+    if offset < 0:
+        raise HTTPException(status_code=400, detail="offset must be non-negative.")
+    if not 1 <= limit <= CLAUSE_PAGE_MAX:
+        raise HTTPException(status_code=400, detail=f"limit must be between 1 and {CLAUSE_PAGE_MAX}.")
+
+    document_text, clause_index = _audited_clauses(decision_id)
+    return {
+        "decision_id": decision_id,
+        "total": len(clause_index),
+        "offset": offset,
+        "limit": limit,
+        "clauses": clause_index.page(document_text, offset, limit),
+    }
+
+
+@app.get("/analytics/decisions")
+def analytics_decisions(
+    start: str | None = None,
+    end: str | None = None,
+    bucket: str = BUCKET_DAY,
+) -> Dict[str, Any]:
+    start_time, end_time = _analytics_range(start, end)
+    try:
+        counts = decision_counts(start_time, end_time, bucket=bucket)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    return {"start": start_time.isoformat(), "end": end_time.isoformat(), "bucket": bucket, "counts": counts}
+
+
+@app.get("/analytics/latency")
+def analytics_latency(
+    start: str | None = None,
+    end: str | None = None,
+    bucket: str = BUCKET_WEEK,
+) -> Dict[str, Any]:
+    start_time, end_time = _analytics_range(start, end)
+    try:
+        latency = latency_percentiles(start_time, end_time, bucket=bucket)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    return {"start": start_time.isoformat(), "end": end_time.isoformat(), "bucket": bucket, "latency": latency}
+
+
+@app.get("/explanations/{job_id}")
+def explanation_status(job_id: str) -> Dict[str, Any]:
+    job = get_explanation_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Unknown explanation job id.")
+    return job
+
+
+@app.get("/explanations/{job_id}/stream")
+async def explanation_stream(job_id: str) -> StreamingResponse:
+    future = get_explanation_future(job_id)
+    if future is None:
+        raise HTTPException(status_code=404, detail="Unknown explanation job id.")
+
+    async def events() -> AsyncIterator[str]:
+        yield _sse_event("status", job_payload(job_id, future))
+        waiter = asyncio.wrap_future(future)
+        while not future.done():
+            try:
+                await asyncio.wait_for(asyncio.shield(waiter), SSE_KEEPALIVE_SECONDS)
+            except asyncio.TimeoutError:
+                yield ": keep-alive\n\n"
+        yield _sse_event("explanation", job_payload(job_id, future))
+
+    return StreamingResponse(events(), media_type="text/event-stream")
+
+
+@app.get("/metrics")
+def metrics() -> Dict[str, Any]:
+    from explainable_ai.core.metrics.metrics import get_metrics
+
+    return {
+        **get_metrics(),
+        "explanation_cache": get_explanation_cache_stats(),
+        "result_cache": get_result_cache_stats(),
+        "revision_store": get_revision_store_stats(),
+    }
+
+
+@app.get("/metrics/prometheus", response_class=PlainTextResponse)
+def metrics_prometheus() -> PlainTextResponse:
+    return PlainTextResponse(get_prometheus_metrics(), media_type="text/plain; version=0.0.4")
+
+
+def _evaluate_document(
+    document_text: str,
+    enable_ai_explanation: bool,
+    explanation_mode: str,
+    start: float,
+    endpoint: str,
+    timer: StageTimer = NULL_STAGE_TIMER,
+    report_timings: bool = False,
+    previous_document_text: str | None = None,
+    previous_decision_id: str | None = None,
+    track_revision: bool = False,
+    include: FrozenSet[str] | None = None,
+    document_reference: bool = False,
+) -> Dict[str, Any]:
     applicant_data: Dict[str, Any] = {"document_text": document_text}
+    if previous_decision_id is not None:
+        applicant_data["previous_decision_id"] = previous_decision_id
+    explain_in_background = enable_ai_explanation and explanation_mode == EXPLANATION_MODE_ASYNC
 
     try:
         result = evaluate_contract(
             document_text=document_text,
-            enable_ai=enable_ai_explanation,
+            enable_ai=enable_ai_explanation and not explain_in_background,
+            timer=timer,
+            previous_document_text=previous_document_text,
+            track_revision=track_revision,
         )
     except (FileNotFoundError, ValueError, TypeError) as exc:
         logger.error(f"Evaluation error: {str(exc)}", exc_info=True)
         raise HTTPException(status_code=400, detail=str(exc)) from exc
 
-    risk_scan = _extract_risk_scan_from_trace(result["trace"])
+    explanation_job_id = (
+        submit_explanation(result["trace"].to_list(), result["decision"], result["policy_digest"])
+        if explain_in_background
+        else None
+    )
+
+    # The hard gate is recorded among the steps appended after the rule steps.
+    risk_scan = _extract_risk_scan_from_trace(result["trace"].extra_steps)
 
     latency_ms = (time.perf_counter() - start) * 1000.0
     decision_id = str(uuid.uuid4())
+    stage_timings_ms = timer.rounded() if report_timings and timer.enabled else None
 
     log_decision(
         decision_id=decision_id,
@@ -75,125 +473,325 @@ def evaluate(request_data: Dict[str, Any]) -> Dict[str, Any]:
         governance_decision=result["decision"],
         confidence_vector=result["confidence_vector"],
         latency_ms=latency_ms,
+        policy_digest=result["policy_digest"],
+        stage_timings_ms=stage_timings_ms,
+        cache_hit=result["cache_hit"],
     )
-    record_decision(result["decision"], latency_ms)
+    record_decision(result["decision"], latency_ms, endpoint=endpoint)
+    record_stage_timings(timer.timings_ms)
 
     logger.info(f"Decision computed: {result['decision']} | decision_id={decision_id}")
 
-    return {
+    # The trace is expanded only when it is part of the response.
+    trace = None
+    if include is None or "trace" in include:
+        trace = result["trace"].to_list(document_reference=document_reference)
+
+    response: Dict[str, Any] = {
         "decision_id": decision_id,
         "decision": result["decision"],
         "deterministic_label": result["deterministic_label"],
         "confidence_vector": result["confidence_vector"],
-        "trace": result["trace"],
+        "trace": trace,
         "risk_keywords_found": risk_scan["risk_keywords_found"],
         "risk_flag_count": risk_scan["risk_flag_count"],
         "ai_explanation": result["ai_explanation"],
+        "explanation_job_id": explanation_job_id,
+        "policy_digest": result["policy_digest"],
+        "cache_hit": result["cache_hit"],
         "latency_ms": round(latency_ms, 3),
     }
+    if previous_document_text is not None:
+        response["reused_clauses"] = result["reused_clauses"]
+    if stage_timings_ms is not None:
+        response["stage_timings_ms"] = stage_timings_ms
+    if include is not None:
+        response = {
+            field: value
+            for field, value in response.items()
+            if field in include or field in ALWAYS_INCLUDED_FIELDS
+        }
+    return response
 
 
-@app.post("/batch_evaluate")
-async def batch_evaluate(file: UploadFile = File(...)) -> Dict[str, Any]:
-    if not file.filename or not file.filename.lower().endswith(".csv"):
-        raise HTTPException(status_code=400, detail="Please upload a CSV file.")
-
-    try:
-        contents = await file.read()
-        text = contents.decode("utf-8")
-        reader = csv.DictReader(io.StringIO(text))
+def _response_options(include: Any, trace_document: Any) -> Tuple[FrozenSet[str] | None, bool]:
+    """Validate the ``include`` projection and ``trace_document`` mode of an evaluation request.
 
-        rule_engine = RuleEngine(POLICY_PATH)
-        rows = [dict(row) for row in reader]
+    ``include`` is a comma-separated string or a list of field names; an
+    empty value returns every field.
+    """
+    if trace_document not in TRACE_DOCUMENT_MODES:
+        raise HTTPException(
+            status_code=400,
+            detail="trace_document must be 'inline' or 'hash'.",
+        )
 
-        if not rows:
-            raise HTTPException(status_code=400, detail="CSV file contains no data rows.")
+    if include is None or include == "":
+        return None, trace_document == TRACE_DOCUMENT_HASH
 
-        approved = 0
-        review_required = 0
-        escalate = 0
-        confidence_sum = 0.0
+    if isinstance(include, str):
+        fields = [field.strip() for field in include.split(",") if field.strip()]
+    elif isinstance(include, list) and all(isinstance(field, str) for field in include):
+        fields = include
+    else:
+        raise HTTPException(
+            status_code=400,
+            detail="include must be a comma-separated string or a list of field names.",
+        )
 
-        for row in rows:
-            applicant_data = _coerce_row_values(row)
-            result = _evaluate_applicant(applicant_data, rule_engine)
+    unknown = sorted(set(fields) - set(RESPONSE_FIELDS) - set(ALWAYS_INCLUDED_FIELDS))
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown include fields: {', '.join(unknown)}.")
+    return frozenset(fields), trace_document == TRACE_DOCUMENT_HASH
+
+
+def _audited_clauses(decision_id: str) -> Tuple[str, ClauseIndex]:
+    """Return the document text and clause index of an audited contract decision.
+
+    Audit records never change, so both are cached by decision id and paging
+    through a contract reads and segments it only once.
+    """
+    cached = _CLAUSE_INDEXES.get(decision_id)
+    if cached is None:
+        document_text = _audited_document_text(decision_id)
+        cached = (document_text, segment_clauses(document_text))
+        _CLAUSE_INDEXES.put(decision_id, cached)
+    return cached
+
+
+def _audited_document_text(decision_id: str) -> str:
+    """Return the document text recorded for an audited contract decision."""
+    record = read_record(decision_id)
+    if record is None:
+        raise HTTPException(status_code=404, detail="Unknown decision id.")
+
+    input_data = record.get("input_data")
+    document_text = input_data.get("document_text") if isinstance(input_data, dict) else None
+    if not isinstance(document_text, str):
+        raise HTTPException(status_code=400, detail="Decision has no recorded document text.")
+    return document_text
+
+
+def _stream_batch_results(
+    reader: Iterator[Dict[str, Any]],
+    first_batch: List[Dict[str, Any]],
+    rule_engine: RuleEngine,
+) -> Iterator[str]:
+    """Evaluate CSV rows in bounded batches, yielding one NDJSON line per row.
+
+    Only one batch of rows is held in memory at a time. The summary record is
+    always the last line; a CSV decoding failure ends the stream with an
+    error record instead.
+    """
+    counts = {"APPROVED": 0, "REVIEW_REQUIRED": 0, "ESCALATE": 0}
+    total = 0
+    errors = 0
+    confidence_sum = 0.0
+    batch = first_batch
+
+    while batch:
+        lines: List[str] = []
+        timers = [StageTimer() for _ in batch]
+        outcomes = _evaluate_applicants([_coerce_row_values(row) for row in batch], rule_engine, timers)
+        for result, timer in zip(outcomes, timers):
+            total += 1
+            if isinstance(result, str):
+                errors += 1
+                lines.append(_ndjson_line({"type": "error", "row": total, "detail": result}))
+                continue
 
             decision = result["decision"]
-            if decision == "APPROVED":
-                approved += 1
-            elif decision == "REVIEW_REQUIRED":
-                review_required += 1
-            elif decision == "ESCALATE":
-                escalate += 1
-
+            if decision in counts:
+                counts[decision] += 1
             confidence_sum += float(result["confidence_vector"]["rule_confidence"])
 
-        total = len(rows)
-        average_rule_confidence = confidence_sum / total if total else 0.0
-
-        return {
+            record: Dict[str, Any] = {
+                "type": "decision",
+                "row": total,
+                "decision": decision,
+                "deterministic_label": result["deterministic_label"],
+                "eligibility_score": result["eligibility_score"],
+                "failed_rules": result["failed_rules"],
+                "confidence_vector": result["confidence_vector"],
+            }
+            record_stage_timings(timer.timings_ms)
+            if STAGE_TIMING_ENABLED:
+                record["stage_timings_ms"] = timer.rounded()
+            lines.append(_ndjson_line(record))
+        yield "".join(lines)
+
+        try:
+            batch = list(itertools.islice(reader, BATCH_SIZE))
+        except (UnicodeDecodeError, csv.Error) as exc:
+            detail = (
+                "CSV file must be UTF-8 encoded."
+                if isinstance(exc, UnicodeDecodeError)
+                else str(exc)
+            )
+            yield _ndjson_line({"type": "error", "row": total + 1, "detail": detail})
+            return
+
+    evaluated = total - errors
+    average_rule_confidence = confidence_sum / evaluated if evaluated else 0.0
+
+    yield _ndjson_line(
+        {
+            "type": "summary",
             "total": total,
-            "approved": approved,
-            "review_required": review_required,
-            "escalate": escalate,
+            "approved": counts["APPROVED"],
+            "review_required": counts["REVIEW_REQUIRED"],
+            "escalate": counts["ESCALATE"],
+            "errors": errors,
             "average_rule_confidence": round(average_rule_confidence, 3),
+            "policy_digest": rule_engine.policy_digest,
         }
-    except UnicodeDecodeError as exc:
-        raise HTTPException(status_code=400, detail="CSV file must be UTF-8 encoded.") from exc
-    except (ValueError, TypeError, FileNotFoundError) as exc:
-        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    )
 
 
-@app.get("/metrics")
-def metrics() -> Dict[str, Any]:
-    from explainable_ai.core.metrics.metrics import get_metrics
+def _analytics_range(start: str | None, end: str | None) -> Tuple[datetime, datetime]:
+    """Parse an ISO-8601 UTC range, defaulting to the last ``ANALYTICS_DEFAULT_DAYS`` days."""
+    try:
+        end_time = datetime.fromisoformat(end) if end else datetime.utcnow()
+        start_time = (
+            datetime.fromisoformat(start)
+            if start
+            else end_time - timedelta(days=ANALYTICS_DEFAULT_DAYS)
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail="start and end must be ISO-8601 timestamps.") from exc
+
+    if start_time.tzinfo is not None or end_time.tzinfo is not None:
+        raise HTTPException(status_code=400, detail="start and end must be naive UTC timestamps.")
+    if start_time >= end_time:
+        raise HTTPException(status_code=400, detail="start must be before end.")
+    return start_time, end_time
+
+
+def _sse_event(event: str, payload: Dict[str, Any]) -> str:
+    return f"event: {event}\ndata: {json.dumps(payload, ensure_ascii=True)}\n\n"
+
+
+def _ndjson_line(record: Dict[str, Any]) -> str:
+    return json.dumps(record, ensure_ascii=True, separators=(",", ":")) + "\n"
+
+
+def _evaluate_applicants(
+    applicants: List[Any],
+    rule_engine: RuleEngine,
+    timers: List[StageTimer],
+) -> List[Dict[str, Any] | str]:
+    """Evaluate a batch of applicants, returning a result or an error detail per applicant.
+
+    Rules are evaluated into one document-by-rule hit matrix; scores,
+    labels, confidence vectors and governance actions for the whole batch
+    are computed with vectorised operations. Stages are timed once per
+    batch and amortised over its rows.
+    """
+    outcomes: List[Dict[str, Any] | str] = [""] * len(applicants)
+    positions: List[int] = []
+    documents: List[str] = []
+    retrieval_similarity: List[float] = []
+    data_completeness: List[float] = []
+    crag_blocked: List[bool] = []
+
+    for position, applicant_data in enumerate(applicants):
+        try:
+            document_text = _applicant_document_text(applicant_data)
+            if isinstance(applicant_data, dict):
+                similarity = float(applicant_data.get("retrieval_similarity", 1.0))
+                completeness = float(applicant_data.get("data_completeness", 1.0))
+                blocked = bool(applicant_data.get("crag_blocked", False))
+            else:
+                similarity, completeness, blocked = 1.0, 1.0, False
+        except (ValueError, TypeError) as exc:
+            outcomes[position] = str(exc)
+            continue
 
-    return get_metrics()
+        positions.append(position)
+        documents.append(document_text)
+        retrieval_similarity.append(similarity)
+        data_completeness.append(completeness)
+        crag_blocked.append(blocked)
+
+    if not documents:
+        return outcomes
+
+    batch_timer = StageTimer(enabled=any(timer.enabled for timer in timers))
+    with batch_timer.stage("rule_evaluate"):
+        matrix = rule_engine.evaluate_many(documents)
+        hits = matrix.hits()
+        scores = matrix.scores()
+        label_codes = deterministic_label_codes(scores)
+    failed_counts = hits.sum(axis=1)
+    rule_count = len(matrix.rule_ids)
+
+    # Rows with out-of-range inputs are reported individually, with the scalar error message.
+    invalid = invalid_confidence_rows(retrieval_similarity, data_completeness)
+    valid = np.flatnonzero(~invalid)
+    for index in np.flatnonzero(invalid):
+        try:
+            calculate_confidence_vector(
+                passed_rules=matrix.passed_rules(index),
+                failed_rules=matrix.failed_rules(index),
+                total_rules=rule_count,
+                retrieval_similarity=retrieval_similarity[index],
+                data_completeness=data_completeness[index],
+            )
+        except (ValueError, TypeError) as exc:
+            outcomes[positions[index]] = str(exc)
+
+    if not len(valid):
+        return outcomes
 
+    try:
+        with batch_timer.stage("confidence_vector"):
+            confidence = calculate_confidence_vectors(
+                passed_counts=rule_count - failed_counts[valid],
+                failed_counts=failed_counts[valid],
+                total_rules=rule_count,
+                retrieval_similarity=np.asarray(retrieval_similarity)[valid],
+                data_completeness=np.asarray(data_completeness)[valid],
+            )
+        with batch_timer.stage("governance"):
+            decisions = apply_governance_layers(
+                deterministic_labels=label_codes[valid],
+                rule_confidence=confidence["rule_confidence"],
+                crag_blocked=np.asarray(crag_blocked, dtype=bool)[valid],
+            )
+    except (ValueError, TypeError) as exc:
+        for index in valid:
+            outcomes[positions[index]] = str(exc)
+        return outcomes
+
+    columns = {name: column.tolist() for name, column in confidence.items()}
+    amortised_ms = {name: value / len(valid) for name, value in batch_timer.timings_ms.items()}
+    rule_ids = matrix.rule_ids
+    for row, index in enumerate(valid.tolist()):
+        outcomes[positions[index]] = {
+            "decision": str(decisions[row]),
+            "deterministic_label": RISK_LABELS[label_codes[index]],
+            "eligibility_score": int(scores[index]),
+            "failed_rules": [rule_ids[column] for column in np.flatnonzero(hits[index])],
+            "confidence_vector": {name: column[row] for name, column in columns.items()},
+            "policy_digest": matrix.policy_digest,
+        }
+        timer = timers[positions[index]]
+        if timer.enabled:
+            timer.timings_ms.update(amortised_ms)
 
-def _evaluate_applicant(applicant_data: Any, rule_engine: RuleEngine) -> Dict[str, Any]:
-    rule_result = rule_engine.evaluate(applicant_data)
+    return outcomes
 
+
+def _applicant_document_text(applicant_data: Any) -> str:
     if isinstance(applicant_data, dict):
-        retrieval_similarity = float(applicant_data.get("retrieval_similarity", 1.0))
-        data_completeness = float(applicant_data.get("data_completeness", 1.0))
-        crag_blocked = bool(applicant_data.get("crag_blocked", False))
-        trace_input_data: Dict[str, Any] = applicant_data
+        document_text = applicant_data.get("document_text")
+        document_text = "" if document_text is None else str(document_text)
     else:
-        retrieval_similarity = 1.0
-        data_completeness = 1.0
-        crag_blocked = False
-        trace_input_data = {"document_text": str(applicant_data)}
-
-    confidence_vector = calculate_confidence_vector(
-        passed_rules=rule_result["passed_rules"],
-        failed_rules=rule_result["failed_rules"],
-        total_rules=len(rule_engine.rules),
-        retrieval_similarity=retrieval_similarity,
-        data_completeness=data_completeness,
-    )
+        document_text = str(applicant_data)
 
-    governance_decision = apply_governance_layer(
-        deterministic_label=rule_result["deterministic_label"],
-        confidence_vector=confidence_vector,
-        crag_blocked=crag_blocked,
-    )
-
-    trace = generate_decision_trace(
-        input_data=trace_input_data,
-        passed_rules=rule_result["passed_rules"],
-        failed_rules=rule_result["failed_rules"],
-        eligibility_score=rule_result["eligibility_score"],
-        confidence_vector=confidence_vector,
-        governance_decision=governance_decision,
-    )
-
-    return {
-        "decision": governance_decision,
-        "deterministic_label": rule_result["deterministic_label"],
-        "confidence_vector": confidence_vector,
-        "trace": trace,
-    }
+    if not document_text.strip():
+        raise ValueError("document_text must be a non-empty string.")
+    return document_text
 
 
 def _coerce_row_values(row: Dict[str, Any]) -> Dict[str, Any]:
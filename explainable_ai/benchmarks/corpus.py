@@ -0,0 +1,139 @@
+"""Seeded synthetic contract corpus for benchmarks.
+
+Every generator takes a ``random.Random`` so a seed reproduces the same
+policies, documents, CSV uploads and PDFs on any machine.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import random
+import string
+from pathlib import Path
+from typing import List, Sequence
+
+import yaml
+
+
+KEYWORDS_PER_RULE = 5
+# Distinct filler clauses sampled to build large documents quickly.
+CLAUSE_POOL_SIZE = 512
+CLAUSE_WORDS = (6, 24)
+
+
+def random_word(rng: random.Random) -> str:
+    return "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(3, 9)))
+
+
+def random_keywords(rng: random.Random, count: int) -> List[str]:
+    """Return ``count`` distinct one- to three-word keywords, sorted."""
+    keywords = set()
+    while len(keywords) < count:
+        keywords.add(" ".join(random_word(rng) for _ in range(rng.randint(1, 3))))
+    return sorted(keywords)
+
+
+def random_document(rng: random.Random, size: int) -> str:
+    """Return ``size`` characters of space-separated random words."""
+    words: List[str] = []
+    length = 0
+    while length < size:
+        word = random_word(rng)
+        words.append(word)
+        length += len(word) + 1
+    return " ".join(words)[:size]
+
+
+def policy_keywords(rng: random.Random, rule_count: int) -> List[str]:
+    """Return the keywords for a policy of ``rule_count`` rules."""
+    return random_keywords(rng, rule_count * KEYWORDS_PER_RULE)
+
+
+def write_policy(path: Path, keywords: Sequence[str]) -> None:
+    """Write a policy YAML grouping ``keywords`` into rules of ``KEYWORDS_PER_RULE``."""
+    rules = [
+        {
+            "id": f"rule_{index // KEYWORDS_PER_RULE}",
+            "keywords": list(keywords[index : index + KEYWORDS_PER_RULE]),
+            "weight": 5,
+        }
+        for index in range(0, len(keywords), KEYWORDS_PER_RULE)
+    ]
+    with path.open("w", encoding="utf-8") as file:
+        yaml.safe_dump({"rules": rules}, file)
+
+
+def generate_contract(
+    rng: random.Random,
+    size: int,
+    keywords: Sequence[str] = (),
+    keyword_density: float = 0.0,
+) -> str:
+    """Return a contract of about ``size`` characters, one clause per line.
+
+    Each clause contains a randomly chosen keyword with probability
+    ``keyword_density``. Clauses are drawn from a fixed pool, so generating
+    100 MB takes seconds rather than minutes.
+    """
+    if not 0.0 <= keyword_density <= 1.0:
+        raise ValueError("keyword_density must be between 0 and 1.")
+
+    pool = [
+        " ".join(random_word(rng) for _ in range(rng.randint(*CLAUSE_WORDS))).capitalize() + "."
+        for _ in range(CLAUSE_POOL_SIZE)
+    ]
+
+    clauses: List[str] = []
+    length = 0
+    while length < size:
+        clause = rng.choice(pool)
+        if keywords and rng.random() < keyword_density:
+            words = clause.split(" ")
+            words.insert(rng.randint(1, len(words)), rng.choice(keywords))
+            clause = " ".join(words)
+        clauses.append(clause)
+        length += len(clause) + 1
+    return "\n".join(clauses)[:size]
+
+
+def generate_batch_csv(
+    rng: random.Random,
+    rows: int,
+    document_size: int,
+    keywords: Sequence[str] = (),
+    keyword_density: float = 0.0,
+) -> bytes:
+    """Return a UTF-8 CSV upload with one ``document_text`` column."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(["document_text"])
+    for _ in range(rows):
+        writer.writerow([generate_contract(rng, document_size, keywords, keyword_density)])
+    return buffer.getvalue().encode("utf-8")
+
+
+def generate_pdf(text: str) -> bytes:
+    """Render ``text`` into a text-extractable PDF, one line per clause."""
+    from reportlab.lib.pagesizes import letter
+    from reportlab.pdfgen import canvas
+
+    buffer = io.BytesIO()
+    pdf = canvas.Canvas(buffer, pagesize=letter)
+    _, height = letter
+    margin = 40
+    line_height = 11
+    y = height - margin
+
+    pdf.setFont("Helvetica", 9)
+    for line in text.splitlines():
+        # Long clauses are wrapped to the page width in fixed-size pieces.
+        for start in range(0, max(1, len(line)), 110):
+            if y < margin:
+                pdf.showPage()
+                pdf.setFont("Helvetica", 9)
+                y = height - margin
+            pdf.drawString(margin, y, line[start : start + 110])
+            y -= line_height
+    pdf.save()
+    return buffer.getvalue()
@@ -0,0 +1,89 @@
+"""Benchmark the keyword matcher's two search strategies as the keyword count grows.
+
+Run from the repository root:
+
+    python -m explainable_ai.benchmarks.keyword_scaling --doc-kb 256
+
+The keyword count where the automaton overtakes per-keyword substring search
+is what ``KEYWORD_AUTOMATON_MIN_KEYWORDS`` is set to.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import tempfile
+import time
+from pathlib import Path
+from typing import List, Sequence
+
+from explainable_ai.benchmarks.corpus import random_document, random_keywords, write_policy
+from explainable_ai.core.engine.keyword_matcher import KEYWORD_AUTOMATON_MIN_KEYWORDS, KeywordMatcher
+from explainable_ai.core.engine.rule_engine import RuleEngine
+
+
+DEFAULT_KEYWORD_COUNTS = (10, 100, 200, 400, 1000, 5000)
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--doc-kb", type=int, default=256, help="Document size in KiB.")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per measurement.")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument(
+        "--keywords",
+        type=int,
+        nargs="+",
+        default=list(DEFAULT_KEYWORD_COUNTS),
+        help="Keyword counts to benchmark.",
+    )
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    document = random_document(rng, args.doc_kb * 1024)
+
+    print(f"document size: {len(document)} chars")
+    print(f"automaton used from {KEYWORD_AUTOMATON_MIN_KEYWORDS} keywords")
+    print(f"{'keywords':>10} {'per-keyword ms':>16} {'automaton ms':>14} {'speedup':>9}")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for keyword_count in args.keywords:
+            keywords = random_keywords(rng, keyword_count)
+            policy_path = Path(tmp_dir) / f"rules_{keyword_count}.yaml"
+            write_policy(policy_path, keywords)
+            engine = RuleEngine(policy_path)
+            if engine.evaluate(document)["failed_rules"] != _naive_evaluate(engine, document):
+                raise AssertionError("RuleEngine result differs from substring semantics.")
+
+            substring_matcher = KeywordMatcher(keywords, use_automaton=False)
+            automaton_matcher = KeywordMatcher(keywords, use_automaton=True)
+            if list(substring_matcher.iter_matches(document)) != list(automaton_matcher.iter_matches(document)):
+                raise AssertionError("Automaton matches differ from substring search.")
+
+            substring_ms = _best_of(args.repeat, lambda: list(substring_matcher.iter_matches(document)))
+            automaton_ms = _best_of(args.repeat, lambda: list(automaton_matcher.iter_matches(document)))
+            speedup = substring_ms / automaton_ms if automaton_ms else float("inf")
+            print(f"{keyword_count:>10} {substring_ms:>16.2f} {automaton_ms:>14.2f} {speedup:>8.2f}x")
+
+
+def _naive_evaluate(engine: RuleEngine, document: str) -> List[str]:
+    """Reference implementation: one substring scan per keyword."""
+    lowered = document.lower()
+    return [
+        rule.id
+        for rule in engine.rules
+        if any(keyword in lowered for keyword in rule.keywords)
+    ]
+
+
+def _best_of(repeat: int, func) -> float:
+    best = float("inf")
+    for _ in range(max(1, repeat)):
+        start = time.perf_counter()
+        func()
+        best = min(best, (time.perf_counter() - start) * 1000.0)
+    return best
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,377 @@
+"""Run the deterministic-path benchmark suite and compare against a baseline.
+
+Run from the repository root:
+
+    python -m explainable_ai.benchmarks.run --profile quick --output bench.json
+    python -m explainable_ai.benchmarks.run --profile quick --baseline bench.json
+
+Results are written as JSON keyed by case name, so two result files can be
+diffed directly. With ``--baseline`` every case whose median slows down by
+more than ``--threshold`` is reported and the exit status is 1.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Sequence
+
+from explainable_ai.benchmarks.corpus import (
+    generate_batch_csv,
+    generate_contract,
+    generate_pdf,
+    policy_keywords,
+    write_policy,
+)
+
+
+KB = 1024
+MB = 1024 * KB
+
+PROFILES: Dict[str, Dict[str, Any]] = {
+    "quick": {
+        "evaluate_sizes": (1 * KB, 64 * KB, 1 * MB),
+        "rule_counts": (5, 50, 500),
+        "densities": (0.0, 0.1),
+        "api_sizes": (1 * KB, 64 * KB),
+        "batch_rows": (100,),
+        "pdf_sizes": (16 * KB, 256 * KB),
+        "report_sizes": (16 * KB,),
+        "repeat": 5,
+    },
+    "full": {
+        "evaluate_sizes": (1 * KB, 1 * MB, 10 * MB, 100 * MB),
+        "rule_counts": (5, 50, 500, 5000),
+        "densities": (0.0, 0.01, 0.1),
+        "api_sizes": (1 * KB, 1 * MB, 10 * MB),
+        "batch_rows": (1000, 10000),
+        "pdf_sizes": (64 * KB, 1 * MB),
+        "report_sizes": (64 * KB, 1 * MB),
+        "repeat": 3,
+    },
+}
+
+BATCH_DOCUMENT_SIZE = 1 * KB
+# Stop repeating a case once its runs have taken this long in total.
+CASE_TIME_BUDGET_SECONDS = 30.0
+DEFAULT_THRESHOLD = 0.2
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="quick")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--repeat", type=int, default=None, help="Timed runs per case.")
+    parser.add_argument("--output", type=Path, default=None, help="Write results JSON here.")
+    parser.add_argument("--baseline", type=Path, default=None, help="Results JSON to compare against.")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Allowed median slowdown before a case counts as a regression (0.2 = 20%%).",
+    )
+    parser.add_argument("--only", nargs="+", default=None, help="Run only these benchmark groups.")
+    args = parser.parse_args(argv)
+
+    profile = dict(PROFILES[args.profile])
+    if args.repeat is not None:
+        profile["repeat"] = args.repeat
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # Keep benchmark decisions out of the real audit trail. The audit
+        # logger reads AUDIT_LOG_DIR when it is first imported, so it is
+        # set before that import and checked afterwards.
+        audit_dir = Path(tmp_dir) / "audit"
+        os.environ["AUDIT_LOG_DIR"] = str(audit_dir)
+        from explainable_ai.core.audit.audit_logger import AUDIT_LOG_DIR
+
+        if AUDIT_LOG_DIR != audit_dir:
+            print(
+                f"audit logger already bound to {AUDIT_LOG_DIR}; run the benchmarks in a fresh process",
+                file=sys.stderr,
+            )
+            return 2
+        results = run_suite(profile, args.seed, Path(tmp_dir), args.only)
+
+    report = {
+        "meta": {
+            "profile": args.profile,
+            "seed": args.seed,
+            "timestamp_utc": datetime.utcnow().isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        },
+        "results": results,
+    }
+
+    if args.output is not None:
+        args.output.write_text(json.dumps(report, indent=2, sort_keys=True), encoding="utf-8")
+        print(f"results written to {args.output}")
+
+    if args.baseline is None:
+        return 0
+
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    regressions = compare(results, baseline.get("results", {}), args.threshold)
+    return 1 if regressions else 0
+
+
+def run_suite(
+    profile: Dict[str, Any],
+    seed: int,
+    work_dir: Path,
+    only: Sequence[str] | None = None,
+) -> Dict[str, Dict[str, Any]]:
+    """Run every benchmark group in ``profile`` and return results by case name."""
+    groups: Dict[str, Callable[[Dict[str, Any], random.Random, Path], Dict[str, Dict[str, Any]]]] = {
+        "rule_engine": _bench_rule_engine,
+        "evaluate_contract": _bench_evaluate_contract,
+        "api_evaluate": _bench_api_evaluate,
+        "api_batch_evaluate": _bench_api_batch_evaluate,
+        "extract_pdf_text": _bench_extract_pdf_text,
+        "pdf_report": _bench_pdf_report,
+    }
+
+    results: Dict[str, Dict[str, Any]] = {}
+    for name, bench in groups.items():
+        if only and name not in only:
+            continue
+        # Each group gets its own stream so skipping one does not shift the rest.
+        results.update(bench(profile, random.Random(f"{seed}:{name}"), work_dir))
+    return results
+
+
+def compare(
+    results: Dict[str, Dict[str, Any]],
+    baseline: Dict[str, Dict[str, Any]],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> List[str]:
+    """Print a comparison table and return the names of regressed cases.
+
+    Baseline cases that were not run this time are ignored.
+    """
+    regressions: List[str] = []
+    print(f"{'case':<64} {'baseline ms':>12} {'current ms':>12} {'change':>8}")
+    for name in sorted(results):
+        current = results[name]["median_ms"]
+        previous = baseline.get(name, {}).get("median_ms")
+        if not previous:
+            print(f"{name:<64} {'-':>12} {current:>12.3f} {'new':>8}")
+            continue
+
+        change = current / previous - 1.0
+        marker = ""
+        if change > threshold:
+            regressions.append(name)
+            marker = "  REGRESSION"
+        print(f"{name:<64} {previous:>12.3f} {current:>12.3f} {change:>+7.1%}{marker}")
+    return regressions
+
+
+def _bench_rule_engine(profile: Dict[str, Any], rng: random.Random, work_dir: Path) -> Dict[str, Dict[str, Any]]:
+    from explainable_ai.core.engine.rule_engine import RuleEngine
+
+    results: Dict[str, Dict[str, Any]] = {}
+    for rule_count in profile["rule_counts"]:
+        keywords = policy_keywords(rng, rule_count)
+        policy_path = work_dir / f"rules_{rule_count}.yaml"
+        write_policy(policy_path, keywords)
+        engine = RuleEngine(policy_path)
+
+        for size in profile["evaluate_sizes"]:
+            for density in profile["densities"]:
+                document = generate_contract(rng, size, keywords, density)
+                params = {"size": size, "rules": rule_count, "density": density}
+                results.update(
+                    _case("rule_engine.evaluate", params, profile["repeat"], lambda: engine.evaluate(document), size)
+                )
+    return results
+
+
+def _bench_evaluate_contract(
+    profile: Dict[str, Any],
+    rng: random.Random,
+    work_dir: Path,
+) -> Dict[str, Dict[str, Any]]:
+    from explainable_ai.core.engine.main import evaluate_contract
+    from explainable_ai.core.engine.result_cache import clear_result_cache
+
+    keywords = _production_keywords()
+    results: Dict[str, Dict[str, Any]] = {}
+    for size in profile["evaluate_sizes"]:
+        for density in profile["densities"]:
+            document = generate_contract(rng, size, keywords, density)
+            params = {"size": size, "density": density}
+
+            def cold() -> None:
+                clear_result_cache()
+                evaluate_contract(document)
+
+            results.update(_case("evaluate_contract", params, profile["repeat"], cold, size))
+            results.update(
+                _case("evaluate_contract.cached", params, profile["repeat"], lambda: evaluate_contract(document), size)
+            )
+    return results
+
+
+def _bench_api_evaluate(profile: Dict[str, Any], rng: random.Random, work_dir: Path) -> Dict[str, Dict[str, Any]]:
+    from fastapi.testclient import TestClient
+
+    from explainable_ai.api.routes import app
+    from explainable_ai.core.engine.result_cache import clear_result_cache
+
+    keywords = _production_keywords()
+    results: Dict[str, Dict[str, Any]] = {}
+    with TestClient(app) as client:
+        for size in profile["api_sizes"]:
+            payload = {"document_text": generate_contract(rng, size, keywords, 0.1)}
+
+            def request() -> None:
+                clear_result_cache()
+                response = client.post("/evaluate", json=payload)
+                response.raise_for_status()
+
+            results.update(_case("api./evaluate", {"size": size}, profile["repeat"], request, size))
+    return results
+
+
+def _bench_api_batch_evaluate(
+    profile: Dict[str, Any],
+    rng: random.Random,
+    work_dir: Path,
+) -> Dict[str, Dict[str, Any]]:
+    from fastapi.testclient import TestClient
+
+    from explainable_ai.api.routes import app
+
+    keywords = _production_keywords()
+    results: Dict[str, Dict[str, Any]] = {}
+    with TestClient(app) as client:
+        for rows in profile["batch_rows"]:
+            upload = generate_batch_csv(rng, rows, BATCH_DOCUMENT_SIZE, keywords, 0.1)
+
+            def request() -> None:
+                response = client.post(
+                    "/batch_evaluate",
+                    files={"file": ("batch.csv", upload, "text/csv")},
+                )
+                response.raise_for_status()
+
+            results.update(
+                _case("api./batch_evaluate", {"rows": rows}, profile["repeat"], request, len(upload))
+            )
+    return results
+
+
+def _bench_extract_pdf_text(
+    profile: Dict[str, Any],
+    rng: random.Random,
+    work_dir: Path,
+) -> Dict[str, Dict[str, Any]]:
+    from explainable_ai.core.ingestion.pdf_text import clear_pdf_text_cache, extract_pdf_text
+
+    results: Dict[str, Dict[str, Any]] = {}
+    for size in profile["pdf_sizes"]:
+        pdf_bytes = generate_pdf(generate_contract(rng, size))
+
+        def cold() -> None:
+            clear_pdf_text_cache()
+            extract_pdf_text(pdf_bytes)
+
+        params = {"size": size, "pdf_bytes": len(pdf_bytes)}
+        results.update(_case("extract_pdf_text.cold", params, profile["repeat"], cold, len(pdf_bytes)))
+        results.update(
+            _case("extract_pdf_text.cached", params, profile["repeat"], lambda: extract_pdf_text(pdf_bytes), len(pdf_bytes))
+        )
+    return results
+
+
+def _bench_pdf_report(profile: Dict[str, Any], rng: random.Random, work_dir: Path) -> Dict[str, Dict[str, Any]]:
+    from explainable_ai.core.engine.main import POLICY_PATH
+    from explainable_ai.core.engine.policy_registry import get_rule_engine
+    from explainable_ai.core.reporting.pdf_report import generate_pdf_report, get_pdf_report
+
+    engine = get_rule_engine(POLICY_PATH)
+    keywords = _production_keywords()
+    results: Dict[str, Dict[str, Any]] = {}
+    for size in profile["report_sizes"]:
+        document = generate_contract(rng, size, keywords, 0.1)
+        scan = engine.scan(document)
+        rule_result = engine.evaluate(document, scan=scan)
+
+        report_args = {
+            "rule_result": rule_result,
+            "governance_action": "REVIEW_REQUIRED",
+            "confidence_vector": {},
+            "document_text": document,
+            "scan": scan,
+            "rules": engine.rules,
+        }
+
+        def render() -> None:
+            generate_pdf_report(**report_args)
+
+        def cached() -> None:
+            get_pdf_report(**report_args)
+
+        results.update(_case("generate_pdf_report", {"size": size}, profile["repeat"], render, size))
+        cached()
+        results.update(_case("generate_pdf_report.cached", {"size": size}, profile["repeat"], cached, size))
+    return results
+
+
+def _production_keywords() -> List[str]:
+    from explainable_ai.core.engine.main import POLICY_PATH
+    from explainable_ai.core.engine.policy_registry import get_rule_engine
+
+    engine = get_rule_engine(POLICY_PATH)
+    return sorted({keyword for rule in engine.rules for keyword in rule.keywords})
+
+
+def _case(
+    name: str,
+    params: Dict[str, Any],
+    repeat: int,
+    func: Callable[[], Any],
+    input_bytes: int,
+) -> Dict[str, Dict[str, Any]]:
+    """Time ``func`` after one warm-up call and return its result entry."""
+    func()
+
+    timings: List[float] = []
+    spent = 0.0
+    for _ in range(max(1, repeat)):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        timings.append(elapsed * 1000.0)
+        spent += elapsed
+        if spent >= CASE_TIME_BUDGET_SECONDS:
+            break
+
+    median_ms = statistics.median(timings)
+    key = f"{name}[{','.join(f'{k}={v}' for k, v in params.items())}]"
+    entry = {
+        "params": params,
+        "runs": len(timings),
+        "min_ms": round(min(timings), 4),
+        "median_ms": round(median_ms, 4),
+        "max_ms": round(max(timings), 4),
+        "throughput_mb_s": round((input_bytes / MB) / (median_ms / 1000.0), 3) if median_ms else None,
+    }
+    print(f"{key:<64} {entry['median_ms']:>12.3f} ms  ({entry['runs']} runs)", flush=True)
+    return {key: entry}
+
+
+if __name__ == "__main__":
+    sys.exit(main())
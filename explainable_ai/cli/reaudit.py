@@ -0,0 +1,258 @@
+"""Re-audit a directory of stored contracts on every CPU core.
+
+Run from the repository root:
+
+    python -m explainable_ai.cli.reaudit contracts/ --output reaudit-results
+
+Every ``.txt`` and ``.pdf`` file under the input directory is evaluated with
+the deterministic pipeline by a pool of worker processes, each compiling the
+policy once. Workers pull small chunks of files from a shared queue, so a
+worker that finishes early takes over the remaining work instead of idling.
+
+Results are appended to sharded JSONL files in the output directory, and the
+SHA-256 of every finished document is appended to a checkpoint file after its
+result is on disk. Rerunning with the same output directory skips documents
+already in the checkpoint, so an interrupted run resumes where it stopped; a
+document finished in the last moments before a crash may appear twice.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import signal
+import sys
+import time
+from multiprocessing import Pool
+from pathlib import Path
+from typing import IO, Any, Dict, FrozenSet, List, Sequence, Set, TextIO
+
+from PyPDF2.errors import PyPdfError
+
+from explainable_ai.core.engine.main import POLICY_PATH, evaluate_contract
+from explainable_ai.core.engine.policy_registry import get_rule_engine
+from explainable_ai.core.ingestion.pdf_text import extract_pdf_text
+
+
+DOCUMENT_SUFFIXES = (".txt", ".pdf")
+CHECKPOINT_FILE_NAME = "checkpoint.txt"
+SHARD_FILE_PATTERN = "results-{:05d}.jsonl"
+DEFAULT_SHARDS = 8
+# Files handed to a worker at a time; small chunks keep the load balanced.
+TASK_CHUNK_SIZE = 4
+# How often results and the checkpoint are flushed and progress is reported.
+FLUSH_INTERVAL_SECONDS = 2.0
+
+# Document hashes already finished by earlier runs, set in each worker.
+_COMPLETED: FrozenSet[str] = frozenset()
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("input_dir", type=Path, help="Directory of .txt and .pdf contracts.")
+    parser.add_argument("--output", type=Path, default=Path("reaudit-results"), help="Results directory.")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Worker processes.")
+    parser.add_argument("--shards", type=int, default=DEFAULT_SHARDS, help="Number of JSONL result files.")
+    args = parser.parse_args(argv)
+
+    if not args.input_dir.is_dir():
+        parser.error(f"input directory not found: {args.input_dir}")
+    if args.workers < 1 or args.shards < 1:
+        parser.error("--workers and --shards must be at least 1.")
+
+    args.output.mkdir(parents=True, exist_ok=True)
+    paths = discover_documents(args.input_dir)
+    completed = load_checkpoint(args.output / CHECKPOINT_FILE_NAME)
+    print(
+        f"{len(paths)} documents found, {len(completed)} already checkpointed; "
+        f"{args.workers} workers",
+        file=sys.stderr,
+    )
+
+    progress = _Progress(total=len(paths))
+    try:
+        reaudit(paths, args.input_dir, args.output, args.workers, args.shards, completed, progress)
+    except KeyboardInterrupt:
+        print(f"\ninterrupted; rerun to resume. {progress.summary()}", file=sys.stderr)
+        return 130
+
+    print(progress.summary())
+    return 0
+
+
+def discover_documents(root: Path) -> List[Path]:
+    """Return every contract file under ``root`` in a stable order."""
+    return sorted(
+        path
+        for path in root.rglob("*")
+        if path.suffix.lower() in DOCUMENT_SUFFIXES and path.is_file()
+    )
+
+
+def load_checkpoint(path: Path) -> Set[str]:
+    """Return the document hashes recorded by earlier runs."""
+    try:
+        with path.open("r", encoding="utf-8") as file:
+            return {line.strip() for line in file if line.strip()}
+    except FileNotFoundError:
+        return set()
+
+
+def reaudit(
+    paths: Sequence[Path],
+    input_dir: Path,
+    output_dir: Path,
+    workers: int,
+    shards: int,
+    completed: Set[str],
+    progress: "_Progress",
+) -> None:
+    """Evaluate ``paths`` on a process pool, writing sharded results and the checkpoint."""
+    shard_files: Dict[int, TextIO] = {}
+    pending_hashes: List[str] = []
+    last_flush = time.monotonic()
+
+    with (output_dir / CHECKPOINT_FILE_NAME).open("a", encoding="utf-8") as checkpoint:
+        try:
+            with Pool(workers, initializer=_init_worker, initargs=(frozenset(completed),)) as pool:
+                records = pool.imap_unordered(
+                    _evaluate_file,
+                    [str(path) for path in paths],
+                    chunksize=TASK_CHUNK_SIZE,
+                )
+                for record in records:
+                    progress.update(record)
+                    if record.get("skipped"):
+                        continue
+
+                    record["path"] = str(Path(record["path"]).relative_to(input_dir))
+                    shard = _shard_of(record, shards)
+                    if shard not in shard_files:
+                        path = output_dir / SHARD_FILE_PATTERN.format(shard)
+                        shard_files[shard] = path.open("a", encoding="utf-8")
+                    shard_files[shard].write(json.dumps(record, ensure_ascii=True, separators=(",", ":")) + "\n")
+
+                    # Files that could not be read have no hash and are retried by
+                    # the next run. Documents that failed to parse are checkpointed
+                    # with their error record, since the same bytes fail the same way.
+                    if "document_sha256" in record:
+                        pending_hashes.append(record["document_sha256"])
+
+                    if time.monotonic() - last_flush >= FLUSH_INTERVAL_SECONDS:
+                        _flush(shard_files.values(), checkpoint, pending_hashes)
+                        print(progress.report(), file=sys.stderr)
+                        last_flush = time.monotonic()
+        finally:
+            _flush(shard_files.values(), checkpoint, pending_hashes)
+            for file in shard_files.values():
+                file.close()
+
+
+def _init_worker(completed: FrozenSet[str]) -> None:
+    global _COMPLETED
+    # The parent handles Ctrl-C and tears the pool down.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    _COMPLETED = completed
+    get_rule_engine(POLICY_PATH)
+
+
+def _evaluate_file(path: str) -> Dict[str, Any]:
+    try:
+        data = Path(path).read_bytes()
+    except OSError as exc:
+        return {"path": path, "error": str(exc)}
+
+    digest = hashlib.sha256(data).hexdigest()
+    if digest in _COMPLETED:
+        return {"path": path, "document_sha256": digest, "skipped": True}
+
+    try:
+        if path.lower().endswith(".pdf"):
+            # Extract in this worker; the pool already uses every core.
+            document_text = extract_pdf_text(data, max_workers=1)
+        else:
+            document_text = data.decode("utf-8")
+        result = evaluate_contract(document_text)
+    except (PyPdfError, UnicodeDecodeError, ValueError, TypeError) as exc:
+        return {"path": path, "document_sha256": digest, "error": str(exc)}
+
+    risk_keywords: List[str] = []
+    for step in result["trace"].extra_steps:
+        if step.get("step") == "Keyword Hard Gate":
+            risk_keywords = [str(keyword) for keyword in step.get("value", [])]
+
+    return {
+        "path": path,
+        "document_sha256": digest,
+        "decision": result["decision"],
+        "deterministic_label": result["deterministic_label"],
+        "confidence_vector": result["confidence_vector"],
+        "risk_keywords_found": risk_keywords,
+        "policy_digest": result["policy_digest"],
+    }
+
+
+def _shard_of(record: Dict[str, Any], shards: int) -> int:
+    key = record.get("document_sha256") or hashlib.sha256(record["path"].encode("utf-8")).hexdigest()
+    return int(key[:8], 16) % shards
+
+
+def _flush(shard_files: Any, checkpoint: IO[str], pending_hashes: List[str]) -> None:
+    """Make results durable before checkpointing the hashes they belong to."""
+    for file in shard_files:
+        file.flush()
+        os.fsync(file.fileno())
+
+    if pending_hashes:
+        checkpoint.write("".join(f"{digest}\n" for digest in pending_hashes))
+        pending_hashes.clear()
+    checkpoint.flush()
+    os.fsync(checkpoint.fileno())
+
+
+class _Progress:
+    """Counts finished documents and estimates the remaining time."""
+
+    def __init__(self, total: int) -> None:
+        self.total = total
+        self.done = 0
+        self.skipped = 0
+        self.errors = 0
+        self.started = time.monotonic()
+
+    def update(self, record: Dict[str, Any]) -> None:
+        self.done += 1
+        if record.get("skipped"):
+            self.skipped += 1
+        elif "error" in record:
+            self.errors += 1
+
+    def report(self) -> str:
+        elapsed = time.monotonic() - self.started
+        evaluated = self.done - self.skipped
+        rate = evaluated / elapsed if elapsed > 0 else 0.0
+        remaining = self.total - self.done
+        eta = _format_duration(remaining / rate) if rate > 0 else "unknown"
+        return (
+            f"{self.done}/{self.total} documents ({self.skipped} skipped, {self.errors} errors) | "
+            f"{rate:.1f} docs/s | ETA {eta}"
+        )
+
+    def summary(self) -> str:
+        elapsed = time.monotonic() - self.started
+        return (
+            f"{self.done - self.skipped - self.errors} evaluated, {self.skipped} skipped, "
+            f"{self.errors} errors in {_format_duration(elapsed)}"
+        )
+
+
+def _format_duration(seconds: float) -> str:
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours:d}:{minutes:02d}:{seconds:02d}"
+
+
+if __name__ == "__main__":
+    sys.exit(main())
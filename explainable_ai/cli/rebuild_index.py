@@ -0,0 +1,36 @@
+"""Rebuild the audit decision-id index from the audit log segments.
+
+Run from the repository root:
+
+    python -m explainable_ai.cli.rebuild_index
+
+The API already indexes records missing from the index at startup; a full
+rebuild also drops entries for segments that were removed or replaced, e.g.
+after restoring the audit directory from a backup.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Sequence
+
+from explainable_ai.core.audit.audit_logger import AUDIT_LOG_DIR
+from explainable_ai.core.audit.audit_reader import rebuild_index
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--directory", type=Path, default=AUDIT_LOG_DIR, help="Audit log directory.")
+    args = parser.parse_args(argv)
+
+    if not args.directory.is_dir():
+        parser.error(f"audit directory not found: {args.directory}")
+
+    print(f"{rebuild_index(args.directory)} records indexed in {args.directory}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
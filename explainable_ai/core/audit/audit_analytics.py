@@ -0,0 +1,187 @@
+"""Time-range reporting over sealed audit segment summaries.
+
+Queries only open the ``.summary.npz`` files whose partition overlaps the
+requested range and never parse raw JSONL. Records in a partition that is
+still being written become visible once its segment is sealed.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Sequence, Tuple
+
+import numpy as np
+
+from explainable_ai.core.audit.audit_logger import AUDIT_LOG_DIR
+from explainable_ai.core.audit.audit_summary import (
+    DECISION_NAMES,
+    SUMMARY_SUFFIX,
+    SegmentSummary,
+    load_summary,
+    partition_bounds,
+    rollup_counts,
+    summary_is_current,
+    to_microseconds,
+    write_summary,
+)
+from explainable_ai.core.audit.audit_writer import SEGMENT_PREFIX, SEGMENT_SUFFIX
+
+
+BUCKET_HOUR = "hour"
+BUCKET_DAY = "day"
+BUCKET_WEEK = "week"
+
+_MICROSECONDS_PER_HOUR = 3_600 * 1_000_000
+_BUCKET_WIDTHS = {
+    BUCKET_HOUR: _MICROSECONDS_PER_HOUR,
+    BUCKET_DAY: 24 * _MICROSECONDS_PER_HOUR,
+    BUCKET_WEEK: 7 * 24 * _MICROSECONDS_PER_HOUR,
+}
+# Weeks start on Monday; the Unix epoch was a Thursday.
+_BUCKET_ORIGINS = {
+    BUCKET_HOUR: 0,
+    BUCKET_DAY: 0,
+    BUCKET_WEEK: 4 * 24 * _MICROSECONDS_PER_HOUR,
+}
+BUCKETS = tuple(_BUCKET_WIDTHS)
+
+DEFAULT_PERCENTILES = (50.0, 90.0, 99.0)
+
+
+def seal_segments(directory: str | Path = AUDIT_LOG_DIR, now: datetime | None = None) -> int:
+    """Summarise segments of ended partitions that lack a current summary.
+
+    Covers segments left behind by workers that exited without sealing and
+    spill segments written after their partition rotated. Returns the number
+    of summaries written.
+    """
+    cutoff = now if now is not None else datetime.utcnow()
+    sealed = 0
+    for path in sorted(Path(directory).glob(f"{SEGMENT_PREFIX}*{SEGMENT_SUFFIX}")):
+        partition = _partition_of(path)
+        bounds = partition_bounds(partition)
+        if bounds is None or bounds[1] > cutoff or summary_is_current(path):
+            continue
+        if write_summary(path, partition) is not None:
+            sealed += 1
+    return sealed
+
+
+def decision_counts(
+    start: datetime,
+    end: datetime,
+    bucket: str = BUCKET_DAY,
+    directory: str | Path = AUDIT_LOG_DIR,
+) -> Dict[str, Dict[str, int]]:
+    """Count governance decisions per bucket for records in ``[start, end)``.
+
+    Partitions that lie entirely inside the range and inside one bucket are
+    answered from their precomputed rollups without touching the columns.
+    """
+    _check_bucket(bucket)
+    start_us, end_us = to_microseconds(start), to_microseconds(end)
+    totals: Dict[int, np.ndarray] = {}
+
+    for (partition_start, partition_end), summary in _iter_summaries(directory, start, end):
+        first_bucket = _bucket_of(to_microseconds(partition_start), bucket)
+        last_bucket = _bucket_of(to_microseconds(partition_end) - 1, bucket)
+        if start <= partition_start and partition_end <= end and first_bucket == last_bucket:
+            _accumulate(totals, first_bucket, summary.decision_counts)
+            continue
+
+        timestamps, selected = _select(summary, start_us, end_us)
+        codes = summary.decision_codes[selected]
+        buckets = _bucket_of(timestamps, bucket)
+        for bucket_start in np.unique(buckets):
+            counts = np.bincount(codes[buckets == bucket_start], minlength=len(DECISION_NAMES))
+            _accumulate(totals, int(bucket_start), counts)
+
+    return {
+        _bucket_label(bucket_start): rollup_counts(DECISION_NAMES, totals[bucket_start])
+        for bucket_start in sorted(totals)
+    }
+
+
+def latency_percentiles(
+    start: datetime,
+    end: datetime,
+    bucket: str = BUCKET_WEEK,
+    percentiles: Sequence[float] = DEFAULT_PERCENTILES,
+    directory: str | Path = AUDIT_LOG_DIR,
+) -> Dict[str, Dict[str, float]]:
+    """Return latency count, mean, max and percentiles per bucket in ``[start, end)``."""
+    _check_bucket(bucket)
+    start_us, end_us = to_microseconds(start), to_microseconds(end)
+    bucket_columns: List[np.ndarray] = []
+    latency_columns: List[np.ndarray] = []
+
+    for _, summary in _iter_summaries(directory, start, end):
+        timestamps, selected = _select(summary, start_us, end_us)
+        bucket_columns.append(_bucket_of(timestamps, bucket))
+        latency_columns.append(summary.latencies_ms[selected])
+
+    if not bucket_columns:
+        return {}
+
+    buckets = np.concatenate(bucket_columns)
+    latencies = np.concatenate(latency_columns)
+    report: Dict[str, Dict[str, float]] = {}
+    for bucket_start in np.unique(buckets):
+        values = latencies[buckets == bucket_start]
+        row: Dict[str, float] = {
+            "count": int(values.size),
+            "mean_ms": float(values.mean()),
+            "max_ms": float(values.max()),
+        }
+        for percentile, value in zip(percentiles, np.percentile(values, percentiles)):
+            row[f"p{percentile:g}_ms"] = float(value)
+        report[_bucket_label(int(bucket_start))] = row
+    return report
+
+
+def _iter_summaries(
+    directory: str | Path,
+    start: datetime,
+    end: datetime,
+) -> Iterator[Tuple[Tuple[datetime, datetime], SegmentSummary]]:
+    for path in sorted(Path(directory).glob(f"{SEGMENT_PREFIX}*{SUMMARY_SUFFIX}")):
+        bounds = partition_bounds(_partition_of(path))
+        if bounds is None or bounds[1] <= start or bounds[0] >= end:
+            continue
+        summary = load_summary(path)
+        if summary is not None and summary.count:
+            yield bounds, summary
+
+
+def _select(summary: SegmentSummary, start_us: int, end_us: int) -> Tuple[np.ndarray, np.ndarray]:
+    timestamps = summary.timestamps_us
+    selected = (timestamps >= start_us) & (timestamps < end_us)
+    return timestamps[selected], selected
+
+
+def _partition_of(path: Path) -> str:
+    return path.name[len(SEGMENT_PREFIX):].split(".", 1)[0]
+
+
+def _check_bucket(bucket: str) -> None:
+    if bucket not in BUCKETS:
+        raise ValueError(f"bucket must be one of: {', '.join(BUCKETS)}.")
+
+
+def _bucket_of(timestamps_us: Any, bucket: str) -> Any:
+    """Return the bucket start for a timestamp or an array of timestamps."""
+    width = _BUCKET_WIDTHS[bucket]
+    origin = _BUCKET_ORIGINS[bucket]
+    return (timestamps_us - origin) // width * width + origin
+
+
+def _bucket_label(bucket_start_us: int) -> str:
+    return (datetime(1970, 1, 1) + timedelta(microseconds=bucket_start_us)).isoformat()
+
+
+def _accumulate(totals: Dict[int, np.ndarray], bucket_start: int, counts: np.ndarray) -> None:
+    if bucket_start in totals:
+        totals[bucket_start] = totals[bucket_start] + counts
+    else:
+        totals[bucket_start] = counts.astype(np.int64)
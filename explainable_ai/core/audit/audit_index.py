@@ -0,0 +1,100 @@
+"""Sidecar index mapping decision ids to their location in the audit log."""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+from pathlib import Path
+from threading import Lock
+from typing import Dict, Iterable, Tuple
+
+
+INDEX_FILE_NAME = "decisions.index.sqlite3"
+
+# (segment file name, byte offset, byte length) of one JSONL record.
+RecordLocation = Tuple[str, int, int]
+
+
+class AuditIndex:
+    """Primary-key lookup table shared by every audit writer in a directory.
+
+    SQLite in WAL mode lets several worker processes append index entries
+    while readers look records up, and a lookup is a single primary-key probe
+    whatever the size of the audit log.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = Lock()
+        self._connection = sqlite3.connect(str(self.path), timeout=30.0, check_same_thread=False)
+        with self._lock:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS records ("
+                " decision_id TEXT PRIMARY KEY,"
+                " segment TEXT NOT NULL,"
+                " byte_offset INTEGER NOT NULL,"
+                " byte_length INTEGER NOT NULL"
+                ") WITHOUT ROWID"
+            )
+            self._connection.commit()
+
+    def add_many(self, entries: Iterable[Tuple[str, str, int, int]]) -> None:
+        """Record ``(decision_id, segment, offset, length)`` entries in one transaction."""
+        rows = list(entries)
+        if not rows:
+            return
+        with self._lock:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO records VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            self._connection.commit()
+
+    def lookup(self, decision_id: str) -> RecordLocation | None:
+        """Return where the record for ``decision_id`` is stored, if indexed."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT segment, byte_offset, byte_length FROM records WHERE decision_id = ?",
+                (decision_id,),
+            ).fetchone()
+        if row is None:
+            return None
+        return str(row[0]), int(row[1]), int(row[2])
+
+    def indexed_extents(self) -> Dict[str, int]:
+        """Return, per segment, the byte offset just past its last indexed record."""
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT segment, MAX(byte_offset + byte_length) FROM records GROUP BY segment"
+            ).fetchall()
+        return {str(segment): int(extent) for segment, extent in rows}
+
+    def clear(self) -> None:
+        """Remove every entry, e.g. before a rebuild."""
+        with self._lock:
+            self._connection.execute("DELETE FROM records")
+            self._connection.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+
+_INDEXES: Dict[Tuple[Path, int], AuditIndex] = {}
+_INDEXES_LOCK = Lock()
+
+
+def get_audit_index(directory: str | Path) -> AuditIndex:
+    """Return the process-wide index for an audit directory."""
+    path = Path(directory) / INDEX_FILE_NAME
+    # Keyed by pid so forked workers never reuse the parent's connection.
+    key = (path, os.getpid())
+    with _INDEXES_LOCK:
+        index = _INDEXES.get(key)
+        if index is None:
+            index = AuditIndex(path)
+            _INDEXES[key] = index
+        return index
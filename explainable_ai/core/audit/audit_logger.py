@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
-import json
+import os
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict
 
+from explainable_ai.core.audit.audit_writer import get_audit_writer
 
+
+# Legacy single-file log; new records go to per-worker segments beside it.
 LOG_FILE_PATH = Path(__file__).resolve().parents[2] / "logs" / "decisions.jsonl"
+AUDIT_LOG_DIR = Path(os.getenv("AUDIT_LOG_DIR", str(LOG_FILE_PATH.parent)))
 
 
 def log_decision(
@@ -18,8 +22,15 @@ def log_decision(
     governance_decision: str,
     confidence_vector: dict,
     latency_ms: float,
+    policy_digest: str | None = None,
+    stage_timings_ms: Dict[str, float] | None = None,
+    cache_hit: bool = False,
 ) -> None:
-    """Append a single governance decision audit record in JSONL format."""
+    """Queue a single governance decision audit record for the JSONL audit log.
+
+    The record is written by the background audit writer, keeping file I/O
+    off the request path.
+    """
     entry: Dict[str, Any] = {
         "decision_id": decision_id,
         "timestamp_utc": datetime.utcnow().isoformat(),
@@ -28,13 +39,14 @@ def log_decision(
         "governance_decision": governance_decision,
         "confidence_vector": confidence_vector,
         "latency_ms": latency_ms,
+        "policy_digest": policy_digest,
+        "cache_hit": cache_hit,
     }
+    if stage_timings_ms is not None:
+        entry["stage_timings_ms"] = stage_timings_ms
 
     try:
-        LOG_FILE_PATH.parent.mkdir(parents=True, exist_ok=True)
-        with LOG_FILE_PATH.open("a", encoding="utf-8") as file:
-            file.write(json.dumps(entry, ensure_ascii=True, separators=(",", ":")))
-            file.write("\n")
+        get_audit_writer(AUDIT_LOG_DIR).write(entry)
     except (OSError, TypeError, ValueError):
         # Fail-safe by design: audit logging must not break decision flow.
         return
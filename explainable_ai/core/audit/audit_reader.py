@@ -0,0 +1,147 @@
+"""Read the audit trail across every per-worker segment file."""
+
+from __future__ import annotations
+
+import heapq
+import json
+import mmap
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Tuple
+
+from explainable_ai.core.audit.audit_index import get_audit_index
+from explainable_ai.core.audit.audit_logger import AUDIT_LOG_DIR, LOG_FILE_PATH
+from explainable_ai.core.audit.audit_writer import SEGMENT_PREFIX, SEGMENT_SUFFIX
+
+
+def list_segments(directory: str | Path = AUDIT_LOG_DIR) -> List[Path]:
+    """Return the legacy log and every worker and spill segment in ``directory``."""
+    root = Path(directory)
+    segments = sorted(root.glob(f"{SEGMENT_PREFIX}*{SEGMENT_SUFFIX}"))
+
+    legacy = root / LOG_FILE_PATH.name
+    if legacy.exists():
+        segments.insert(0, legacy)
+    return segments
+
+
+def iter_audit_records(directory: str | Path = AUDIT_LOG_DIR) -> Iterator[Dict[str, Any]]:
+    """Yield audit records from all segments merged by ``timestamp_utc``.
+
+    Each segment is streamed line by line and keeps its commit order, which
+    can trail timestamp order by the microseconds between concurrent
+    requests. Malformed lines are skipped.
+    """
+    streams = [_iter_segment(path) for path in list_segments(directory)]
+    yield from heapq.merge(*streams, key=lambda record: str(record.get("timestamp_utc", "")))
+
+
+def _iter_segment(path: Path) -> Iterator[Dict[str, Any]]:
+    try:
+        with path.open("r", encoding="utf-8") as file:
+            for line in file:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                if isinstance(record, dict):
+                    yield record
+    except OSError:
+        return
+
+
+def read_record(decision_id: str, directory: str | Path = AUDIT_LOG_DIR) -> Dict[str, Any] | None:
+    """Return the audit record for ``decision_id`` via the offset index.
+
+    The record is sliced out of a memory-mapped segment, so lookup cost does
+    not grow with the size of the audit log. Returns None when the id is not
+    indexed or the stored bytes no longer decode to that record.
+    """
+    root = Path(directory)
+    location = get_audit_index(root).lookup(decision_id)
+    if location is None:
+        return None
+
+    segment, offset, length = location
+    path = root / segment
+    try:
+        with path.open("rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as view:
+            if offset + length > len(view):
+                return None
+            data = view[offset:offset + length]
+    except (OSError, ValueError):
+        return None
+
+    try:
+        record = json.loads(data)
+    except ValueError:
+        return None
+    if not isinstance(record, dict) or record.get("decision_id") != decision_id:
+        return None
+    return record
+
+
+def update_index(directory: str | Path = AUDIT_LOG_DIR) -> int:
+    """Index records past the end of what the index covers and return how many were added.
+
+    Segments are append-only, so only the bytes after a segment's last
+    indexed record are read. This picks up logs written before the index
+    existed, a deleted index file and entries lost in a crash, and is cheap
+    when the index is current. Run at API startup.
+    """
+    root = Path(directory)
+    index = get_audit_index(root)
+    extents = index.indexed_extents()
+
+    count = 0
+    for path in list_segments(root):
+        start = extents.get(path.name, 0)
+        try:
+            if path.stat().st_size <= start:
+                continue
+        except OSError:
+            continue
+        entries = list(_iter_locations(path, start))
+        index.add_many(entries)
+        count += len(entries)
+    return count
+
+
+def rebuild_index(directory: str | Path = AUDIT_LOG_DIR) -> int:
+    """Re-index every record in ``directory`` and return how many were indexed.
+
+    Use after restoring or copying audit segments, or for logs written
+    before the index existed:
+
+        python -m explainable_ai.cli.rebuild_index
+    """
+    root = Path(directory)
+    index = get_audit_index(root)
+    index.clear()
+
+    count = 0
+    for path in list_segments(root):
+        entries = list(_iter_locations(path))
+        index.add_many(entries)
+        count += len(entries)
+    return count
+
+
+def _iter_locations(path: Path, start: int = 0) -> Iterator[Tuple[str, str, int, int]]:
+    try:
+        with path.open("rb") as file:
+            file.seek(start)
+            offset = start
+            for line in file:
+                length = len(line)
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    record = None
+                if isinstance(record, dict) and isinstance(record.get("decision_id"), str):
+                    yield record["decision_id"], path.name, offset, length
+                offset += length
+    except OSError:
+        return
@@ -0,0 +1,223 @@
+"""Time partitions and columnar summaries of sealed audit segments.
+
+Audit segments are partitioned by the UTC day (or hour) of each record's
+``timestamp_utc``. Once a partition is sealed, its segment gets a NumPy
+``.npz`` summary holding the columns analytics need plus precomputed
+rollups, so reporting never has to parse the raw JSON again.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+
+PARTITION_DAY = "day"
+PARTITION_HOUR = "hour"
+PARTITION_GRANULARITIES = (PARTITION_DAY, PARTITION_HOUR)
+
+PARTITION_GRANULARITY = os.getenv("AUDIT_PARTITION_GRANULARITY", PARTITION_DAY).strip().lower()
+
+_PARTITION_FORMATS = {
+    PARTITION_DAY: "%Y%m%d",
+    PARTITION_HOUR: "%Y%m%dT%H",
+}
+_PARTITION_LENGTHS = {
+    PARTITION_DAY: timedelta(days=1),
+    PARTITION_HOUR: timedelta(hours=1),
+}
+
+SUMMARY_SUFFIX = ".summary.npz"
+
+DECISION_NAMES = ("APPROVED", "REVIEW_REQUIRED", "ESCALATE", "OTHER")
+LABEL_NAMES = ("LOW_RISK", "MEDIUM_RISK", "HIGH_RISK", "OTHER")
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def partition_key(timestamp_utc: Any, granularity: str = PARTITION_GRANULARITY) -> str:
+    """Return the partition key for an ISO-8601 UTC timestamp.
+
+    Records without a parseable timestamp fall into the current partition.
+    """
+    if granularity not in PARTITION_GRANULARITIES:
+        raise ValueError(f"granularity must be one of: {', '.join(PARTITION_GRANULARITIES)}.")
+
+    moment = _parse_timestamp(timestamp_utc)
+    if moment is None:
+        moment = datetime.utcnow()
+    return moment.strftime(_PARTITION_FORMATS[granularity])
+
+
+def partition_bounds(key: str) -> Tuple[datetime, datetime] | None:
+    """Return the ``[start, end)`` UTC range of a partition key, if it is one."""
+    for granularity, pattern in _PARTITION_FORMATS.items():
+        try:
+            start = datetime.strptime(key, pattern)
+        except ValueError:
+            continue
+        return start, start + _PARTITION_LENGTHS[granularity]
+    return None
+
+
+def summary_path(segment: Path) -> Path:
+    """Return the summary file that belongs to a JSONL segment."""
+    name = segment.name
+    if name.endswith(".jsonl"):
+        name = name[: -len(".jsonl")]
+    return segment.with_name(name + SUMMARY_SUFFIX)
+
+
+@dataclass(frozen=True)
+class SegmentSummary:
+    """Columns and rollups of one sealed segment.
+
+    ``timestamps_us`` are microseconds since the Unix epoch; decision and
+    label columns hold indexes into ``DECISION_NAMES`` and ``LABEL_NAMES``.
+    """
+
+    partition: str
+    source_bytes: int
+    timestamps_us: np.ndarray
+    decision_codes: np.ndarray
+    label_codes: np.ndarray
+    latencies_ms: np.ndarray
+    decision_counts: np.ndarray
+    label_counts: np.ndarray
+    latency_sum_ms: float
+    latency_max_ms: float
+
+    @property
+    def count(self) -> int:
+        return int(self.timestamps_us.size)
+
+
+def write_summary(segment: Path, partition: str) -> Path | None:
+    """Build and atomically write the summary for a sealed segment.
+
+    Returns the summary path, or None if the segment could not be read.
+    """
+    timestamps: List[int] = []
+    decisions: List[int] = []
+    labels: List[int] = []
+    latencies: List[float] = []
+
+    try:
+        source_bytes = segment.stat().st_size
+        with segment.open("rb") as file:
+            for line in file:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                if not isinstance(record, dict):
+                    continue
+                moment = _parse_timestamp(record.get("timestamp_utc"))
+                if moment is None:
+                    continue
+                timestamps.append(to_microseconds(moment))
+                decisions.append(_code(DECISION_NAMES, record.get("governance_decision")))
+                labels.append(_code(LABEL_NAMES, record.get("deterministic_label")))
+                latencies.append(_latency(record.get("latency_ms")))
+    except OSError:
+        return None
+
+    decision_codes = np.asarray(decisions, dtype=np.int8)
+    label_codes = np.asarray(labels, dtype=np.int8)
+    latencies_ms = np.asarray(latencies, dtype=np.float64)
+
+    target = summary_path(segment)
+    temporary = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+    try:
+        with temporary.open("wb") as file:
+            np.savez(
+                file,
+                partition=np.asarray(partition),
+                source_bytes=np.asarray(source_bytes, dtype=np.int64),
+                timestamps_us=np.asarray(timestamps, dtype=np.int64),
+                decision_codes=decision_codes,
+                label_codes=label_codes,
+                latencies_ms=latencies_ms,
+                decision_counts=np.bincount(decision_codes, minlength=len(DECISION_NAMES)),
+                label_counts=np.bincount(label_codes, minlength=len(LABEL_NAMES)),
+                latency_sum_ms=np.asarray(latencies_ms.sum()),
+                latency_max_ms=np.asarray(latencies_ms.max() if latencies_ms.size else 0.0),
+            )
+        os.replace(temporary, target)
+    except OSError:
+        temporary.unlink(missing_ok=True)
+        return None
+    return target
+
+
+def load_summary(path: Path) -> SegmentSummary | None:
+    """Load a summary file, or None if it is missing or unreadable."""
+    try:
+        with np.load(path, allow_pickle=False) as data:
+            return SegmentSummary(
+                partition=str(data["partition"]),
+                source_bytes=int(data["source_bytes"]),
+                timestamps_us=data["timestamps_us"],
+                decision_codes=data["decision_codes"],
+                label_codes=data["label_codes"],
+                latencies_ms=data["latencies_ms"],
+                decision_counts=data["decision_counts"],
+                label_counts=data["label_counts"],
+                latency_sum_ms=float(data["latency_sum_ms"]),
+                latency_max_ms=float(data["latency_max_ms"]),
+            )
+    except (OSError, KeyError, ValueError):
+        return None
+
+
+def summary_is_current(segment: Path) -> bool:
+    """Return True when the segment has a summary covering all of its bytes."""
+    summary = summary_path(segment)
+    try:
+        with np.load(summary, allow_pickle=False) as data:
+            return int(data["source_bytes"]) == segment.stat().st_size
+    except (OSError, KeyError, ValueError):
+        return False
+
+
+def rollup_counts(names: Tuple[str, ...], counts: np.ndarray) -> Dict[str, int]:
+    """Map a rollup count array onto its names."""
+    return {name: int(count) for name, count in zip(names, counts)}
+
+
+def to_microseconds(moment: datetime) -> int:
+    """Convert a naive UTC datetime to microseconds since the Unix epoch."""
+    delta = moment - _EPOCH
+    return (delta.days * 86_400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+
+def _parse_timestamp(value: Any) -> datetime | None:
+    if not isinstance(value, str):
+        return None
+    try:
+        moment = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    if moment.tzinfo is not None:
+        moment = (moment - moment.utcoffset()).replace(tzinfo=None)
+    return moment
+
+
+def _code(names: Tuple[str, ...], value: Any) -> int:
+    try:
+        return names.index(str(value))
+    except ValueError:
+        return len(names) - 1
+
+
+def _latency(value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
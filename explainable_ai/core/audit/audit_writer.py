@@ -0,0 +1,336 @@
+"""Background group-commit writer for governance decision audit records.
+
+Each process appends to its own segment file per time partition, so
+concurrent uvicorn workers never interleave partial lines. Records are queued
+by request threads and written in batches by one writer thread with a
+configurable fsync policy. The byte location of every record is added to the
+sidecar audit index, and a segment is summarised for analytics once the
+writer rotates away from its partition. Summaries are built on a separate
+thread so reading a sealed segment never stalls group commit.
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import os
+import queue
+import socket
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from threading import Lock, Thread
+from typing import Any, BinaryIO, Dict, List, Tuple
+
+from explainable_ai.core.audit.audit_index import get_audit_index
+from explainable_ai.core.audit.audit_summary import (
+    PARTITION_GRANULARITIES,
+    PARTITION_GRANULARITY,
+    partition_key,
+    write_summary,
+)
+
+
+FSYNC_NONE = "none"
+FSYNC_INTERVAL = "interval"
+FSYNC_BATCH = "batch"
+FSYNC_POLICIES = (FSYNC_NONE, FSYNC_INTERVAL, FSYNC_BATCH)
+
+FSYNC_POLICY = os.getenv("AUDIT_FSYNC_POLICY", FSYNC_INTERVAL).strip().lower()
+FSYNC_INTERVAL_SECONDS = float(os.getenv("AUDIT_FSYNC_INTERVAL_SECONDS", "1.0"))
+QUEUE_SIZE = int(os.getenv("AUDIT_QUEUE_SIZE", "10000"))
+MAX_BATCH_RECORDS = 512
+ENQUEUE_TIMEOUT_SECONDS = 0.05
+CLOSE_TIMEOUT_SECONDS = float(os.getenv("AUDIT_CLOSE_TIMEOUT_SECONDS", "5.0"))
+
+SEGMENT_PREFIX = "decisions."
+SEGMENT_SUFFIX = ".jsonl"
+SPILL_SUFFIX = ".spill.jsonl"
+
+_STOP = object()
+
+
+class AuditWriter:
+    """Queues audit records and group-commits them to per-worker segments.
+
+    Segments are named ``decisions.<partition>.<worker>.jsonl`` where the
+    partition is the UTC day or hour of the record's ``timestamp_utc``. When
+    the queue stays full for ``ENQUEUE_TIMEOUT_SECONDS`` the caller writes the
+    record synchronously to a spill segment instead, so records are never
+    dropped. :meth:`close` drains the queue and seals the open segment;
+    records a dead or stalled writer thread never committed are spilled.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        fsync_policy: str = FSYNC_POLICY,
+        queue_size: int = QUEUE_SIZE,
+        fsync_interval_seconds: float = FSYNC_INTERVAL_SECONDS,
+        partition_granularity: str = PARTITION_GRANULARITY,
+    ) -> None:
+        if fsync_policy not in FSYNC_POLICIES:
+            raise ValueError(f"fsync_policy must be one of: {', '.join(FSYNC_POLICIES)}.")
+        if partition_granularity not in PARTITION_GRANULARITIES:
+            raise ValueError(
+                f"partition_granularity must be one of: {', '.join(PARTITION_GRANULARITIES)}."
+            )
+
+        self.directory = Path(directory)
+        self.fsync_policy = fsync_policy
+        self.partition_granularity = partition_granularity
+        self.fsync_interval_seconds = fsync_interval_seconds
+        self._queue_size = queue_size
+        self._lock = Lock()
+        self._spill_lock = Lock()
+        self._pid = -1
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=queue_size)
+        self._thread: Thread | None = None
+        self._summaries: ThreadPoolExecutor | None = None
+        self._summaries_pid = -1
+        self.worker_id = ""
+
+    def segment_path(self, partition: str) -> Path:
+        return self.directory / f"{SEGMENT_PREFIX}{partition}.{self.worker_id}{SEGMENT_SUFFIX}"
+
+    def spill_path(self, partition: str) -> Path:
+        return self.directory / f"{SEGMENT_PREFIX}{partition}.{self.worker_id}{SPILL_SUFFIX}"
+
+    def write(self, entry: Dict[str, Any]) -> None:
+        """Queue one audit record, spilling to disk if the queue stays full."""
+        self._ensure_started()
+        try:
+            self._queue.put(entry, timeout=ENQUEUE_TIMEOUT_SECONDS)
+        except queue.Full:
+            self._spill(entry)
+
+    def close(self) -> None:
+        """Flush every queued record and stop the writer thread."""
+        with self._lock:
+            thread = self._thread
+            if thread is None or self._pid != os.getpid():
+                return
+            if thread.is_alive():
+                try:
+                    self._queue.put(_STOP, timeout=CLOSE_TIMEOUT_SECONDS)
+                except queue.Full:
+                    pass
+                else:
+                    thread.join(CLOSE_TIMEOUT_SECONDS)
+            self._thread = None
+            self._spill_queued()
+            if self._summaries is not None:
+                # Sealed segments get their rollups before the process exits.
+                self._summaries.shutdown(wait=True)
+                self._summaries = None
+
+    def _ensure_started(self) -> None:
+        if self._running():
+            return
+
+        with self._lock:
+            if self._running():
+                return
+
+            if self._pid != os.getpid():
+                # A forked worker must not share the parent's queue or segment.
+                self._pid = os.getpid()
+                self.worker_id = f"{socket.gethostname()}-{self._pid}"
+                self._queue = queue.Queue(maxsize=self._queue_size)
+            # Otherwise records queued for a writer thread that died are kept.
+            self.directory.mkdir(parents=True, exist_ok=True)
+            if self._summaries is None or self._summaries_pid != self._pid:
+                self._summaries = ThreadPoolExecutor(max_workers=1, thread_name_prefix="audit-summary")
+                self._summaries_pid = self._pid
+            self._thread = Thread(target=self._run, name="audit-writer", daemon=True)
+            self._thread.start()
+
+    def _running(self) -> bool:
+        thread = self._thread
+        return thread is not None and thread.is_alive() and self._pid == os.getpid()
+
+    def _spill_queued(self) -> None:
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            if item is not _STOP:
+                self._spill(item)
+
+    def _run(self) -> None:
+        last_sync = time.monotonic()
+        dirty = False
+        partition = ""
+        file: BinaryIO | None = None
+
+        try:
+            while True:
+                try:
+                    first = self._queue.get(timeout=self.fsync_interval_seconds)
+                except queue.Empty:
+                    if file is not None and dirty and self.fsync_policy == FSYNC_INTERVAL:
+                        _fsync(file)
+                        dirty = False
+                        last_sync = time.monotonic()
+                    continue
+
+                batch: List[Any] = [first]
+                while len(batch) < MAX_BATCH_RECORDS:
+                    try:
+                        batch.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+
+                stop = any(item is _STOP for item in batch)
+                records = [item for item in batch if item is not _STOP]
+                for record_partition, partition_records in self._group_by_partition(records):
+                    try:
+                        if file is None or record_partition != partition:
+                            if file is not None:
+                                sealed, file = file, None
+                                self._seal(sealed, partition)
+                            partition = record_partition
+                            self.directory.mkdir(parents=True, exist_ok=True)
+                            file = self.segment_path(partition).open("ab")
+                        self._write_batch(file, partition, partition_records)
+                        dirty = True
+                    except Exception:
+                        # Fail-safe by design: a segment that cannot be opened
+                        # must not stop the writer; its records are spilled.
+                        for record in partition_records:
+                            self._spill(record)
+
+                now = time.monotonic()
+                if file is not None and dirty and (
+                    stop
+                    or self.fsync_policy == FSYNC_BATCH
+                    or (
+                        self.fsync_policy == FSYNC_INTERVAL
+                        and now - last_sync >= self.fsync_interval_seconds
+                    )
+                ):
+                    _fsync(file, sync=self.fsync_policy != FSYNC_NONE)
+                    dirty = False
+                    last_sync = now
+
+                if stop:
+                    return
+        finally:
+            if file is not None:
+                self._seal(file, partition)
+
+    def _group_by_partition(self, records: List[Dict[str, Any]]) -> List[Tuple[str, List[Dict[str, Any]]]]:
+        groups: List[Tuple[str, List[Dict[str, Any]]]] = []
+        for record in records:
+            key = partition_key(record.get("timestamp_utc"), self.partition_granularity)
+            if groups and groups[-1][0] == key:
+                groups[-1][1].append(record)
+            else:
+                groups.append((key, [record]))
+        return groups
+
+    def _seal(self, file: BinaryIO, partition: str) -> None:
+        try:
+            _fsync(file, sync=self.fsync_policy != FSYNC_NONE)
+        finally:
+            file.close()
+        summaries = self._summaries
+        if summaries is None:
+            return
+        try:
+            summaries.submit(self._summarise, partition)
+        except RuntimeError:
+            # Shut down by close(); seal_segments summarises it at next startup.
+            return
+
+    def _summarise(self, partition: str) -> None:
+        for path in (self.segment_path(partition), self.spill_path(partition)):
+            if path.exists():
+                write_summary(path, partition)
+
+    def _write_batch(self, file: BinaryIO, partition: str, records: List[Dict[str, Any]]) -> None:
+        lines: List[bytes] = []
+        decision_ids: List[Any] = []
+        for record in records:
+            try:
+                lines.append(_serialize(record))
+            except (TypeError, ValueError):
+                # Fail-safe by design: one bad record must not block the rest.
+                continue
+            decision_ids.append(record.get("decision_id"))
+
+        try:
+            offset = file.seek(0, os.SEEK_END)
+            file.write(b"".join(lines))
+            file.flush()
+        except OSError:
+            return
+
+        self._index(self.segment_path(partition).name, offset, decision_ids, lines)
+
+    def _spill(self, entry: Dict[str, Any]) -> None:
+        try:
+            line = _serialize(entry)
+            path = self.spill_path(partition_key(entry.get("timestamp_utc"), self.partition_granularity))
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with self._spill_lock, path.open("ab") as file:
+                offset = file.seek(0, os.SEEK_END)
+                file.write(line)
+                _fsync(file, sync=self.fsync_policy != FSYNC_NONE)
+        except (OSError, TypeError, ValueError):
+            return
+
+        self._index(path.name, offset, [entry.get("decision_id")], [line])
+
+    def _index(self, segment: str, offset: int, decision_ids: List[Any], lines: List[bytes]) -> None:
+        entries: List[Tuple[str, str, int, int]] = []
+        for decision_id, line in zip(decision_ids, lines):
+            if isinstance(decision_id, str):
+                entries.append((decision_id, segment, offset, len(line)))
+            offset += len(line)
+
+        try:
+            get_audit_index(self.directory).add_many(entries)
+        except Exception:
+            # Fail-safe by design: the index can always be rebuilt from the log.
+            return
+
+
+def _serialize(record: Dict[str, Any]) -> bytes:
+    return (json.dumps(record, ensure_ascii=True, separators=(",", ":")) + "\n").encode("ascii")
+
+
+def _fsync(file: BinaryIO, sync: bool = True) -> None:
+    try:
+        file.flush()
+        if sync:
+            os.fsync(file.fileno())
+    except OSError:
+        return
+
+
+_WRITERS: Dict[Path, AuditWriter] = {}
+_WRITERS_LOCK = Lock()
+
+
+def get_audit_writer(directory: str | Path) -> AuditWriter:
+    """Return the process-wide writer for an audit directory."""
+    path = Path(directory)
+    with _WRITERS_LOCK:
+        writer = _WRITERS.get(path)
+        if writer is None:
+            writer = AuditWriter(path)
+            _WRITERS[path] = writer
+        return writer
+
+
+def close_audit_writers() -> None:
+    """Flush and stop every audit writer; called on clean shutdown."""
+    with _WRITERS_LOCK:
+        writers = list(_WRITERS.values())
+    for writer in writers:
+        writer.close()
+
+
+atexit.register(close_audit_writers)
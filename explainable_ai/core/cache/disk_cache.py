@@ -0,0 +1,79 @@
+"""Optional on-disk cache tier storing JSON values by string key."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from threading import Lock
+from typing import Any, Dict
+
+
+class DiskCache:
+    """Stores one JSON file per key under ``directory``.
+
+    Keys are hashed into two-level file names, and writes go through a
+    temporary file and ``os.replace`` so readers never see partial entries.
+    Unreadable entries are treated as misses.
+    """
+
+    def __init__(self, directory: str | Path) -> None:
+        self.directory = Path(directory)
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the stored value for ``key``, or ``default`` when absent."""
+        path = self._path_for(key)
+        try:
+            with path.open("r", encoding="utf-8") as file:
+                value = json.load(file)
+        except (OSError, ValueError):
+            self._count(hit=False)
+            return default
+
+        self._count(hit=True)
+        return value
+
+    def put(self, key: str, value: Any) -> None:
+        """Store a JSON-serialisable ``value`` under ``key``."""
+        path = self._path_for(key)
+        tmp_name: str | None = None
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as file:
+                json.dump(value, file, ensure_ascii=True, separators=(",", ":"))
+            os.replace(tmp_name, path)
+        except (OSError, TypeError, ValueError):
+            # Fail-safe by design: the disk tier is an optimisation only,
+            # but a failed write must not leave its temporary file behind.
+            if tmp_name is not None:
+                try:
+                    os.unlink(tmp_name)
+                except OSError:
+                    pass
+            return
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the directory and hit/miss counters."""
+        with self._lock:
+            return {
+                "directory": str(self.directory),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+    def _path_for(self, key: str) -> Path:
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return self.directory / digest[:2] / f"{digest}.json"
+
+    def _count(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
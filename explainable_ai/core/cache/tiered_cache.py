@@ -0,0 +1,65 @@
+"""Two-tier cache: in-memory LRU in front of an optional disk tier."""
+
+from __future__ import annotations
+
+from threading import Lock
+from typing import Any, Dict
+
+from explainable_ai.core.cache.disk_cache import DiskCache
+from explainable_ai.core.cache.lru_cache import LRUCache
+
+
+class TieredCache:
+    """Looks up the memory tier first and promotes disk hits into it."""
+
+    def __init__(self, memory: LRUCache, disk: DiskCache | None = None) -> None:
+        self.memory = memory
+        self.disk = disk
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the cached value for ``key`` from the fastest tier holding it."""
+        value = self.memory.get(key, _MISSING)
+        if value is _MISSING and self.disk is not None:
+            value = self.disk.get(key, _MISSING)
+            if value is not _MISSING:
+                self.memory.put(key, value)
+
+        with self._lock:
+            if value is _MISSING:
+                self.misses += 1
+            else:
+                self.hits += 1
+
+        return default if value is _MISSING else value
+
+    def put(self, key: str, value: Any) -> None:
+        """Store ``value`` in every configured tier."""
+        self.memory.put(key, value)
+        if self.disk is not None:
+            self.disk.put(key, value)
+
+    def clear(self) -> None:
+        """Drop the memory tier; disk entries are left in place."""
+        self.memory.clear()
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Return overall and per-tier hit/miss counters."""
+        with self._lock:
+            hits = self.hits
+            misses = self.misses
+
+        return {
+            "hits": hits,
+            "misses": misses,
+            "memory": self.memory.stats(),
+            "disk": self.disk.stats() if self.disk is not None else None,
+        }
+
+
+_MISSING = object()
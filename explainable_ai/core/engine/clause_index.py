@@ -0,0 +1,64 @@
+"""Offset-based clause segmentation of contract text.
+
+A clause is a non-blank line with surrounding whitespace removed. The index
+keeps only ``(start, end)`` offsets into the original text in two integer
+arrays, so segmenting a contract never copies its content; clause text is
+sliced out on demand.
+"""
+
+from __future__ import annotations
+
+from array import array
+from typing import Any, Dict, List
+
+
+class ClauseIndex:
+    """Clause boundaries of one document as parallel start/end offset arrays."""
+
+    __slots__ = ("starts", "ends")
+
+    def __init__(self, starts: array, ends: array) -> None:
+        if len(starts) != len(ends):
+            raise ValueError("starts and ends must have the same length.")
+        self.starts = starts
+        self.ends = ends
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def clause(self, document_text: str, index: int) -> str:
+        return document_text[self.starts[index] : self.ends[index]]
+
+    def page(self, document_text: str, offset: int, limit: int) -> List[Dict[str, Any]]:
+        """Return clauses ``offset`` to ``offset + limit`` with their offsets and text."""
+        stop = min(len(self), offset + limit)
+        return [
+            {
+                "index": index,
+                "start": self.starts[index],
+                "end": self.ends[index],
+                "text": self.clause(document_text, index),
+            }
+            for index in range(offset, stop)
+        ]
+
+
+def segment_clauses(document_text: str) -> ClauseIndex:
+    """Index the clauses of ``document_text``.
+
+    Equivalent to stripping every ``str.splitlines`` line and keeping the
+    non-empty ones, but records offsets instead of the stripped strings.
+    """
+    starts = array("q")
+    ends = array("q")
+
+    line_start = 0
+    for line in document_text.splitlines(keepends=True):
+        # Every line terminator counts as whitespace, so strip() drops it too.
+        stripped_end = len(line.rstrip())
+        if stripped_end:
+            starts.append(line_start + len(line) - len(line.lstrip()))
+            ends.append(line_start + stripped_end)
+        line_start += len(line)
+
+    return ClauseIndex(starts, ends)
@@ -0,0 +1,209 @@
+"""Multi-keyword substring matcher.
+
+Small keyword sets are searched with one C-level ``str.find`` per keyword;
+larger ones are compiled into an Aho-Corasick automaton that finds them all
+in a single pass over the text. Both report the same matches.
+"""
+
+from __future__ import annotations
+
+import os
+from collections import deque
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Sequence, Set, Tuple
+
+
+# Keyword count from which the automaton is used. Below it, one C-level
+# substring search per keyword is faster than stepping the pure-Python
+# automaton through the text; see benchmarks/keyword_scaling.py.
+KEYWORD_AUTOMATON_MIN_KEYWORDS = int(os.getenv("KEYWORD_AUTOMATON_MIN_KEYWORDS", "300"))
+
+
+class KeywordMatcher:
+    """Finds every occurrence of a fixed keyword set.
+
+    Keywords are matched as plain substrings, exactly like ``keyword in text``,
+    so callers are expected to lowercase both the keywords and the text.
+    ``use_automaton`` forces the search strategy; by default it is chosen
+    from the keyword count.
+    """
+
+    def __init__(self, keywords: Sequence[str], use_automaton: bool | None = None) -> None:
+        if not all(isinstance(keyword, str) and keyword for keyword in keywords):
+            raise ValueError("Keywords must be non-empty strings.")
+
+        self.keywords: Tuple[str, ...] = tuple(keywords)
+        if use_automaton is None:
+            use_automaton = len(self.keywords) >= KEYWORD_AUTOMATON_MIN_KEYWORDS
+        self.uses_automaton = use_automaton
+        self.max_keyword_length = max((len(keyword) for keyword in self.keywords), default=0)
+
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._outputs: List[Tuple[int, ...]] = [()]
+        if use_automaton:
+            self._build()
+
+    def __len__(self) -> int:
+        return len(self.keywords)
+
+    def find_keywords(self, text: str) -> Set[int]:
+        """Return the indexes of all keywords that occur in ``text``."""
+        if not self.uses_automaton:
+            return {index for index, keyword in enumerate(self.keywords) if keyword in text}
+        return self.stream().feed(text)
+
+    def stream(self) -> "MatchStream":
+        """Start an incremental scan whose state carries across chunks."""
+        return MatchStream(self)
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int, int]]:
+        """Yield ``(start, end, keyword_index)`` for every keyword occurrence.
+
+        Matches are ordered by end offset, longer keywords first on ties.
+        """
+        if self.uses_automaton:
+            return self._iter_automaton_matches(text)
+        return iter(self._substring_matches(text))
+
+    def _substring_matches(self, text: str) -> List[Tuple[int, int, int]]:
+        matches: List[Tuple[int, int, int]] = []
+        for keyword_index, keyword in enumerate(self.keywords):
+            start = text.find(keyword)
+            while start != -1:
+                matches.append((start, start + len(keyword), keyword_index))
+                start = text.find(keyword, start + 1)
+        matches.sort(key=lambda match: (match[1], match[0]))
+        return matches
+
+    def _iter_automaton_matches(self, text: str) -> Iterator[Tuple[int, int, int]]:
+        goto = self._goto
+        fail = self._fail
+        outputs = self._outputs
+        keywords = self.keywords
+        state = 0
+
+        for position, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for keyword_index in outputs[state]:
+                end = position + 1
+                yield end - len(keywords[keyword_index]), end, keyword_index
+
+    def _build(self) -> None:
+        goto = self._goto
+        node_outputs: List[List[int]] = [[]]
+
+        for keyword_index, keyword in enumerate(self.keywords):
+            state = 0
+            for char in keyword:
+                next_state = goto[state].get(char)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][char] = next_state
+                    goto.append({})
+                    node_outputs.append([])
+                state = next_state
+            node_outputs[state].append(keyword_index)
+
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in goto[state].items():
+                queue.append(next_state)
+                fallback = fail[state]
+                while fallback and char not in goto[fallback]:
+                    fallback = fail[fallback]
+                candidate = goto[fallback].get(char, 0)
+                fail[next_state] = candidate if candidate != next_state else 0
+                node_outputs[next_state].extend(node_outputs[fail[next_state]])
+
+        self._fail = fail
+        self._outputs = [tuple(indexes) for indexes in node_outputs]
+
+
+class MatchStream:
+    """Scan state for a document delivered in chunks.
+
+    A keyword split across two fed chunks is still reported: the automaton
+    resumes from its state at the end of the previous chunk, and the
+    substring search keeps the previous chunk's last characters, enough to
+    complete any keyword.
+    """
+
+    def __init__(self, matcher: KeywordMatcher) -> None:
+        self._matcher = matcher
+        self._goto = matcher._goto
+        self._fail = matcher._fail
+        self._outputs = matcher._outputs
+        self._state = 0
+        self._tail = ""
+
+    def feed(self, text: str) -> Set[int]:
+        """Advance over ``text`` and return the keyword indexes completed in it."""
+        if not self._matcher.uses_automaton:
+            return self._feed_substrings(text)
+
+        found: Set[int] = set()
+        goto = self._goto
+        fail = self._fail
+        outputs = self._outputs
+        state = self._state
+
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if outputs[state]:
+                found.update(outputs[state])
+
+        self._state = state
+        return found
+
+    def _feed_substrings(self, text: str) -> Set[int]:
+        window = self._tail + text
+        tail_length = len(self._tail)
+        found: Set[int] = set()
+        for index, keyword in enumerate(self._matcher.keywords):
+            # Only occurrences ending inside ``text`` are new.
+            if window.find(keyword, max(0, tail_length - len(keyword) + 1)) != -1:
+                found.add(index)
+
+        keep = self._matcher.max_keyword_length - 1
+        self._tail = window[-keep:] if keep > 0 else ""
+        return found
+
+
+@dataclass(frozen=True)
+class KeywordMatch:
+    """One keyword occurrence, with offsets into the original document text."""
+
+    rule_id: str
+    keyword: str
+    start: int
+    end: int
+
+
+@dataclass(frozen=True)
+class ScanResult:
+    """Every keyword match found in one document by a single scan."""
+
+    policy_digest: str
+    matches: Tuple[KeywordMatch, ...]
+
+    def rule_ids(self) -> Set[str]:
+        """Return the ids of every rule with at least one match."""
+        return {match.rule_id for match in self.matches}
+
+    def keywords_for(self, rule_id: str) -> Set[str]:
+        """Return the distinct keywords matched for ``rule_id``."""
+        return {match.keyword for match in self.matches if match.rule_id == rule_id}
+
+    def spans_for(self, rule_ids: Iterable[str]) -> List[Tuple[int, int]]:
+        """Return sorted ``(start, end)`` spans of matches for the given rules."""
+        wanted = set(rule_ids)
+        return sorted(
+            (match.start, match.end) for match in self.matches if match.rule_id in wanted
+        )
@@ -3,22 +3,50 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any, Dict, List
 
-from explainable_ai.core.engine.rule_engine import RuleEngine
-from explainable_ai.core.explanation.ai_explainer import generate_ai_explanation
+from explainable_ai.core.engine.clause_index import segment_clauses
+from explainable_ai.core.engine.policy_registry import get_rule_engine
+from explainable_ai.core.engine.result_cache import (
+    get_cached_result,
+    put_cached_result,
+    result_cache_key,
+)
+from explainable_ai.core.engine.revision_store import get_revision, remember_revision
+from explainable_ai.core.explanation.explanation_cache import (
+    generate_cached_explanation,
+    is_fallback_explanation,
+)
 from explainable_ai.core.governance.governance import apply_governance_layer
+from explainable_ai.core.metrics.stage_timer import NULL_STAGE_TIMER, StageTimer
 from explainable_ai.core.risk.keyword_scanner import scan_for_risks
 from explainable_ai.core.scoring.scoring import calculate_confidence_vector
-from explainable_ai.core.trace.decision_trace import generate_decision_trace
+from explainable_ai.core.trace.decision_trace import build_decision_trace
 
 
 BASE_DIR = Path(__file__).resolve().parents[2]
 POLICY_PATH = BASE_DIR / "policies" / "rules.yaml"
 
 
-def evaluate_contract(document_text: str, enable_ai: bool = False) -> dict:
-    """Evaluate contract text through deterministic governance and optional AI explanation."""
+def evaluate_contract(
+    document_text: str,
+    enable_ai: bool = False,
+    timer: StageTimer = NULL_STAGE_TIMER,
+    previous_document_text: str | None = None,
+    track_revision: bool = False,
+) -> dict:
+    """Evaluate contract text through deterministic governance and optional AI explanation.
+
+    Results are cached by document hash, policy digest and ``enable_ai``;
+    ``cache_hit`` in the result tells whether the pipeline was skipped.
+    ``trace`` is a :class:`DecisionTrace`, expanded only when serialised.
+    Stage durations are accumulated into ``timer`` when it is enabled.
+
+    When ``previous_document_text`` is a recently evaluated revision of the
+    same contract, only its changed lines are scanned again; the result is
+    identical to a full evaluation and ``reused_clauses`` counts the lines
+    whose matches were carried over. Only evaluations made with
+    ``track_revision`` are kept as revisions for such later edits.
+    """
     if not isinstance(document_text, str):
         raise TypeError("document_text must be a string.")
 
@@ -28,42 +56,77 @@ def evaluate_contract(document_text: str, enable_ai: bool = False) -> dict:
     if not isinstance(enable_ai, bool):
         raise TypeError("enable_ai must be a boolean.")
 
-    rule_engine = RuleEngine(POLICY_PATH)
-    rule_result = rule_engine.evaluate(document_text)
-
-    confidence_vector = calculate_confidence_vector(
-        passed_rules=rule_result["passed_rules"],
-        failed_rules=rule_result["failed_rules"],
-        total_rules=len(rule_engine.rules),
-        retrieval_similarity=1.0,
-        data_completeness=1.0,
-    )
+    if previous_document_text is not None and not isinstance(previous_document_text, str):
+        raise TypeError("previous_document_text must be a string.")
+
+    if not isinstance(track_revision, bool):
+        raise TypeError("track_revision must be a boolean.")
+
+    with timer.stage("policy_load"):
+        rule_engine = get_rule_engine(POLICY_PATH)
+
+    with timer.stage("result_cache"):
+        cache_key = result_cache_key(document_text, rule_engine.policy_digest, enable_ai)
+        cached = get_cached_result(cache_key, document_text)
+    if cached is not None:
+        # The cache does not hold scans, so a tracked revision is scanned once here.
+        if track_revision and get_revision(document_text) is None:
+            with timer.stage("keyword_scan"):
+                remember_revision(document_text, rule_engine.scan(document_text))
+        cached["cache_hit"] = True
+        cached["reused_clauses"] = 0
+        return cached
+
+    with timer.stage("keyword_scan"):
+        previous = get_revision(previous_document_text) if previous_document_text is not None else None
+        if previous is not None:
+            scan, reused_clauses = rule_engine.rescan(document_text, previous.document_text, previous.scan)
+        else:
+            scan, reused_clauses = rule_engine.scan(document_text), 0
+        if track_revision:
+            remember_revision(document_text, scan)
+    with timer.stage("rule_evaluate"):
+        rule_result = rule_engine.evaluate(document_text, scan=scan)
+
+    with timer.stage("confidence_vector"):
+        confidence_vector = calculate_confidence_vector(
+            passed_rules=rule_result["passed_rules"],
+            failed_rules=rule_result["failed_rules"],
+            total_rules=len(rule_engine.rules),
+            retrieval_similarity=1.0,
+            data_completeness=1.0,
+        )
 
-    governance_decision = apply_governance_layer(
-        deterministic_label=rule_result["deterministic_label"],
-        confidence_vector=confidence_vector,
-        crag_blocked=False,
-    )
+    with timer.stage("governance"):
+        governance_decision = apply_governance_layer(
+            deterministic_label=rule_result["deterministic_label"],
+            confidence_vector=confidence_vector,
+            crag_blocked=False,
+        )
 
-    trace = generate_decision_trace(
-        input_data={"document_text": document_text},
-        passed_rules=rule_result["passed_rules"],
-        failed_rules=rule_result["failed_rules"],
-        eligibility_score=rule_result["eligibility_score"],
-        confidence_vector=confidence_vector,
-        governance_decision=governance_decision,
-    )
+    with timer.stage("decision_trace"):
+        trace = build_decision_trace(
+            input_data={"document_text": document_text},
+            passed_rules=rule_result["passed_rules"],
+            failed_rules=rule_result["failed_rules"],
+            eligibility_score=rule_result["eligibility_score"],
+            confidence_vector=confidence_vector,
+            governance_decision=governance_decision,
+        )
 
-    clauses = _segment_clauses(document_text)
+    # Clause text is served on demand from the audit log by clause offsets,
+    # so the trace records only the count instead of a copy of the document.
+    with timer.stage("clause_segmentation"):
+        clause_count = len(segment_clauses(document_text))
     trace.append(
         {
             "step": "Clause Segmentation",
-            "value": clauses,
-            "count": len(clauses),
+            "count": clause_count,
         }
     )
 
-    risk_scan = scan_for_risks(document_text)
+    with timer.stage("risk_scan"):
+        risk_scan = scan_for_risks(document_text, scan=scan)
     if risk_scan["risk_flag_count"] > 0:
         governance_decision = "REVIEW_REQUIRED"
         trace.append(
@@ -73,30 +136,28 @@ def evaluate_contract(document_text: str, enable_ai: bool = False) -> dict:
             }
         )
 
-    ai_explanation = (
-        generate_ai_explanation(trace, governance_decision) if enable_ai else None
-    )
+    ai_explanation = None
+    if enable_ai:
+        with timer.stage("ai_explanation"):
+            ai_explanation = generate_cached_explanation(
+                trace.to_list(),
+                governance_decision,
+                rule_result["policy_digest"],
+            )
 
-    return {
+    result = {
         "decision": governance_decision,
         "deterministic_label": rule_result["deterministic_label"],
         "confidence_vector": confidence_vector,
         "trace": trace,
         "ai_explanation": ai_explanation,
+        "policy_digest": rule_result["policy_digest"],
     }
+    # A fallback explanation is not cached so the next request retries the backend.
+    if not enable_ai or not is_fallback_explanation(ai_explanation, trace, governance_decision):
+        put_cached_result(cache_key, result)
 
+    result["cache_hit"] = False
+    result["reused_clauses"] = reused_clauses
+    return result
 
-def _segment_clauses(document_text: str) -> List[str]:
-    """Split contract content into clause-like segments for traceability."""
-    segments: List[str] = []
-    for raw in document_text.splitlines():
-        clause = raw.strip()
-        if clause:
-            segments.append(clause)
-
-    if not segments:
-        text = document_text.strip()
-        if text:
-            segments = [text]
-
-    return segments
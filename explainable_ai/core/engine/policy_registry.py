@@ -0,0 +1,79 @@
+"""Process-wide registry of compiled rule policies with hot reload."""
+
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass
+from pathlib import Path
+from threading import Lock
+from typing import Dict, Tuple
+
+from explainable_ai.core.engine.rule_engine import RuleEngine
+
+
+_StatKey = Tuple[int, int, int]
+
+
+@dataclass(frozen=True)
+class _PolicyEntry:
+    stat_key: _StatKey
+    digest: str
+    engine: RuleEngine
+
+
+class PolicyRegistry:
+    """Compiles each policy file once and swaps it when its content changes.
+
+    Lookups cost one ``stat`` call. The file is only re-read when its
+    modification time, size or inode changes, and only recompiled when the
+    SHA-256 digest of its content differs from the cached version.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._entries: Dict[Path, _PolicyEntry] = {}
+
+    def get(self, policy_path: str | Path) -> RuleEngine:
+        """Return the compiled engine for the current content of ``policy_path``."""
+        path = Path(policy_path).resolve()
+        stat_key = self._stat_key(path)
+
+        entry = self._entries.get(path)
+        if entry is not None and entry.stat_key == stat_key:
+            return entry.engine
+
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and entry.stat_key == stat_key:
+                return entry.engine
+
+            source = path.read_bytes()
+            digest = hashlib.sha256(source).hexdigest()
+            if entry is not None and entry.digest == digest:
+                engine = entry.engine
+            else:
+                engine = RuleEngine(path, policy_source=source)
+
+            self._entries[path] = _PolicyEntry(stat_key=stat_key, digest=digest, engine=engine)
+            return engine
+
+    def clear(self) -> None:
+        """Drop every compiled policy."""
+        with self._lock:
+            self._entries.clear()
+
+    @staticmethod
+    def _stat_key(path: Path) -> _StatKey:
+        try:
+            stat = path.stat()
+        except FileNotFoundError as exc:
+            raise FileNotFoundError(f"Policy file not found: {path}") from exc
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+
+_REGISTRY = PolicyRegistry()
+
+
+def get_rule_engine(policy_path: str | Path) -> RuleEngine:
+    """Return the shared compiled engine for a policy file."""
+    return _REGISTRY.get(policy_path)
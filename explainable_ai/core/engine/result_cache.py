@@ -0,0 +1,72 @@
+"""Content-addressed cache of complete contract evaluation results.
+
+Results are keyed by the SHA-256 of the document text, the digest of the
+compiled policy and whether an AI explanation was requested. Editing the
+policy file changes its digest, so stale results are never served after a
+reload; they simply age out of the LRU tier. The decision trace is stored
+in its compact form, without the document text, so entries stay small and
+also round-trip through the JSON disk tier; the text is rebound from the
+request on a hit, since the key already pins it.
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import os
+from typing import Any, Dict
+
+from explainable_ai.core.cache.disk_cache import DiskCache
+from explainable_ai.core.cache.lru_cache import LRUCache
+from explainable_ai.core.cache.tiered_cache import TieredCache
+from explainable_ai.core.trace.decision_trace import DecisionTrace
+
+
+MEMORY_CACHE_ENTRIES = int(os.getenv("RESULT_CACHE_SIZE", "256"))
+DISK_CACHE_DIR = os.getenv("RESULT_CACHE_DIR", "").strip()
+
+_CACHE = TieredCache(
+    memory=LRUCache(max_entries=MEMORY_CACHE_ENTRIES),
+    disk=DiskCache(DISK_CACHE_DIR) if DISK_CACHE_DIR else None,
+)
+
+
+def result_cache_key(document_text: str, policy_digest: str, enable_ai: bool) -> str:
+    """Return the cache key for one evaluation request."""
+    document_hash = hashlib.sha256(document_text.encode("utf-8", "surrogatepass")).hexdigest()
+    return f"{document_hash}:{policy_digest}:{int(enable_ai)}"
+
+
+def get_cached_result(key: str, document_text: str) -> Dict[str, Any] | None:
+    """Return a private copy of a cached result, or None on a miss.
+
+    ``document_text`` is the text ``key`` was computed from; it is put back
+    into the trace input.
+    """
+    cached = _CACHE.get(key)
+    if not isinstance(cached, dict) or not isinstance(cached.get("trace"), dict):
+        return None
+    result = copy.deepcopy(cached)
+    result["trace"]["input_data"]["document_text"] = document_text
+    result["trace"] = DecisionTrace.from_state(result["trace"])
+    return result
+
+
+def put_cached_result(key: str, result: Dict[str, Any]) -> None:
+    """Store a copy of ``result`` so later caller mutations cannot leak into it."""
+    stored = dict(result)
+    state = result["trace"].to_state()
+    state["input_data"] = {
+        field: value for field, value in state["input_data"].items() if field != "document_text"
+    }
+    stored["trace"] = state
+    _CACHE.put(key, copy.deepcopy(stored))
+
+
+def clear_result_cache() -> None:
+    _CACHE.clear()
+
+
+def get_result_cache_stats() -> Dict[str, Any]:
+    """Return result cache hit/miss counters for the metrics endpoint."""
+    return _CACHE.stats()
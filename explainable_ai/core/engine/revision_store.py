@@ -0,0 +1,55 @@
+"""Recently evaluated documents and their keyword scans, for incremental re-evaluation.
+
+Entries are keyed by the SHA-256 of the document text. Re-evaluating an
+edited revision looks up the scan of the previous revision here so only the
+changed lines are searched again; a miss simply means a full scan.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+from dataclasses import dataclass
+from typing import Any, Dict
+
+from explainable_ai.core.cache.lru_cache import LRUCache
+from explainable_ai.core.engine.keyword_matcher import ScanResult
+
+
+# Each entry holds a whole document, so the default is kept small.
+REVISION_STORE_ENTRIES = int(os.getenv("REVISION_STORE_SIZE", "64"))
+
+
+@dataclass(frozen=True)
+class Revision:
+    document_text: str
+    scan: ScanResult
+
+
+_STORE = LRUCache(max_entries=REVISION_STORE_ENTRIES)
+
+
+def document_hash(document_text: str) -> str:
+    return hashlib.sha256(document_text.encode("utf-8", "surrogatepass")).hexdigest()
+
+
+def remember_revision(document_text: str, scan: ScanResult) -> None:
+    """Keep ``scan`` so a later edit of ``document_text`` can be rescanned incrementally."""
+    _STORE.put(document_hash(document_text), Revision(document_text=document_text, scan=scan))
+
+
+def get_revision(document_text: str) -> Revision | None:
+    """Return the stored revision for ``document_text``, or None when it has aged out."""
+    revision = _STORE.get(document_hash(document_text))
+    if not isinstance(revision, Revision) or revision.document_text != document_text:
+        return None
+    return revision
+
+
+def clear_revision_store() -> None:
+    _STORE.clear()
+
+
+def get_revision_store_stats() -> Dict[str, Any]:
+    """Return revision store hit/miss counters for the metrics endpoint."""
+    return _STORE.stats()
@@ -2,11 +2,28 @@
 
 from __future__ import annotations
 
+import hashlib
+import re
+from array import array
+from bisect import bisect_right
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, Iterable, List, Set, Tuple
 
+import numpy as np
 import yaml
+from numpy.typing import ArrayLike
+
+from explainable_ai.core.engine.keyword_matcher import KeywordMatch, KeywordMatcher, ScanResult
+from explainable_ai.core.engine.rule_hit_matrix import RuleHitMatrix
+from explainable_ai.core.governance.governance import RISK_LABELS
+from explainable_ai.core.risk.keyword_scanner import DANGEROUS_KEYWORDS, HARD_GATE_RULE_ID
+
+
+# Characters ``str.splitlines`` treats as line boundaries.
+LINE_BREAK_CHARS = frozenset("\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029")
+
+_RISK_LABEL_ARRAY = np.asarray(RISK_LABELS)
 
 
 @dataclass(frozen=True)
@@ -21,23 +38,171 @@ class Rule:
 class RuleEngine:
     """Loads and evaluates deterministic contract keyword rules."""
 
-    def __init__(self, policy_path: str | Path) -> None:
+    def __init__(self, policy_path: str | Path, policy_source: bytes | None = None) -> None:
         self.policy_path = Path(policy_path)
-        self.rules = self._load_rules(self.policy_path)
+        if policy_source is None:
+            policy_source = self._read_policy(self.policy_path)
+        self.policy_digest = hashlib.sha256(policy_source).hexdigest()
+        self.rules = self._load_rules(policy_source)
+        self._matcher, self._keyword_rules = self._compile_rules(self.rules)
+        self._keyword_columns = self._compile_columns(self.rules, self._keyword_rules)
+        # Matches never cross a line boundary unless a keyword contains one.
+        self._line_local = not any(
+            LINE_BREAK_CHARS.intersection(keyword) for keyword in self._matcher.keywords
+        )
+
+    def scan(self, document_text: str) -> ScanResult:
+        """Find every rule and hard-gate keyword occurrence with one matcher.
 
-    def evaluate(self, document_text: str) -> Dict[str, object]:
-        """Evaluate contract text against keyword risk rules."""
+        Offsets refer to ``document_text`` itself, not its lowercased copy.
+        """
         if not isinstance(document_text, str):
             raise TypeError("document_text must be a string.")
 
         lowered_text = document_text.lower()
+        offset_map = _lowered_offset_map(document_text, lowered_text)
+        keywords = self._matcher.keywords
+
+        matches: List[KeywordMatch] = []
+        for start, end, keyword_index in self._matcher.iter_matches(lowered_text):
+            if offset_map is not None:
+                start, end = offset_map.original(start), offset_map.original(end - 1) + 1
+            for rule_id in self._keyword_rules[keyword_index]:
+                matches.append(
+                    KeywordMatch(
+                        rule_id=rule_id,
+                        keyword=keywords[keyword_index],
+                        start=start,
+                        end=end,
+                    )
+                )
+
+        return ScanResult(policy_digest=self.policy_digest, matches=tuple(matches))
+
+    def rescan(
+        self,
+        document_text: str,
+        previous_text: str,
+        previous_scan: ScanResult,
+    ) -> Tuple[ScanResult, int]:
+        """Scan a revision of ``previous_text``, searching only its changed lines.
 
+        Returns the same :class:`ScanResult` as :meth:`scan` on
+        ``document_text`` and the number of lines whose matches were reused.
+        Lines are the clause granularity of ``str.splitlines``; a line that
+        occurs anywhere in the previous revision keeps its matches, shifted to
+        its new offset. Falls back to a full scan when ``previous_scan`` came
+        from another policy version or a keyword spans lines.
+        """
+        if not isinstance(document_text, str):
+            raise TypeError("document_text must be a string.")
+        if previous_scan.policy_digest != self.policy_digest or not self._line_local:
+            return self.scan(document_text), 0
+
+        known = _matches_by_line(previous_text, previous_scan)
+        matches: List[KeywordMatch] = []
+        reused = 0
+        offset = 0
+        for line in document_text.splitlines(keepends=True):
+            line_matches = known.get(line)
+            if line_matches is None:
+                line_matches = self.scan(line).matches
+                known[line] = line_matches
+            else:
+                reused += 1
+            for match in line_matches:
+                matches.append(
+                    KeywordMatch(
+                        rule_id=match.rule_id,
+                        keyword=match.keyword,
+                        start=match.start + offset,
+                        end=match.end + offset,
+                    )
+                )
+            offset += len(line)
+
+        return ScanResult(policy_digest=self.policy_digest, matches=tuple(matches)), reused
+
+    def evaluate(self, document_text: str, scan: ScanResult | None = None) -> Dict[str, object]:
+        """Evaluate contract text against keyword risk rules.
+
+        A ``scan`` previously produced by :meth:`scan` for the same text is
+        reused instead of searching the document again.
+        """
+        if not isinstance(document_text, str):
+            raise TypeError("document_text must be a string.")
+
+        if scan is None:
+            triggered = self._triggered_rule_ids(document_text.lower())
+        elif scan.policy_digest != self.policy_digest:
+            raise ValueError("scan was produced by a different policy version.")
+        else:
+            triggered = scan.rule_ids()
+
+        return self._build_result(triggered)
+
+    def evaluate_many(self, documents: Iterable[str]) -> RuleHitMatrix:
+        """Evaluate many documents into a packed ``documents x rules`` hit matrix.
+
+        Row ``i`` matches :meth:`evaluate` on the ``i``-th document: its set
+        bits are the failed rules, and the matrix's scores and labels are the
+        eligibility scores and deterministic labels.
+        """
+        rule_count = len(self.rules)
+        keyword_columns = self._keyword_columns
+        rows: List[np.ndarray] = []
+
+        for document_text in documents:
+            if not isinstance(document_text, str):
+                raise TypeError("documents must be strings.")
+            row = np.zeros(rule_count, dtype=bool)
+            for keyword_index in self._matcher.find_keywords(document_text.lower()):
+                row[keyword_columns[keyword_index]] = True
+            rows.append(np.packbits(row, bitorder="little"))
+
+        packed = (
+            np.vstack(rows)
+            if rows
+            else np.zeros((0, (rule_count + 7) // 8), dtype=np.uint8)
+        )
+        return RuleHitMatrix(
+            rule_ids=tuple(rule.id for rule in self.rules),
+            weights=np.asarray([rule.weight for rule in self.rules], dtype=np.int64),
+            packed=packed,
+            policy_digest=self.policy_digest,
+        )
+
+    def evaluate_stream(self, chunks: Iterable[str]) -> Dict[str, object]:
+        """Evaluate a document delivered as an iterable of text chunks.
+
+        Produces the same result as :meth:`evaluate` on the concatenated
+        text, including keywords split across chunk boundaries, while only
+        one chunk and its lowercased copy are held in memory at a time.
+        Chunks are lowercased as if they were one text, so context-dependent
+        lowercasing (Greek final sigma) does not depend on the chunking.
+        """
+        match_stream = self._matcher.stream()
+        lowercaser = _ChunkLowercaser()
+        keyword_rules = self._keyword_rules
+        triggered: Set[str] = set()
+
+        for chunk in chunks:
+            if not isinstance(chunk, str):
+                raise TypeError("document chunks must be strings.")
+            for keyword_index in match_stream.feed(lowercaser.feed(chunk)):
+                triggered.update(keyword_rules[keyword_index])
+        for keyword_index in match_stream.feed(lowercaser.flush()):
+            triggered.update(keyword_rules[keyword_index])
+
+        return self._build_result(triggered)
+
+    def _build_result(self, triggered: Set[str]) -> Dict[str, object]:
         passed_rules: List[str] = []
         failed_rules: List[str] = []
         risk_score = 0
 
         for rule in self.rules:
-            if self._evaluate_rule(rule, lowered_text):
+            if rule.id in triggered:
                 failed_rules.append(rule.id)
                 risk_score += rule.weight
             else:
@@ -50,15 +215,18 @@ class RuleEngine:
             "passed_rules": passed_rules,
             "failed_rules": failed_rules,
             "eligibility_score": int(risk_score),
+            "policy_digest": self.policy_digest,
         }
 
     @staticmethod
-    def _load_rules(policy_path: Path) -> List[Rule]:
+    def _read_policy(policy_path: Path) -> bytes:
         if not policy_path.exists():
             raise FileNotFoundError(f"Policy file not found: {policy_path}")
+        return policy_path.read_bytes()
 
-        with policy_path.open("r", encoding="utf-8") as file:
-            raw = yaml.safe_load(file) or {}
+    @staticmethod
+    def _load_rules(policy_source: bytes) -> List[Rule]:
+        raw = yaml.safe_load(policy_source.decode("utf-8")) or {}
 
         if not isinstance(raw, dict):
             raise ValueError("Policy YAML must contain a top-level 'rules' mapping.")
@@ -71,6 +239,7 @@ class RuleEngine:
             raise ValueError("Policy YAML key 'rules' must be a list.")
 
         rules: List[Rule] = []
+        seen_ids: Set[str] = set()
         for index, item in enumerate(raw_rules):
             if not isinstance(item, dict):
                 raise ValueError(f"Rule at index {index} must be a mapping.")
@@ -90,6 +259,13 @@ class RuleEngine:
             if not isinstance(weight, int):
                 raise ValueError(f"Rule '{rule_id}' has non-integer weight.")
 
+            # Matches, hit columns and traces are keyed by rule id, so ids must be unique.
+            if str(rule_id) == HARD_GATE_RULE_ID:
+                raise ValueError(f"Rule id '{rule_id}' is reserved for the keyword hard gate.")
+            if str(rule_id) in seen_ids:
+                raise ValueError(f"Rule id '{rule_id}' is used by more than one rule.")
+            seen_ids.add(str(rule_id))
+
             rules.append(
                 Rule(
                     id=str(item["id"]),
@@ -101,8 +277,40 @@ class RuleEngine:
         return rules
 
     @staticmethod
-    def _evaluate_rule(rule: Rule, lowered_document_text: str) -> bool:
-        return any(keyword in lowered_document_text for keyword in rule.keywords)
+    def _compile_rules(rules: List[Rule]) -> Tuple[KeywordMatcher, List[Tuple[str, ...]]]:
+        """Build one matcher over every distinct rule and hard-gate keyword."""
+        keyword_positions: Dict[str, int] = {}
+        keyword_rules: List[List[str]] = []
+
+        owned_keywords = [(rule.id, keyword) for rule in rules for keyword in rule.keywords]
+        owned_keywords.extend((HARD_GATE_RULE_ID, keyword) for keyword in DANGEROUS_KEYWORDS)
+
+        for rule_id, keyword in owned_keywords:
+            position = keyword_positions.setdefault(keyword, len(keyword_rules))
+            if position == len(keyword_rules):
+                keyword_rules.append([])
+            if rule_id not in keyword_rules[position]:
+                keyword_rules[position].append(rule_id)
+
+        matcher = KeywordMatcher(list(keyword_positions))
+        return matcher, [tuple(rule_ids) for rule_ids in keyword_rules]
+
+    @staticmethod
+    def _compile_columns(rules: List[Rule], keyword_rules: List[Tuple[str, ...]]) -> List[List[int]]:
+        """Map each keyword to the hit-matrix columns (rule positions) it triggers."""
+        columns_by_id: Dict[str, List[int]] = {}
+        for column, rule in enumerate(rules):
+            columns_by_id.setdefault(rule.id, []).append(column)
+        return [
+            [column for rule_id in rule_ids for column in columns_by_id.get(rule_id, ())]
+            for rule_ids in keyword_rules
+        ]
+
+    def _triggered_rule_ids(self, lowered_document_text: str) -> Set[str]:
+        triggered: Set[str] = set()
+        for keyword_index in self._matcher.find_keywords(lowered_document_text):
+            triggered.update(self._keyword_rules[keyword_index])
+        return triggered
 
     @staticmethod
     def _deterministic_label(risk_score: int) -> str:
@@ -111,3 +319,148 @@ class RuleEngine:
         if 1 <= risk_score <= 40:
             return "MEDIUM_RISK"
         return "HIGH_RISK"
+
+
+def deterministic_labels(risk_scores: ArrayLike) -> np.ndarray:
+    """Vectorised :meth:`RuleEngine._deterministic_label` over an array of risk scores."""
+    return _RISK_LABEL_ARRAY[deterministic_label_codes(risk_scores)]
+
+
+def deterministic_label_codes(risk_scores: ArrayLike) -> np.ndarray:
+    """Return risk label codes, indexes into ``RISK_LABELS``, for an array of risk scores."""
+    scores = np.asarray(risk_scores, dtype=np.int64)
+    # LOW_RISK at 0, MEDIUM_RISK for 1-40, HIGH_RISK otherwise (including negative scores).
+    codes = np.full(scores.shape, 2, dtype=np.int8)
+    codes[(scores >= 1) & (scores <= 40)] = 1
+    codes[scores == 0] = 0
+    return codes
+
+
+class _ChunkLowercaser:
+    """Lowercases a text delivered in chunks exactly as ``str.lower`` on the whole text.
+
+    Capital sigma is the only character ``str.lower`` maps by context: it
+    becomes final sigma when preceded by a cased letter and not followed by
+    one, skipping case-ignorable characters either way. A trailing sigma is
+    held back until its form is known, and the previous chunk's tail back to
+    the last character lowercasing cannot look past is kept as lookbehind.
+    """
+
+    __slots__ = ("_context", "_pending")
+
+    def __init__(self) -> None:
+        self._context = ""
+        self._pending = ""
+
+    def feed(self, chunk: str) -> str:
+        """Return the lowercased text that ``chunk`` completes."""
+        text = self._pending + chunk
+        sigma = text.rfind(_CAPITAL_SIGMA)
+        if sigma >= 0 and all(_is_case_ignorable(char) for char in text[sigma + 1 :]):
+            self._pending = text[sigma:]
+            return self._lower(text[:sigma], lookahead=_CAPITAL_SIGMA)
+        self._pending = ""
+        return self._lower(text)
+
+    def flush(self) -> str:
+        """Return the lowercased text still held back at the end of the document."""
+        text, self._pending = self._pending, ""
+        return self._lower(text)
+
+    def _lower(self, text: str, lookahead: str = "") -> str:
+        if not text:
+            return ""
+        if _CAPITAL_SIGMA in text:
+            context = self._context
+            lowered = (context + text + lookahead).lower()
+            lowered = lowered[len(context.lower()) : len(lowered) - len(lookahead)]
+        else:
+            lowered = text.lower()
+
+        start = len(text)
+        while start > 0 and _is_case_ignorable(text[start - 1]):
+            start -= 1
+        self._context = text[start - 1 :] if start else self._context + text
+        return lowered
+
+
+_CAPITAL_SIGMA = "\u03a3"
+
+
+def _is_case_ignorable(char: str) -> bool:
+    """Whether ``str.lower`` looks past ``char`` when choosing a capital sigma's form."""
+    # Sigma before an ignorable character takes its final form, but not once
+    # a cased letter follows; a cased character or a word boundary fails one check.
+    return ("A" + _CAPITAL_SIGMA + char).lower()[1] == "\u03c2" and (
+        "A" + _CAPITAL_SIGMA + char + "A"
+    ).lower()[1] == "\u03c3"
+
+
+class _LoweredOffsets:
+    """Maps positions in ``text.lower()`` back to ``text``.
+
+    Only characters whose lowercase form is longer than one character (such
+    as "İ") are recorded, so the map grows with those rare characters rather
+    than with the document.
+    """
+
+    __slots__ = ("_lowered_starts", "_positions", "_lengths")
+
+    def __init__(self, text: str) -> None:
+        self._lowered_starts = array("q")
+        self._positions = array("q")
+        self._lengths = array("q")
+
+        expanding = "".join(re.escape(char) for char in set(text) if len(char.lower()) != 1)
+        shift = 0
+        for found in re.finditer(f"[{expanding}]", text):
+            length = len(found.group().lower())
+            self._lowered_starts.append(found.start() + shift)
+            self._positions.append(found.start())
+            self._lengths.append(length)
+            shift += length - 1
+
+    def original(self, lowered_position: int) -> int:
+        """Return the position in ``text`` of the character lowered to ``lowered_position``."""
+        index = bisect_right(self._lowered_starts, lowered_position) - 1
+        if index < 0:
+            return lowered_position
+        offset = lowered_position - self._lowered_starts[index]
+        if offset < self._lengths[index]:
+            return self._positions[index]
+        return self._positions[index] + 1 + offset - self._lengths[index]
+
+
+def _lowered_offset_map(text: str, lowered_text: str) -> _LoweredOffsets | None:
+    """Map lowered-text positions back to ``text`` when lowercasing changed its length."""
+    if len(lowered_text) == len(text):
+        return None
+    return _LoweredOffsets(text)
+
+
+def _matches_by_line(text: str, scan: ScanResult) -> Dict[str, Tuple[KeywordMatch, ...]]:
+    """Group ``scan`` matches by the line of ``text`` they fall in, with line-relative offsets.
+
+    Relies on matches being ordered by end offset and never crossing lines.
+    """
+    grouped: Dict[str, Tuple[KeywordMatch, ...]] = {}
+    matches = scan.matches
+    position = 0
+    line_start = 0
+    for line in text.splitlines(keepends=True):
+        line_end = line_start + len(line)
+        line_matches: List[KeywordMatch] = []
+        while position < len(matches) and matches[position].end <= line_end:
+            match = matches[position]
+            line_matches.append(
+                KeywordMatch(
+                    rule_id=match.rule_id,
+                    keyword=match.keyword,
+                    start=match.start - line_start,
+                    end=match.end - line_start,
+                )
+            )
+            position += 1
+        grouped.setdefault(line, tuple(line_matches))
+        line_start = line_end
+    return grouped
@@ -0,0 +1,83 @@
+"""Packed document-by-rule hit matrix produced by batch rule evaluation."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from explainable_ai.core.governance.governance import RISK_LABELS
+
+
+@dataclass(frozen=True)
+class RuleHitMatrix:
+    """Which rules each document triggered, one bit per (document, rule).
+
+    Row ``i`` of ``packed`` holds the hits of document ``i`` as
+    little-endian bits, column ``j`` being ``rule_ids[j]`` in policy order.
+    Scores, labels and per-rule aggregates are computed from the matrix
+    with array operations.
+    """
+
+    rule_ids: Tuple[str, ...]
+    weights: np.ndarray
+    packed: np.ndarray
+    policy_digest: str
+
+    def __len__(self) -> int:
+        return int(self.packed.shape[0])
+
+    def hits(self) -> np.ndarray:
+        """Return the unpacked ``documents x rules`` boolean matrix."""
+        unpacked = np.unpackbits(self.packed, axis=1, count=len(self.rule_ids), bitorder="little")
+        return unpacked.view(bool)
+
+    def scores(self) -> np.ndarray:
+        """Return each document's risk score, the hit matrix times the rule weights."""
+        return self.hits().astype(np.int64) @ self.weights
+
+    def label_codes(self) -> np.ndarray:
+        # Imported here: the rule engine imports this module.
+        from explainable_ai.core.engine.rule_engine import deterministic_label_codes
+
+        return deterministic_label_codes(self.scores())
+
+    def labels(self) -> np.ndarray:
+        return np.asarray(RISK_LABELS)[self.label_codes()]
+
+    def rule_hit_counts(self) -> Dict[str, int]:
+        """Return how many documents triggered each rule."""
+        counts = self.hits().sum(axis=0)
+        return {rule_id: int(count) for rule_id, count in zip(self.rule_ids, counts)}
+
+    def failed_rules(self, row: int) -> List[str]:
+        return [rule_id for rule_id, hit in zip(self.rule_ids, self.hits_of(row)) if hit]
+
+    def passed_rules(self, row: int) -> List[str]:
+        return [rule_id for rule_id, hit in zip(self.rule_ids, self.hits_of(row)) if not hit]
+
+    def hits_of(self, row: int) -> np.ndarray:
+        unpacked = np.unpackbits(self.packed[row], count=len(self.rule_ids), bitorder="little")
+        return unpacked.view(bool)
+
+    def save(self, path: str | Path) -> None:
+        """Write the matrix to an ``.npz`` file readable by :meth:`load` or plain NumPy."""
+        np.savez_compressed(
+            path,
+            rule_ids=np.asarray(self.rule_ids, dtype=str),
+            weights=self.weights,
+            packed=self.packed,
+            policy_digest=np.asarray(self.policy_digest),
+        )
+
+    @classmethod
+    def load(cls, path: str | Path) -> "RuleHitMatrix":
+        with np.load(path) as data:
+            return cls(
+                rule_ids=tuple(str(rule_id) for rule_id in data["rule_ids"]),
+                weights=data["weights"],
+                packed=data["packed"],
+                policy_digest=str(data["policy_digest"]),
+            )
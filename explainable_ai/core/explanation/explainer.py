@@ -10,11 +10,10 @@ import json
 import os
 from typing import Any, List
 
-import requests
+from explainable_ai.core.explanation.explanation_dispatcher import get_explanation_dispatcher
 
 
 DEFAULT_MODEL_ID = "HuggingFaceH4/zephyr-7b-beta"
-INFERENCE_API_URL_TEMPLATE = "https://api-inference.huggingface.co/models/{model_id}"
 REQUEST_TIMEOUT_SECONDS = 20
 MAX_TRACE_ITEMS = 40
 
@@ -37,10 +36,6 @@ def generate_ai_explanation(trace: list, final_decision: str) -> str:
     model_id = os.getenv("HF_MODEL_ID", DEFAULT_MODEL_ID).strip() or DEFAULT_MODEL_ID
     prompt = _build_prompt(trace=trace, final_decision=final_decision)
 
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json",
-    }
     payload = {
         "inputs": prompt,
         "parameters": {
@@ -51,22 +46,21 @@ def generate_ai_explanation(trace: list, final_decision: str) -> str:
     }
 
     try:
-        response = requests.post(
-            INFERENCE_API_URL_TEMPLATE.format(model_id=model_id),
-            headers=headers,
-            json=payload,
+        data = get_explanation_dispatcher().generate(
+            model_id=model_id,
+            token=token,
+            payload=payload,
             timeout=REQUEST_TIMEOUT_SECONDS,
         )
-        if response.status_code != 200:
+        if data is None:
             return fallback
 
-        data = response.json()
         explanation = _extract_generated_text(data)
         if not explanation:
             return fallback
 
         return explanation.strip()
-    except (requests.RequestException, ValueError, TypeError):
+    except (ValueError, TypeError):
         return fallback
 
 
@@ -0,0 +1,114 @@
+"""Cache of AI explanations keyed by a canonical decision signature.
+
+The explanation prompt only depends on the decision outcome, so decisions
+with the same policy version, rule results, score and final decision share
+one narrative. Document-specific trace steps are removed before the prompt is
+built, which keeps cached narratives valid for every matching document.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from typing import Any, Dict, List
+
+from explainable_ai.core.cache.disk_cache import DiskCache
+from explainable_ai.core.cache.lru_cache import LRUCache
+from explainable_ai.core.cache.tiered_cache import TieredCache
+from explainable_ai.core.explanation.ai_explainer import (
+    DEFAULT_MODEL_ID,
+    _fallback_explanation,
+    generate_ai_explanation,
+)
+
+
+MEMORY_CACHE_ENTRIES = int(os.getenv("EXPLANATION_CACHE_SIZE", "1024"))
+DISK_CACHE_DIR = os.getenv("EXPLANATION_CACHE_DIR", "").strip()
+
+# Trace steps whose values are specific to one document.
+DOCUMENT_SPECIFIC_STEPS = {"Input Received", "Clause Segmentation"}
+
+_CACHE = TieredCache(
+    memory=LRUCache(max_entries=MEMORY_CACHE_ENTRIES),
+    disk=DiskCache(DISK_CACHE_DIR) if DISK_CACHE_DIR else None,
+)
+
+
+def generate_cached_explanation(trace: list, final_decision: str, policy_digest: str | None) -> str:
+    """Return an AI explanation, reusing one generated for the same outcome.
+
+    Only model-generated narratives are cached; fallback explanations are
+    returned as-is so the next request retries the inference backend.
+    """
+    if not isinstance(trace, list) or not isinstance(final_decision, str):
+        return generate_ai_explanation(trace, final_decision)
+
+    canonical = canonical_trace(trace)
+    signature = decision_signature(canonical, final_decision, policy_digest)
+
+    cached = _CACHE.get(signature)
+    if isinstance(cached, str):
+        return cached
+
+    explanation = generate_ai_explanation(canonical, final_decision)
+    if not is_fallback_explanation(explanation, canonical, final_decision):
+        _CACHE.put(signature, explanation)
+    return explanation
+
+
+def is_fallback_explanation(explanation: Any, trace: list, final_decision: str) -> bool:
+    """Return True when ``explanation`` is the deterministic fallback for this outcome."""
+    return explanation == _fallback_explanation(trace=canonical_trace(trace), final_decision=final_decision)
+
+
+def canonical_trace(trace: List[Any]) -> List[Any]:
+    """Drop document-specific steps, keeping only the decision outcome."""
+    return [
+        entry
+        for entry in trace
+        if not (isinstance(entry, dict) and entry.get("step") in DOCUMENT_SPECIFIC_STEPS)
+    ]
+
+
+def decision_signature(trace: List[Any], final_decision: str, policy_digest: str | None) -> str:
+    """Return a stable key for the outcome recorded in ``trace``."""
+    passed: List[str] = []
+    failed: List[str] = []
+    score: Any = None
+    confidence: Any = None
+    gate_keywords: List[str] = []
+
+    for entry in trace:
+        if not isinstance(entry, dict):
+            continue
+
+        step = entry.get("step")
+        if step == "Keyword Risk Scan":
+            target = failed if entry.get("result") == "FAIL" else passed
+            target.append(str(entry.get("rule_id")))
+        elif step == "Score Computed":
+            score = entry.get("value")
+        elif step == "Confidence Vector":
+            confidence = entry.get("value")
+        elif step == "Keyword Hard Gate":
+            gate_keywords = sorted(str(keyword) for keyword in entry.get("value") or [])
+
+    model_id = os.getenv("HF_MODEL_ID", DEFAULT_MODEL_ID).strip() or DEFAULT_MODEL_ID
+    payload = {
+        "model_id": model_id,
+        "policy_digest": policy_digest,
+        "passed_rules": sorted(passed),
+        "failed_rules": sorted(failed),
+        "score": score,
+        "confidence_vector": confidence,
+        "hard_gate_keywords": gate_keywords,
+        "decision": final_decision,
+    }
+    canonical = json.dumps(payload, sort_keys=True, ensure_ascii=True, default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def get_explanation_cache_stats() -> Dict[str, Any]:
+    """Return explanation cache hit/miss counters for the metrics endpoint."""
+    return _CACHE.stats()
@@ -0,0 +1,170 @@
+"""Micro-batching dispatcher for explanation inference requests.
+
+Prompts submitted by concurrent callers within a short window are sent to the
+inference backend as one batched ``inputs`` array, and each caller receives
+the response item for its own prompt.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import queue
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import dataclass, field
+from threading import Lock, Thread
+from typing import Any, Dict, List, Tuple
+
+from explainable_ai.core.explanation.inference_client import (
+    POOL_SIZE,
+    InferenceClient,
+    get_inference_client,
+)
+
+
+BATCH_WINDOW_MS = float(os.getenv("INFERENCE_BATCH_WINDOW_MS", "10"))
+MAX_BATCH_SIZE = int(os.getenv("INFERENCE_MAX_BATCH_SIZE", "16"))
+
+_BatchKey = Tuple[str, str, str, float]
+
+
+@dataclass
+class _PendingPrompt:
+    key: _BatchKey
+    payload: Dict[str, Any]
+    future: Future = field(default_factory=Future)
+
+
+class ExplanationDispatcher:
+    """Collects prompts for up to ``window_seconds`` or ``max_batch_size`` items.
+
+    Only prompts for the same model, token, generation parameters and timeout
+    are batched together. Every caller gets back the decoded response in the
+    same shape as an unbatched call, or None when the backend call failed,
+    so per-item fallback handling is unchanged.
+    """
+
+    def __init__(
+        self,
+        client: InferenceClient | None = None,
+        window_seconds: float = BATCH_WINDOW_MS / 1000.0,
+        max_batch_size: int = MAX_BATCH_SIZE,
+        max_concurrent_batches: int = POOL_SIZE,
+    ) -> None:
+        self._client = client
+        self.window_seconds = max(0.0, window_seconds)
+        self.max_batch_size = max(1, max_batch_size)
+        self._queue: "queue.Queue[_PendingPrompt]" = queue.Queue()
+        self._senders = ThreadPoolExecutor(
+            max_workers=max_concurrent_batches,
+            thread_name_prefix="explanation-batch",
+        )
+        self._start_lock = Lock()
+        self._thread: Thread | None = None
+
+    @property
+    def client(self) -> InferenceClient:
+        return self._client if self._client is not None else get_inference_client()
+
+    def generate(self, model_id: str, token: str, payload: Dict[str, Any], timeout: float) -> Any:
+        """Return the decoded backend response for one prompt payload.
+
+        Accepts the same arguments as :meth:`InferenceClient.generate`.
+        Returns None, like a failed backend call, when no response arrives
+        within ``timeout`` plus the batching window.
+        """
+        if self.window_seconds <= 0 or self.max_batch_size <= 1:
+            return self.client.generate(model_id=model_id, token=token, payload=payload, timeout=timeout)
+
+        parameters = json.dumps(payload.get("parameters", {}), sort_keys=True, default=str)
+        pending = _PendingPrompt(key=(model_id, token, parameters, float(timeout)), payload=payload)
+        self._ensure_started()
+        self._queue.put(pending)
+        try:
+            return pending.future.result(timeout=float(timeout) + self.window_seconds)
+        except FutureTimeoutError:
+            return None
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+
+        with self._start_lock:
+            # Also replaces a collector thread that died.
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = Thread(
+                    target=self._collect_forever,
+                    name="explanation-dispatcher",
+                    daemon=True,
+                )
+                self._thread.start()
+
+    def _collect_forever(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.window_seconds
+
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            groups: Dict[_BatchKey, List[_PendingPrompt]] = {}
+            for pending in batch:
+                groups.setdefault(pending.key, []).append(pending)
+
+            for group in groups.values():
+                self._senders.submit(self._send, group)
+
+    def _send(self, group: List[_PendingPrompt]) -> None:
+        model_id, token, _, timeout = group[0].key
+        try:
+            if len(group) == 1:
+                results: List[Any] = [
+                    self.client.generate(
+                        model_id=model_id,
+                        token=token,
+                        payload=group[0].payload,
+                        timeout=timeout,
+                    )
+                ]
+            else:
+                payload = dict(group[0].payload)
+                payload["inputs"] = [pending.payload.get("inputs") for pending in group]
+                data = self.client.generate(model_id=model_id, token=token, payload=payload, timeout=timeout)
+                results = _split_batch_response(data, len(group))
+        except Exception:
+            results = [None] * len(group)
+
+        for pending, result in zip(group, results):
+            pending.future.set_result(result)
+
+
+def _split_batch_response(data: Any, size: int) -> List[Any]:
+    """Split a batched response into one single-prompt response per input."""
+    if not isinstance(data, list) or len(data) != size:
+        return [None] * size
+
+    results: List[Any] = []
+    for item in data:
+        if isinstance(item, list):
+            results.append(item)
+        elif isinstance(item, dict):
+            results.append([item])
+        else:
+            results.append(None)
+    return results
+
+
+_DISPATCHER = ExplanationDispatcher()
+
+
+def get_explanation_dispatcher() -> ExplanationDispatcher:
+    """Return the process-wide explanation dispatcher."""
+    return _DISPATCHER
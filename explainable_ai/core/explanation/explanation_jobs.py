@@ -0,0 +1,128 @@
+"""Background generation of AI explanations for already computed decisions.
+
+Explanations are presentation-only, so decisions are returned immediately and
+narratives are produced by a bounded worker pool and fetched by job id.
+"""
+
+from __future__ import annotations
+
+import os
+import uuid
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from threading import Lock
+from typing import Any, Callable, Dict, List
+
+from explainable_ai.core.explanation.ai_explainer import _fallback_explanation
+from explainable_ai.core.explanation.explanation_cache import generate_cached_explanation
+
+
+MAX_WORKERS = int(os.getenv("EXPLANATION_WORKERS", "4"))
+MAX_PENDING_JOBS = int(os.getenv("EXPLANATION_MAX_PENDING", "256"))
+MAX_RETAINED_JOBS = 4096
+
+STATUS_PENDING = "pending"
+STATUS_COMPLETED = "completed"
+
+
+class ExplanationJobQueue:
+    """Runs explanation jobs on a bounded thread pool and retains their results.
+
+    When more than ``max_pending`` jobs are queued, new jobs complete at once
+    with the deterministic fallback explanation instead of queueing further.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = MAX_WORKERS,
+        max_pending: int = MAX_PENDING_JOBS,
+        max_retained: int = MAX_RETAINED_JOBS,
+        explain: Callable[[list, str, str | None], str] = generate_cached_explanation,
+    ) -> None:
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="explanation-worker",
+        )
+        self._max_pending = max_pending
+        self._max_retained = max_retained
+        self._explain = explain
+        self._lock = Lock()
+        self._pending = 0
+        self._jobs: "OrderedDict[str, Future]" = OrderedDict()
+
+    def submit(self, trace: List[Any], final_decision: str, policy_digest: str | None = None) -> str:
+        """Queue an explanation for ``trace`` and return its job id."""
+        job_id = str(uuid.uuid4())
+
+        with self._lock:
+            overloaded = self._pending >= self._max_pending
+            if not overloaded:
+                self._pending += 1
+
+        if overloaded:
+            future: Future = Future()
+            future.set_result(_fallback_explanation(trace=trace, final_decision=final_decision))
+        else:
+            future = self._executor.submit(self._run, trace, final_decision, policy_digest)
+
+        with self._lock:
+            self._jobs[job_id] = future
+            while len(self._jobs) > self._max_retained:
+                self._jobs.popitem(last=False)
+
+        return job_id
+
+    def get_future(self, job_id: str) -> Future | None:
+        """Return the future holding the explanation for ``job_id``, if known."""
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def status(self, job_id: str) -> Dict[str, Any] | None:
+        """Return the job status and, once completed, its explanation."""
+        future = self.get_future(job_id)
+        if future is None:
+            return None
+        return _job_payload(job_id, future)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop accepting jobs and optionally wait for queued ones to finish."""
+        self._executor.shutdown(wait=wait)
+
+    def _run(self, trace: List[Any], final_decision: str, policy_digest: str | None) -> str:
+        try:
+            return self._explain(trace, final_decision, policy_digest)
+        except Exception:
+            # Fail-safe by design: explanation failures never surface as errors.
+            return _fallback_explanation(trace=trace, final_decision=final_decision)
+        finally:
+            with self._lock:
+                self._pending -= 1
+
+
+def _job_payload(job_id: str, future: Future) -> Dict[str, Any]:
+    if not future.done():
+        return {"job_id": job_id, "status": STATUS_PENDING, "ai_explanation": None}
+    return {"job_id": job_id, "status": STATUS_COMPLETED, "ai_explanation": future.result()}
+
+
+_QUEUE = ExplanationJobQueue()
+
+
+def submit_explanation(trace: list, final_decision: str, policy_digest: str | None = None) -> str:
+    """Queue an AI explanation in the background and return its job id."""
+    return _QUEUE.submit(trace=trace, final_decision=final_decision, policy_digest=policy_digest)
+
+
+def get_explanation_job(job_id: str) -> dict | None:
+    """Return the status payload for an explanation job, or None if unknown."""
+    return _QUEUE.status(job_id)
+
+
+def get_explanation_future(job_id: str) -> Future | None:
+    """Return the future of an explanation job, or None if unknown."""
+    return _QUEUE.get_future(job_id)
+
+
+def job_payload(job_id: str, future: Future) -> dict:
+    """Return the status payload for a job from its future."""
+    return _job_payload(job_id, future)
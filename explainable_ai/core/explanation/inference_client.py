@@ -0,0 +1,192 @@
+"""Shared HTTP client for the explanation inference backend.
+
+One pooled ``requests.Session`` is reused for every explanation, so calls keep
+their TCP/TLS connections alive. A circuit breaker stops calling a degraded
+backend after consecutive failures, letting callers return their fallback
+explanation immediately instead of waiting out the request timeout.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from threading import Lock
+from typing import Any, Callable, Dict
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+INFERENCE_API_URL_TEMPLATE = os.getenv(
+    "INFERENCE_API_URL_TEMPLATE",
+    "https://api-inference.huggingface.co/models/{model_id}",
+)
+POOL_SIZE = int(os.getenv("INFERENCE_POOL_SIZE", "16"))
+MAX_RETRIES = int(os.getenv("INFERENCE_MAX_RETRIES", "2"))
+BACKOFF_SECONDS = float(os.getenv("INFERENCE_BACKOFF_SECONDS", "0.25"))
+BREAKER_FAILURE_THRESHOLD = int(os.getenv("INFERENCE_BREAKER_THRESHOLD", "5"))
+BREAKER_RESET_SECONDS = float(os.getenv("INFERENCE_BREAKER_RESET_SECONDS", "30"))
+
+# Backend responses that indicate overload or an unavailable model.
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Opens after consecutive failures and allows one trial call after a cooldown."""
+
+    def __init__(
+        self,
+        failure_threshold: int = BREAKER_FAILURE_THRESHOLD,
+        reset_timeout_seconds: float = BREAKER_RESET_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if failure_threshold <= 0:
+            raise ValueError("failure_threshold must be greater than 0.")
+
+        self.failure_threshold = failure_threshold
+        self.reset_timeout_seconds = reset_timeout_seconds
+        self._clock = clock
+        self._lock = Lock()
+        self._state = STATE_CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state
+
+    def allow_request(self) -> bool:
+        """Return True when a call to the backend may be attempted."""
+        with self._lock:
+            if self._state == STATE_CLOSED:
+                return True
+
+            if self._state == STATE_OPEN:
+                if self._clock() - self._opened_at < self.reset_timeout_seconds:
+                    return False
+                self._state = STATE_HALF_OPEN
+                return True
+
+            # Half-open: a trial call is already in flight.
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._state = STATE_CLOSED
+            self._consecutive_failures = 0
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._consecutive_failures += 1
+            if (
+                self._state == STATE_HALF_OPEN
+                or self._consecutive_failures >= self.failure_threshold
+            ):
+                self._state = STATE_OPEN
+                self._opened_at = self._clock()
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "state": self._state,
+                "consecutive_failures": self._consecutive_failures,
+            }
+
+
+class InferenceClient:
+    """Pooled, retrying and circuit-broken client for text generation calls."""
+
+    def __init__(
+        self,
+        url_template: str = INFERENCE_API_URL_TEMPLATE,
+        pool_size: int = POOL_SIZE,
+        max_retries: int = MAX_RETRIES,
+        backoff_seconds: float = BACKOFF_SECONDS,
+        breaker: CircuitBreaker | None = None,
+    ) -> None:
+        self.url_template = url_template
+        self.max_retries = max(0, max_retries)
+        self.backoff_seconds = max(0.0, backoff_seconds)
+        self.breaker = breaker if breaker is not None else CircuitBreaker()
+
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+    def generate(self, model_id: str, token: str, payload: Dict[str, Any], timeout: float) -> Any:
+        """POST ``payload`` to the model endpoint and return the decoded JSON.
+
+        Returns None when the breaker is open, the backend keeps failing after
+        retries, or the response cannot be decoded. Never raises for
+        transport or backend errors.
+        """
+        if not self.breaker.allow_request():
+            return None
+
+        # Every allowed call records an outcome, even when it raises, so a
+        # half-open breaker never waits forever for its trial call.
+        try:
+            response = self._post_with_retries(model_id, token, payload, timeout)
+        except BaseException:
+            self.breaker.record_failure()
+            raise
+
+        if response is None:
+            self.breaker.record_failure()
+            return None
+
+        self.breaker.record_success()
+        if response.status_code != 200:
+            return None
+        try:
+            return response.json()
+        except ValueError:
+            return None
+
+    def _post_with_retries(
+        self,
+        model_id: str,
+        token: str,
+        payload: Dict[str, Any],
+        timeout: float,
+    ) -> requests.Response | None:
+        """Return the first non-retryable response, or None when every attempt failed."""
+        url = self.url_template.format(model_id=model_id)
+        headers = {
+            "Authorization": f"Bearer {token}",
+            "Content-Type": "application/json",
+        }
+
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                time.sleep(self.backoff_seconds * (2 ** (attempt - 1)))
+
+            try:
+                response = self._session.post(url, headers=headers, json=payload, timeout=timeout)
+            except requests.Timeout:
+                # Retrying a timed-out call would multiply the caller's wait.
+                return None
+            except requests.RequestException:
+                continue
+
+            if response.status_code not in RETRYABLE_STATUS_CODES:
+                return response
+
+        return None
+
+    def close(self) -> None:
+        self._session.close()
+
+
+_CLIENT = InferenceClient()
+
+
+def get_inference_client() -> InferenceClient:
+    """Return the process-wide inference client."""
+    return _CLIENT
@@ -4,9 +4,19 @@ from __future__ import annotations
 
 from typing import Any, Dict
 
+import numpy as np
+from numpy.typing import ArrayLike
+
 
 _VALID_LABELS = {"LOW_RISK", "MEDIUM_RISK", "HIGH_RISK"}
 
+# Index-aligned: each risk label maps to the action at the same position.
+RISK_LABELS = ("LOW_RISK", "MEDIUM_RISK", "HIGH_RISK")
+GOVERNANCE_ACTIONS = ("APPROVED", "REVIEW_REQUIRED", "ESCALATE")
+_REVIEW_REQUIRED = GOVERNANCE_ACTIONS.index("REVIEW_REQUIRED")
+_ESCALATE = GOVERNANCE_ACTIONS.index("ESCALATE")
+_ACTION_ARRAY = np.asarray(GOVERNANCE_ACTIONS)
+
 
 def apply_governance_layer(
     deterministic_label: str,
@@ -19,29 +29,54 @@ def apply_governance_layer(
         confidence_vector=confidence_vector,
     )
 
-    if crag_blocked is True:
-        return "ESCALATE"
+    actions = apply_governance_layers(
+        deterministic_labels=[deterministic_label],
+        rule_confidence=[float(confidence_vector["rule_confidence"])],
+        crag_blocked=[crag_blocked is True],
+    )
+    return str(actions[0])
+
+
+def apply_governance_layers(
+    deterministic_labels: ArrayLike,
+    rule_confidence: ArrayLike,
+    crag_blocked: ArrayLike,
+) -> np.ndarray:
+    """Map many risk labels and rule confidences to governance actions at once.
+
+    Labels are strings or integer codes into ``RISK_LABELS``. Arguments
+    broadcast against each other; returns an array of action strings
+    matching :func:`apply_governance_layer` row by row.
+    """
+    labels = np.asarray(deterministic_labels)
+    if np.issubdtype(labels.dtype, np.integer):
+        label_codes = labels
+    else:
+        label_codes = np.full(labels.shape, -1, dtype=np.int8)
+        for code, label in enumerate(RISK_LABELS):
+            label_codes[labels == label] = code
+        if (label_codes < 0).any():
+            _validate_label(str(labels[label_codes < 0][0]))
 
-    label_map = {
-        "LOW_RISK": "APPROVED",
-        "MEDIUM_RISK": "REVIEW_REQUIRED",
-        "HIGH_RISK": "ESCALATE",
-    }
-    action = label_map[deterministic_label]
+    return _ACTION_ARRAY[governance_action_codes(label_codes, rule_confidence, crag_blocked)]
 
-    if float(confidence_vector["rule_confidence"]) < 50:
-        return "REVIEW_REQUIRED"
 
-    return action
+def governance_action_codes(
+    label_codes: ArrayLike,
+    rule_confidence: ArrayLike,
+    crag_blocked: ArrayLike,
+) -> np.ndarray:
+    """Columnar core of :func:`apply_governance_layers`: codes into ``GOVERNANCE_ACTIONS``."""
+    codes = np.asarray(label_codes, dtype=np.int8)
+    if ((codes < 0) | (codes >= len(RISK_LABELS))).any():
+        raise ValueError(f"Risk label codes must be between 0 and {len(RISK_LABELS) - 1}.")
+
+    codes = np.where(np.asarray(rule_confidence, dtype=np.float64) < 50, np.int8(_REVIEW_REQUIRED), codes)
+    return np.where(np.asarray(crag_blocked, dtype=bool), np.int8(_ESCALATE), codes)
 
 
 def _validate_inputs(deterministic_label: str, confidence_vector: Dict[str, Any]) -> None:
-    if deterministic_label not in _VALID_LABELS:
-        allowed = ", ".join(sorted(_VALID_LABELS))
-        raise ValueError(
-            f"Invalid deterministic_label '{deterministic_label}'. "
-            f"Expected one of: {allowed}."
-        )
+    _validate_label(deterministic_label)
 
     if not isinstance(confidence_vector, dict):
         raise TypeError("confidence_vector must be a dictionary.")
@@ -52,3 +87,12 @@ def _validate_inputs(deterministic_label: str, confidence_vector: Dict[str, Any]
     rule_confidence = confidence_vector["rule_confidence"]
     if not isinstance(rule_confidence, (int, float)):
         raise TypeError("confidence_vector['rule_confidence'] must be a number.")
+
+
+def _validate_label(deterministic_label: str) -> None:
+    if deterministic_label not in _VALID_LABELS:
+        allowed = ", ".join(sorted(_VALID_LABELS))
+        raise ValueError(
+            f"Invalid deterministic_label '{deterministic_label}'. "
+            f"Expected one of: {allowed}."
+        )
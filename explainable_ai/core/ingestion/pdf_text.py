@@ -0,0 +1,141 @@
+"""Page-parallel PDF text extraction with a content-addressed cache."""
+
+from __future__ import annotations
+
+import hashlib
+import math
+import multiprocessing
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from io import BytesIO
+from threading import Lock
+from typing import Dict, Iterator, List, Sequence, Tuple
+
+import PyPDF2
+
+from explainable_ai.core.cache.lru_cache import LRUCache
+
+
+MAX_WORKERS = int(os.getenv("PDF_EXTRACT_WORKERS", str(min(4, os.cpu_count() or 1))))
+MIN_PAGES_PER_TASK = 4
+TEXT_CACHE_ENTRIES = int(os.getenv("PDF_TEXT_CACHE_SIZE", "32"))
+
+_TEXT_CACHE = LRUCache(max_entries=TEXT_CACHE_ENTRIES)
+_POOL_LOCK = Lock()
+_POOLS: Dict[int, ProcessPoolExecutor] = {}
+
+
+def iter_pdf_pages(pdf_bytes: bytes, max_workers: int | None = None) -> Iterator[str]:
+    """Yield the text of each PDF page, in page order.
+
+    Large documents are split into page ranges extracted by a shared process
+    pool. Results are cached by the SHA-256 of ``pdf_bytes``, so re-uploading
+    the same file returns the cached pages without parsing it again. Set
+    ``max_workers`` to 1 to extract in the calling process.
+    """
+    if not isinstance(pdf_bytes, (bytes, bytearray)):
+        raise TypeError("pdf_bytes must be bytes.")
+
+    digest = hashlib.sha256(pdf_bytes).hexdigest()
+    cached = _TEXT_CACHE.get(digest)
+    if cached is not None:
+        yield from cached
+        return
+
+    pages: List[str] = []
+    for page_text in _extract_pages(bytes(pdf_bytes), max_workers):
+        pages.append(page_text)
+        yield page_text
+
+    _TEXT_CACHE.put(digest, tuple(pages))
+
+
+def extract_pdf_text(pdf_bytes: bytes, max_workers: int | None = None) -> str:
+    """Return the concatenated text of every PDF page."""
+    return "".join(iter_pdf_pages(pdf_bytes, max_workers=max_workers))
+
+
+def clear_pdf_text_cache() -> None:
+    """Drop every cached extraction, e.g. to time cold extractions."""
+    _TEXT_CACHE.clear()
+
+
+def _extract_pages(pdf_bytes: bytes, max_workers: int | None) -> Iterator[str]:
+    workers = MAX_WORKERS if max_workers is None else max_workers
+    reader = PyPDF2.PdfReader(BytesIO(pdf_bytes))
+    page_count = len(reader.pages)
+
+    if workers <= 1 or page_count < 2 * MIN_PAGES_PER_TASK:
+        for page in reader.pages:
+            yield page.extract_text() or ""
+        return
+
+    task_size = max(MIN_PAGES_PER_TASK, math.ceil(page_count / (workers * 2)))
+    ranges = [
+        (start, min(start + task_size, page_count))
+        for start in range(0, page_count, task_size)
+    ]
+
+    # Workers read the document from a temporary file instead of receiving
+    # a pickled copy of it with every page range.
+    with tempfile.NamedTemporaryFile(prefix="pdf-extract-", suffix=".pdf", delete=False) as file:
+        file.write(pdf_bytes)
+    try:
+        done = 0
+        # A crashed worker breaks the whole pool; rebuild it and retry the
+        # unfinished ranges once.
+        for attempt in range(2):
+            pool = _get_pool(workers)
+            try:
+                for page_texts in _map_ranges(pool, file.name, ranges[done:]):
+                    yield from page_texts
+                    done += 1
+                return
+            except BrokenProcessPool:
+                _discard_pool(workers, pool)
+                if attempt:
+                    raise
+    finally:
+        os.unlink(file.name)
+
+
+def _map_ranges(pool: ProcessPoolExecutor, path: str, ranges: Sequence[Tuple[int, int]]) -> Iterator[List[str]]:
+    futures = [pool.submit(_extract_range_task, path, start, stop) for start, stop in ranges]
+    try:
+        for future in futures:
+            yield future.result()
+    finally:
+        for future in futures:
+            future.cancel()
+
+
+def _extract_range_task(path: str, start: int, stop: int) -> List[str]:
+    """Worker entrypoint: extract pages ``start`` to ``stop`` of the PDF at ``path``.
+
+    Nothing is kept in the worker once the range is extracted.
+    """
+    reader = PyPDF2.PdfReader(path)
+    return [reader.pages[index].extract_text() or "" for index in range(start, stop)]
+
+
+def _get_pool(workers: int) -> ProcessPoolExecutor:
+    with _POOL_LOCK:
+        pool = _POOLS.get(workers)
+        if pool is None:
+            # Spawned workers avoid forking the threads of the API/UI server.
+            pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            _POOLS[workers] = pool
+        return pool
+
+
+def _discard_pool(workers: int, pool: ProcessPoolExecutor) -> None:
+    """Forget a broken pool so the next call starts a fresh one."""
+    with _POOL_LOCK:
+        if _POOLS.get(workers) is pool:
+            del _POOLS[workers]
+    pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,190 @@
+"""Fixed-memory, log-bucketed latency histograms with striped shards.
+
+Values are bucketed HDR-style: exact below ``SUB_BUCKET_COUNT`` microseconds,
+then ``SUB_BUCKET_COUNT`` linear sub-buckets per power of two, which bounds
+the relative error of any reported percentile to about 3%. Each histogram
+has ``HISTOGRAM_SHARDS`` shards and every recording thread is assigned one
+of them round-robin, so concurrent :meth:`LatencyHistogram.record` calls
+rarely contend for a shard's lock; snapshots merge the shards.
+"""
+
+from __future__ import annotations
+
+import itertools
+import math
+import os
+import time
+from array import array
+from dataclasses import dataclass
+from threading import Lock, local
+from typing import Callable, Dict, Iterable, List, Tuple
+
+
+SUB_BUCKET_BITS = 5
+SUB_BUCKET_COUNT = 1 << SUB_BUCKET_BITS
+# Largest distinct value is 2**37 microseconds (~38 hours); larger values clamp.
+MAX_SHIFT = 31
+BUCKET_COUNT = (MAX_SHIFT + 2) * SUB_BUCKET_COUNT
+
+RATE_WINDOW_SECONDS = 60
+# One extra slot for the second that is still being filled.
+_RATE_SLOTS = RATE_WINDOW_SECONDS + 1
+DEFAULT_PERCENTILES = (50.0, 90.0, 99.0, 99.9)
+# Fixed shard count, so memory does not grow as worker threads come and go.
+HISTOGRAM_SHARDS = max(1, int(os.getenv("HISTOGRAM_SHARDS", "8")))
+
+
+def bucket_index(value_us: int) -> int:
+    """Return the bucket holding a non-negative integer microsecond value."""
+    if value_us < SUB_BUCKET_COUNT:
+        return max(0, value_us)
+    shift = value_us.bit_length() - SUB_BUCKET_BITS - 1
+    if shift > MAX_SHIFT:
+        return BUCKET_COUNT - 1
+    return (shift + 1) * SUB_BUCKET_COUNT + (value_us >> shift) - SUB_BUCKET_COUNT
+
+
+def bucket_bounds(index: int) -> Tuple[int, int]:
+    """Return the ``[lower, upper)`` microsecond range of a bucket."""
+    if index < SUB_BUCKET_COUNT:
+        return index, index + 1
+    shift = index // SUB_BUCKET_COUNT - 1
+    sub_bucket = SUB_BUCKET_COUNT + index % SUB_BUCKET_COUNT
+    return sub_bucket << shift, (sub_bucket + 1) << shift
+
+
+class _Shard:
+    """Counters shared by the threads assigned to one stripe."""
+
+    __slots__ = ("lock", "counts", "total_us", "max_us", "rate_counts", "rate_seconds")
+
+    def __init__(self) -> None:
+        self.lock = Lock()
+        self.counts = array("Q", bytes(8 * BUCKET_COUNT))
+        self.total_us = 0
+        self.max_us = 0
+        self.rate_counts = array("Q", bytes(8 * _RATE_SLOTS))
+        self.rate_seconds = array("q", [-1] * _RATE_SLOTS)
+
+
+@dataclass(frozen=True)
+class HistogramSnapshot:
+    """Merged, immutable view of a histogram at one point in time."""
+
+    counts: array
+    count: int
+    total_us: int
+    max_us: int
+
+    def percentile(self, percentile: float) -> float:
+        """Return the value in milliseconds at ``percentile`` (0-100)."""
+        if self.count == 0:
+            return 0.0
+        rank = max(1, math.ceil(self.count * percentile / 100.0))
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank:
+                lower, upper = bucket_bounds(index)
+                # Report the bucket midpoint, capped by the largest value seen.
+                return min((lower + upper - 1) / 2.0, self.max_us) / 1000.0
+        return self.max_us / 1000.0
+
+    @property
+    def mean_ms(self) -> float:
+        return (self.total_us / self.count) / 1000.0 if self.count else 0.0
+
+    @property
+    def max_ms(self) -> float:
+        return self.max_us / 1000.0
+
+    def summary(self, percentiles: Iterable[float] = DEFAULT_PERCENTILES) -> Dict[str, float]:
+        values: Dict[str, float] = {
+            "count": self.count,
+            "mean_ms": self.mean_ms,
+            "max_ms": self.max_ms,
+        }
+        for percentile in percentiles:
+            values[f"p{percentile:g}_ms".replace(".", "")] = self.percentile(percentile)
+        return values
+
+    @classmethod
+    def merge(cls, snapshots: Iterable["HistogramSnapshot"]) -> "HistogramSnapshot":
+        counts = array("Q", bytes(8 * BUCKET_COUNT))
+        count = total_us = max_us = 0
+        for snapshot in snapshots:
+            for index, bucket_count in enumerate(snapshot.counts):
+                if bucket_count:
+                    counts[index] += bucket_count
+            count += snapshot.count
+            total_us += snapshot.total_us
+            max_us = max(max_us, snapshot.max_us)
+        return cls(counts=counts, count=count, total_us=total_us, max_us=max_us)
+
+
+class LatencyHistogram:
+    """Latency histogram plus a per-second request counter ring.
+
+    Memory is fixed at ``HISTOGRAM_SHARDS`` times ``BUCKET_COUNT`` plus
+    ``RATE_WINDOW_SECONDS`` counters, regardless of how many values are
+    recorded or how many threads record them.
+    """
+
+    def __init__(
+        self,
+        clock: Callable[[], float] = time.monotonic,
+        shards: int = HISTOGRAM_SHARDS,
+    ) -> None:
+        self._clock = clock
+        self._local = local()
+        self._shards: List[_Shard] = [_Shard() for _ in range(max(1, shards))]
+        self._next_shard = itertools.count()
+
+    def record(self, latency_ms: float) -> None:
+        """Record one latency in milliseconds."""
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = self._shards[next(self._next_shard) % len(self._shards)]
+            self._local.shard = shard
+
+        value_us = max(0, int(latency_ms * 1000.0))
+        second = int(self._clock())
+        slot = second % _RATE_SLOTS
+        with shard.lock:
+            shard.counts[bucket_index(value_us)] += 1
+            shard.total_us += value_us
+            if value_us > shard.max_us:
+                shard.max_us = value_us
+
+            if shard.rate_seconds[slot] != second:
+                shard.rate_seconds[slot] = second
+                shard.rate_counts[slot] = 0
+            shard.rate_counts[slot] += 1
+
+    def snapshot(self) -> HistogramSnapshot:
+        """Merge every shard into one snapshot."""
+        counts = array("Q", bytes(8 * BUCKET_COUNT))
+        total_us = max_us = 0
+        for shard in self._shards:
+            with shard.lock:
+                shard_counts = array("Q", shard.counts)
+                total_us += shard.total_us
+                max_us = max(max_us, shard.max_us)
+            for index, bucket_count in enumerate(shard_counts):
+                if bucket_count:
+                    counts[index] += bucket_count
+        return HistogramSnapshot(counts=counts, count=sum(counts), total_us=total_us, max_us=max_us)
+
+    def rate(self, window_seconds: int = RATE_WINDOW_SECONDS) -> float:
+        """Return requests per second over the last ``window_seconds`` full seconds."""
+        window = max(1, min(int(window_seconds), RATE_WINDOW_SECONDS))
+        now = int(self._clock())
+        recent = 0
+        for shard in self._shards:
+            with shard.lock:
+                slots = list(zip(shard.rate_seconds, shard.rate_counts))
+            for second, count in slots:
+                # The current second is still filling, so it is excluded.
+                if now - window <= second < now:
+                    recent += count
+        return recent / window
@@ -3,67 +3,169 @@
 from __future__ import annotations
 
 from threading import Lock
-from typing import Dict
+from typing import Any, Dict, List, Tuple
+
+from explainable_ai.core.metrics.histogram import (
+    DEFAULT_PERCENTILES,
+    HistogramSnapshot,
+    LatencyHistogram,
+)
+
+
+DECISIONS = ("APPROVED", "REVIEW_REQUIRED", "ESCALATE")
+UNKNOWN_ENDPOINT = "unknown"
+RATE_WINDOWS_SECONDS = (10, 60)
+
+_PROMETHEUS_PREFIX = "governance"
 
 
 class _MetricsTracker:
-    """Singleton-style metrics state container."""
+    """Singleton-style metrics state container.
+
+    Latencies are kept in one histogram per endpoint, one per governance
+    decision and one per timed evaluation stage. Recording only locks the
+    calling thread's histogram shard; the tracker lock is taken once per new
+    endpoint, decision or stage, not per request.
+    """
 
     def __init__(self) -> None:
         self._lock = Lock()
-        self.total_requests = 0
-        self.approved_count = 0
-        self.review_required_count = 0
-        self.escalate_count = 0
-        self.cumulative_latency = 0.0
+        self._by_endpoint: Dict[str, LatencyHistogram] = {}
+        self._by_decision: Dict[str, LatencyHistogram] = {
+            decision: LatencyHistogram() for decision in DECISIONS
+        }
+        self._by_stage: Dict[str, LatencyHistogram] = {}
 
-    def record_decision(self, decision: str, latency_ms: float) -> None:
+    def record_decision(self, decision: str, latency_ms: float, endpoint: str = UNKNOWN_ENDPOINT) -> None:
         """Record one decision event and latency in milliseconds."""
-        decision_text = str(decision)
         try:
             latency_value = float(latency_ms)
         except (TypeError, ValueError):
             latency_value = 0.0
 
-        with self._lock:
-            self.total_requests += 1
-
-            if decision_text == "APPROVED":
-                self.approved_count += 1
-            elif decision_text == "REVIEW_REQUIRED":
-                self.review_required_count += 1
-            elif decision_text == "ESCALATE":
-                self.escalate_count += 1
+        self._histogram(self._by_endpoint, str(endpoint)).record(latency_value)
+        self._histogram(self._by_decision, str(decision)).record(latency_value)
 
-            self.cumulative_latency += latency_value
+    def record_stage_timings(self, timings_ms: Dict[str, float]) -> None:
+        """Record the duration of each evaluation stage in milliseconds."""
+        for stage, duration_ms in timings_ms.items():
+            self._histogram(self._by_stage, str(stage)).record(duration_ms)
 
-    def get_metrics(self) -> Dict[str, float | int]:
+    def get_metrics(self) -> Dict[str, Any]:
         """Return a snapshot of current metrics."""
-        with self._lock:
-            total_requests = self.total_requests
-            approved = self.approved_count
-            review_required = self.review_required_count
-            escalate = self.escalate_count
-            cumulative_latency = self.cumulative_latency
+        by_endpoint = self._snapshots(self._by_endpoint)
+        by_decision = self._snapshots(self._by_decision)
+        overall = HistogramSnapshot.merge(by_decision.values())
 
-        average_latency = (cumulative_latency / total_requests) if total_requests else 0.0
         return {
-            "total_requests": total_requests,
-            "approved": approved,
-            "review_required": review_required,
-            "escalate": escalate,
-            "average_latency_ms": average_latency,
+            "total_requests": overall.count,
+            "approved": by_decision["APPROVED"].count,
+            "review_required": by_decision["REVIEW_REQUIRED"].count,
+            "escalate": by_decision["ESCALATE"].count,
+            "average_latency_ms": overall.mean_ms,
+            "latency_ms": {
+                "overall": overall.summary(),
+                "by_endpoint": {name: snapshot.summary() for name, snapshot in by_endpoint.items()},
+                "by_decision": {name: snapshot.summary() for name, snapshot in by_decision.items()},
+                "by_stage": {
+                    name: snapshot.summary() for name, snapshot in self._snapshots(self._by_stage).items()
+                },
+            },
+            "requests_per_second": {
+                name: {f"{window}s": histogram.rate(window) for window in RATE_WINDOWS_SECONDS}
+                for name, histogram in self._items(self._by_endpoint)
+            },
         }
 
+    def prometheus_text(self) -> str:
+        """Render the metrics in the Prometheus text exposition format."""
+        lines: List[str] = []
+        _summary_lines(
+            lines,
+            f"{_PROMETHEUS_PREFIX}_request_latency_ms",
+            "Request latency in milliseconds by endpoint.",
+            "endpoint",
+            self._snapshots(self._by_endpoint),
+        )
+        _summary_lines(
+            lines,
+            f"{_PROMETHEUS_PREFIX}_stage_latency_ms",
+            "Evaluation stage latency in milliseconds.",
+            "stage",
+            self._snapshots(self._by_stage),
+        )
+
+        decisions = f"{_PROMETHEUS_PREFIX}_decisions_total"
+        lines.append(f"# HELP {decisions} Governance decisions by outcome.")
+        lines.append(f"# TYPE {decisions} counter")
+        for name, snapshot in self._snapshots(self._by_decision).items():
+            lines.append(f'{decisions}{{decision="{_escape_label(name)}"}} {snapshot.count}')
+
+        rate = f"{_PROMETHEUS_PREFIX}_requests_per_second"
+        lines.append(f"# HELP {rate} Sliding-window request rate by endpoint.")
+        lines.append(f"# TYPE {rate} gauge")
+        for name, histogram in self._items(self._by_endpoint):
+            for window in RATE_WINDOWS_SECONDS:
+                lines.append(
+                    f'{rate}{{endpoint="{_escape_label(name)}",window="{window}s"}} {histogram.rate(window):.6g}'
+                )
+        return "\n".join(lines) + "\n"
+
+    def _histogram(self, histograms: Dict[str, LatencyHistogram], key: str) -> LatencyHistogram:
+        histogram = histograms.get(key)
+        if histogram is None:
+            with self._lock:
+                histogram = histograms.setdefault(key, LatencyHistogram())
+        return histogram
+
+    def _items(self, histograms: Dict[str, LatencyHistogram]) -> List[Tuple[str, LatencyHistogram]]:
+        with self._lock:
+            return sorted(histograms.items())
+
+    def _snapshots(self, histograms: Dict[str, LatencyHistogram]) -> Dict[str, HistogramSnapshot]:
+        return {name: histogram.snapshot() for name, histogram in self._items(histograms)}
+
+
+def _summary_lines(
+    lines: List[str],
+    metric: str,
+    description: str,
+    label_name: str,
+    snapshots: Dict[str, HistogramSnapshot],
+) -> None:
+    lines.append(f"# HELP {metric} {description}")
+    lines.append(f"# TYPE {metric} summary")
+    for name, snapshot in snapshots.items():
+        label = f'{label_name}="{_escape_label(name)}"'
+        for percentile in DEFAULT_PERCENTILES:
+            quantile = f"{percentile / 100.0:g}"
+            lines.append(f'{metric}{{{label},quantile="{quantile}"}} {snapshot.percentile(percentile):.6g}')
+        lines.append(f"{metric}_sum{{{label}}} {snapshot.total_us / 1000.0:.6g}")
+        lines.append(f"{metric}_count{{{label}}} {snapshot.count}")
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
 
 _TRACKER = _MetricsTracker()
 
 
-def record_decision(decision: str, latency_ms: float) -> None:
-    """Record a governance decision and latency."""
-    _TRACKER.record_decision(decision=decision, latency_ms=latency_ms)
+def record_decision(decision: str, latency_ms: float, endpoint: str = UNKNOWN_ENDPOINT) -> None:
+    """Record a governance decision and latency for the endpoint that served it."""
+    _TRACKER.record_decision(decision=decision, latency_ms=latency_ms, endpoint=endpoint)
+
+
+def record_stage_timings(timings_ms: Dict[str, float]) -> None:
+    """Record per-stage durations from a :class:`StageTimer`."""
+    _TRACKER.record_stage_timings(timings_ms)
 
 
 def get_metrics() -> dict:
     """Return aggregated metrics as a dictionary."""
     return _TRACKER.get_metrics()
+
+
+def get_prometheus_metrics() -> str:
+    """Return aggregated metrics in the Prometheus text format."""
+    return _TRACKER.prometheus_text()
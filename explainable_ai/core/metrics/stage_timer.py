@@ -0,0 +1,74 @@
+"""Lightweight per-stage wall-clock timing for the evaluation pipeline."""
+
+from __future__ import annotations
+
+import os
+import time
+from typing import Dict
+
+
+# Stage timings are always recorded in /metrics; this adds them to every
+# response and audit record, as include_stage_timings does per request.
+STAGE_TIMING_ENABLED = os.getenv("STAGE_TIMING_ENABLED", "false").strip().lower() in {"1", "true", "yes"}
+
+
+class _Stage:
+    __slots__ = ("_timer", "_name", "_start")
+
+    def __init__(self, timer: "StageTimer", name: str) -> None:
+        self._timer = timer
+        self._name = name
+        self._start = 0.0
+
+    def __enter__(self) -> None:
+        self._start = time.perf_counter()
+
+    def __exit__(self, *_: object) -> None:
+        elapsed_ms = (time.perf_counter() - self._start) * 1000.0
+        timings = self._timer.timings_ms
+        timings[self._name] = timings.get(self._name, 0.0) + elapsed_ms
+
+
+class _NullStage:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *_: object) -> None:
+        return None
+
+
+_NULL_STAGE = _NullStage()
+
+
+class StageTimer:
+    """Accumulates durations of named stages in milliseconds.
+
+    Use as ``with timer.stage("rule_evaluate"): ...``; a stage entered more
+    than once accumulates. A disabled timer hands out one shared no-op
+    context manager, so instrumented code costs a method call per stage.
+    """
+
+    __slots__ = ("enabled", "timings_ms")
+
+    def __init__(self, enabled: bool = True) -> None:
+        self.enabled = enabled
+        self.timings_ms: Dict[str, float] = {}
+
+    def stage(self, name: str) -> _Stage | _NullStage:
+        if not self.enabled:
+            return _NULL_STAGE
+        return _Stage(self, name)
+
+    def rounded(self, digits: int = 3) -> Dict[str, float]:
+        """Return the stage timings rounded for responses and audit records."""
+        return {name: round(value, digits) for name, value in self.timings_ms.items()}
+
+
+NULL_STAGE_TIMER = StageTimer(enabled=False)
+
+
+def stage_timings_reported(requested: bool = False) -> bool:
+    """Return whether stage timings go into the response and audit record."""
+    return requested or STAGE_TIMING_ENABLED
@@ -0,0 +1,136 @@
+"""Single-pass rendering of flagged keyword spans into report paragraphs.
+
+Spans come from one keyword scan. They are merged once, then the document
+is walked from start to end a single time, emitting reportlab paragraph
+markup with every flagged span wrapped in ``[FLAGGED:...]``. Paragraphs
+break at line boundaries or, for long lines, at whitespace, and never inside
+a flagged span, so a marker is always whole.
+"""
+
+from __future__ import annotations
+
+from typing import Iterable, Iterator, List, Sequence, Tuple
+
+
+Span = Tuple[int, int]
+
+FLAG_PREFIX = "[FLAGGED:"
+FLAG_SUFFIX = "]"
+MAX_PARAGRAPH_CHARS = 1500
+GAP_MARKER = "[...]"
+
+
+def merge_spans(spans: Iterable[Span]) -> List[Span]:
+    """Sort ``spans`` and merge the overlapping ones."""
+    merged: List[List[int]] = []
+    for start, end in sorted(spans):
+        if merged and start < merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    return [(start, end) for start, end in merged]
+
+
+def highlight_text(text: str, spans: Iterable[Span]) -> str:
+    """Return ``text`` with every span wrapped in ``[FLAGGED:...]``."""
+    parts: List[str] = []
+    cursor = 0
+    for start, end in merge_spans(spans):
+        parts.append(text[cursor:start])
+        parts.append(f"{FLAG_PREFIX}{text[start:end]}{FLAG_SUFFIX}")
+        cursor = end
+    parts.append(text[cursor:])
+    return "".join(parts)
+
+
+def highlighted_paragraphs(
+    text: str,
+    spans: Iterable[Span],
+    max_chars: int = MAX_PARAGRAPH_CHARS,
+    window: int | None = None,
+) -> Iterator[str]:
+    """Yield escaped paragraph markup for ``text`` with ``spans`` flagged.
+
+    Paragraphs hold at most ``max_chars`` characters of the document unless a
+    flagged span would otherwise be cut. With ``window`` only that many
+    characters around each flagged span are rendered, and skipped text is
+    shown as ``[...]``.
+    """
+    if max_chars <= 0:
+        raise ValueError("max_chars must be positive.")
+
+    merged = merge_spans(spans)
+    span_index = 0
+    previous_end = 0
+
+    for range_start, range_end in _visible_ranges(len(text), merged, window):
+        if range_start > previous_end:
+            yield GAP_MARKER
+        previous_end = range_end
+
+        position = range_start
+        while position < range_end:
+            while span_index < len(merged) and merged[span_index][1] <= position:
+                span_index += 1
+            cut = _paragraph_end(text, position, range_end, merged, span_index, max_chars)
+            paragraph = _render(text, position, cut, merged, span_index)
+            if paragraph.strip():
+                yield paragraph
+            position = cut
+
+    if window is not None and merged and previous_end < len(text):
+        yield GAP_MARKER
+
+
+def _visible_ranges(length: int, merged: Sequence[Span], window: int | None) -> List[Span]:
+    if window is None:
+        return [(0, length)] if length else []
+    if window < 0:
+        raise ValueError("window must be non-negative.")
+
+    return merge_spans((max(0, start - window), min(length, end + window)) for start, end in merged)
+
+
+def _paragraph_end(
+    text: str,
+    start: int,
+    stop: int,
+    merged: Sequence[Span],
+    span_index: int,
+    max_chars: int,
+) -> int:
+    """Return where the paragraph starting at ``start`` ends, outside any flagged span."""
+    limit = min(stop, start + max_chars)
+    newline = text.find("\n", start, limit)
+    if newline != -1:
+        cut = newline + 1
+    elif limit < stop:
+        space = text.rfind(" ", start, limit)
+        cut = space + 1 if space > start else limit
+    else:
+        cut = limit
+
+    # Move the cut past a flagged span it would split.
+    index = span_index
+    while index < len(merged) and merged[index][0] < cut:
+        cut = max(cut, merged[index][1])
+        index += 1
+    return max(cut, start + 1)
+
+
+def _render(text: str, start: int, stop: int, merged: Sequence[Span], span_index: int) -> str:
+    parts: List[str] = []
+    cursor = start
+    index = span_index
+    while index < len(merged) and merged[index][0] < stop:
+        span_start, span_end = merged[index]
+        parts.append(_escape(text[cursor:span_start]))
+        parts.append(f"{FLAG_PREFIX}{_escape(text[span_start:span_end])}{FLAG_SUFFIX}")
+        cursor = span_end
+        index += 1
+    parts.append(_escape(text[cursor:stop]))
+    return "".join(parts)
+
+
+def _escape(text: str) -> str:
+    return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
@@ -0,0 +1,292 @@
+"""PDF risk audit report rendering, importable without the Streamlit UI."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import uuid
+from datetime import datetime
+from io import BytesIO
+from typing import Any, Dict, Iterable, Sequence
+
+from reportlab.graphics.barcode import qr
+from reportlab.graphics.shapes import Drawing, Group, Rect, String
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.styles import getSampleStyleSheet
+from reportlab.lib.units import inch
+from reportlab.platypus import (
+    PageBreak,
+    Paragraph,
+    SimpleDocTemplate,
+    Spacer,
+    Table,
+    TableStyle,
+)
+
+from explainable_ai.core.cache.lru_cache import LRUCache
+from explainable_ai.core.engine.keyword_matcher import ScanResult
+from explainable_ai.core.engine.rule_engine import Rule
+from explainable_ai.core.reporting import highlighter
+
+
+REPORT_CACHE_ENTRIES = int(os.getenv("REPORT_CACHE_SIZE", "16"))
+# Longer documents export only a window of context around each flagged keyword.
+REPORT_FULL_TEXT_MAX_CHARS = int(os.getenv("REPORT_FULL_TEXT_MAX_CHARS", "200000"))
+DEFAULT_HIGHLIGHT_WINDOW = 400
+
+HEATMAP_WIDTH = 6 * inch
+HEATMAP_HEIGHT = 2 * inch
+HEATMAP_LABEL_HEIGHT = 0.8 * inch
+# End points of matplotlib's "Reds" colour map, used by the earlier raster heatmap.
+HEATMAP_LOW = colors.HexColor("#fff5f0")
+HEATMAP_HIGH = colors.HexColor("#67000d")
+
+_REPORT_CACHE = LRUCache(max_entries=REPORT_CACHE_ENTRIES)
+
+
+def generate_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def highlight_text(text: str, failed_rules: Iterable[str], scan: ScanResult) -> str:
+    """Wrap every matched keyword span of ``failed_rules`` in ``[FLAGGED:...]``."""
+    return highlighter.highlight_text(text, scan.spans_for(failed_rules))
+
+
+def report_cache_key(
+    document_text: str,
+    rule_result: Dict[str, Any],
+    governance_action: str,
+    highlight_window: int | None = None,
+) -> str:
+    """Return the cache key of the report for one analysis."""
+    payload = json.dumps(
+        {
+            "document_hash": generate_hash(document_text),
+            "rule_result": rule_result,
+            "governance_action": governance_action,
+            "highlight_window": highlight_window,
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def get_pdf_report(
+    rule_result: Dict[str, Any],
+    governance_action: str,
+    confidence_vector: Dict[str, Any],
+    document_text: str,
+    scan: ScanResult,
+    rules: Sequence[Rule],
+    highlight_window: int | None = None,
+) -> bytes:
+    """Return the report PDF, rendering it only once per analysis.
+
+    Reports are cached by document hash, rule result (which carries the
+    policy digest) and governance action, so repeated downloads of the same
+    analysis return the first rendering, document id and timestamp included.
+    """
+    key = report_cache_key(document_text, rule_result, governance_action, highlight_window)
+    cached = _REPORT_CACHE.get(key)
+    if isinstance(cached, bytes):
+        return cached
+
+    report = generate_pdf_report(
+        rule_result=rule_result,
+        governance_action=governance_action,
+        confidence_vector=confidence_vector,
+        document_text=document_text,
+        scan=scan,
+        rules=rules,
+        highlight_window=highlight_window,
+    ).getvalue()
+    _REPORT_CACHE.put(key, report)
+    return report
+
+
+def heatmap_drawing(rule_ids: Sequence[str], values: Sequence[float]) -> Drawing:
+    """Draw one cell per rule, shaded from white to red by ``values``, as vector shapes."""
+    drawing = Drawing(HEATMAP_WIDTH, HEATMAP_HEIGHT)
+    if not values:
+        return drawing
+
+    low, high = min(values), max(values)
+    cell_width = HEATMAP_WIDTH / len(values)
+    font_size = max(3.0, min(7.0, cell_width * 0.8))
+
+    for index, (rule_id, value) in enumerate(zip(rule_ids, values)):
+        fraction = (value - low) / (high - low) if high > low else 0.0
+        x = index * cell_width
+        drawing.add(
+            Rect(
+                x,
+                HEATMAP_LABEL_HEIGHT,
+                cell_width,
+                HEATMAP_HEIGHT - HEATMAP_LABEL_HEIGHT,
+                fillColor=colors.linearlyInterpolatedColor(HEATMAP_LOW, HEATMAP_HIGH, 0.0, 1.0, fraction),
+                strokeColor=None,
+            )
+        )
+
+        label = Group(String(0, 0, str(rule_id), fontName="Helvetica", fontSize=font_size, textAnchor="end"))
+        label.translate(x + cell_width / 2, HEATMAP_LABEL_HEIGHT - 4)
+        label.rotate(45)
+        drawing.add(label)
+
+    return drawing
+
+
+def add_watermark_footer(canvas_obj: Any, doc: Any, document_id: str) -> None:
+
+    # -------- WATERMARK --------
+    canvas_obj.saveState()
+    canvas_obj.setFont("Helvetica", 60)
+    canvas_obj.setFillColorRGB(0.92, 0.92, 0.92)
+    canvas_obj.translate(300, 400)
+    canvas_obj.rotate(45)
+    canvas_obj.drawCentredString(0, 0, "CONFIDENTIAL")
+    canvas_obj.restoreState()
+
+    # -------- FOOTER --------
+    canvas_obj.saveState()
+    canvas_obj.setFont("Helvetica", 8)
+    canvas_obj.drawString(40, 20, f"Nexus Governance OS | Document ID: {document_id}")
+    canvas_obj.drawRightString(570, 20, f"Page {doc.page}")
+    canvas_obj.restoreState()
+
+
+def generate_pdf_report(
+    rule_result: Dict[str, Any],
+    governance_action: str,
+    confidence_vector: Dict[str, Any],
+    document_text: str,
+    scan: ScanResult,
+    rules: Sequence[Rule],
+    highlight_window: int | None = None,
+) -> BytesIO:
+    """Render the risk audit report and return it as a rewound PDF buffer.
+
+    The clause export shows the whole document, or only ``highlight_window``
+    characters around each flagged keyword; documents longer than
+    ``REPORT_FULL_TEXT_MAX_CHARS`` default to ``DEFAULT_HIGHLIGHT_WINDOW``.
+    """
+    buffer = BytesIO()
+    doc = SimpleDocTemplate(buffer, pagesize=letter)
+    styles = getSampleStyleSheet()
+    elements = []
+
+    timestamp = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S UTC")
+    document_hash = generate_hash(document_text)
+    document_id = str(uuid.uuid4())
+
+    verification_payload = json.dumps({
+        "product": "Nexus Governance OS",
+        "document_id": document_id,
+        "hash": document_hash,
+        "timestamp": timestamp,
+        "version": "prototype-v1"
+    }, separators=(",", ":"))
+
+    # HEADER
+    elements.append(Paragraph("Nexus Governance OS - Risk Audit Report", styles["Heading1"]))
+    elements.append(Spacer(1, 12))
+    elements.append(Paragraph(f"Document ID: {document_id}", styles["Normal"]))
+    elements.append(Paragraph(f"Generated: {timestamp}", styles["Normal"]))
+    elements.append(Paragraph(f"SHA-256 Hash: {document_hash}", styles["Normal"]))
+    elements.append(Spacer(1, 16))
+
+    # EXEC SUMMARY
+    elements.append(Paragraph("Executive Summary", styles["Heading2"]))
+    elements.append(Spacer(1, 8))
+    elements.append(Paragraph(f"Risk Level: {rule_result['deterministic_label']}", styles["Normal"]))
+    elements.append(Paragraph(f"Governance Action: {governance_action}", styles["Normal"]))
+    elements.append(Paragraph(f"Risk Score: {rule_result['eligibility_score']}", styles["Normal"]))
+    elements.append(Spacer(1, 16))
+
+    # CLAUSE TABLE
+    table_data = [["Clause ID", "Triggered", "Weight"]]
+    for rule in rules:
+        triggered = "Yes" if rule.id in rule_result["failed_rules"] else "No"
+        weight = rule.weight if triggered == "Yes" else "-"
+        table_data.append([rule.id, triggered, str(weight)])
+
+    table = Table(table_data)
+    table.setStyle(TableStyle([
+        ("BACKGROUND", (0, 0), (-1, 0), colors.grey),
+        ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
+        ("GRID", (0, 0), (-1, -1), 0.5, colors.grey),
+        ("ROWBACKGROUNDS", (0,1), (-1,-1), [colors.whitesmoke, colors.lightgrey]),
+    ]))
+
+    elements.append(table)
+    elements.append(Spacer(1, 20))
+
+    # HEATMAP (VECTOR SHAPES)
+    heat_values = [
+        rule.weight if rule.id in rule_result["failed_rules"] else 0
+        for rule in rules
+    ]
+
+    if any(heat_values):
+        elements.append(heatmap_drawing([rule.id for rule in rules], heat_values))
+        elements.append(Spacer(1, 20))
+
+    # DIGITAL SIGNATURE
+    elements.append(Paragraph("Digital Signature Validation", styles["Heading2"]))
+    elements.append(Spacer(1, 20))
+    elements.append(Paragraph("Digitally signed under internal governance controls.", styles["Normal"]))
+    elements.append(Spacer(1, 40))
+    elements.append(Paragraph("______________________________", styles["Normal"]))
+    elements.append(Paragraph("Authorized Compliance Officer", styles["Normal"]))
+
+    # HIGHLIGHTED EXPORT (PARAGRAPH-ALIGNED, MARKERS NEVER SPLIT)
+    elements.append(PageBreak())
+    elements.append(Paragraph("Highlighted Clause Export", styles["Heading1"]))
+    elements.append(Spacer(1, 12))
+
+    if highlight_window is None and len(document_text) > REPORT_FULL_TEXT_MAX_CHARS:
+        highlight_window = DEFAULT_HIGHLIGHT_WINDOW
+    if highlight_window is not None:
+        elements.append(Paragraph(
+            f"Showing {highlight_window} characters of context around each flagged keyword.",
+            styles["Italic"],
+        ))
+        elements.append(Spacer(1, 6))
+
+    for paragraph in highlighter.highlighted_paragraphs(
+        document_text,
+        scan.spans_for(rule_result["failed_rules"]),
+        window=highlight_window,
+    ):
+        elements.append(Paragraph(paragraph, styles["Normal"]))
+        elements.append(Spacer(1, 6))
+
+    # VERIFICATION PAGE
+    elements.append(PageBreak())
+    elements.append(Paragraph("Tamper Detection & Verification", styles["Heading1"]))
+    elements.append(Spacer(1, 12))
+    elements.append(Paragraph(f"Document Hash: {document_hash}", styles["Normal"]))
+    elements.append(Paragraph(f"Document ID: {document_id}", styles["Normal"]))
+    elements.append(Spacer(1, 20))
+
+    # QR (Correct Flowable)
+    qr_code = qr.QrCodeWidget(verification_payload)
+    bounds = qr_code.getBounds()
+    size = 2 * inch
+    scale = size / (bounds[2] - bounds[0])
+    drawing = Drawing(size, size, transform=[scale, 0, 0, scale, 0, 0])
+    drawing.add(qr_code)
+    elements.append(drawing)
+
+    doc.build(
+        elements,
+        onFirstPage=lambda c, d: add_watermark_footer(c, d, document_id),
+        onLaterPages=lambda c, d: add_watermark_footer(c, d, document_id)
+    )
+
+    buffer.seek(0)
+    return buffer
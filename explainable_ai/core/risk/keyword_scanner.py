@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from typing import Dict, List
 
+from explainable_ai.core.engine.keyword_matcher import ScanResult
+
 
 DANGEROUS_KEYWORDS = [
     "indemnification",
@@ -15,13 +17,26 @@ DANGEROUS_KEYWORDS = [
     "perpetual license",
 ]
 
+# Rule id under which the shared document scan reports hard-gate keywords.
+HARD_GATE_RULE_ID = "keyword_hard_gate"
+
+
+def scan_for_risks(text: str, scan: ScanResult | None = None) -> dict:
+    """Scan input text for predefined risky contract keywords.
 
-def scan_for_risks(text: str) -> dict:
-    """Scan input text for predefined risky contract keywords."""
-    source_text = text.lower() if isinstance(text, str) else ""
-    found_keywords: List[str] = [
-        keyword for keyword in DANGEROUS_KEYWORDS if keyword in source_text
-    ]
+    When ``scan`` is provided, hard-gate hits are read from that shared
+    document scan instead of searching ``text`` again.
+    """
+    if scan is not None:
+        matched = scan.keywords_for(HARD_GATE_RULE_ID)
+        found_keywords: List[str] = [
+            keyword for keyword in DANGEROUS_KEYWORDS if keyword in matched
+        ]
+    else:
+        source_text = text.lower() if isinstance(text, str) else ""
+        found_keywords = [
+            keyword for keyword in DANGEROUS_KEYWORDS if keyword in source_text
+        ]
 
     result: Dict[str, List[str] | int] = {
         "risk_keywords_found": found_keywords,
@@ -4,6 +4,9 @@ from __future__ import annotations
 
 from typing import Any, Dict, List
 
+import numpy as np
+from numpy.typing import ArrayLike
+
 
 def calculate_confidence_vector(
     passed_rules: list,
@@ -26,19 +29,53 @@ def calculate_confidence_vector(
         data_completeness=data_completeness,
     )
 
-    rules_evaluated = len(passed_rules) + len(failed_rules)
+    columns = calculate_confidence_vectors(
+        passed_counts=[len(passed_rules)],
+        failed_counts=[len(failed_rules)],
+        total_rules=total_rules,
+        retrieval_similarity=[retrieval_similarity],
+        data_completeness=[data_completeness],
+    )
+    return {name: int(column[0]) for name, column in columns.items()}
+
 
-    rule_confidence = _to_percentage((rules_evaluated / total_rules) * 100.0)
-    retrieval_confidence = _to_percentage(retrieval_similarity * 100.0)
-    completeness_confidence = _to_percentage(data_completeness * 100.0)
+def calculate_confidence_vectors(
+    passed_counts: ArrayLike,
+    failed_counts: ArrayLike,
+    total_rules: int,
+    retrieval_similarity: ArrayLike,
+    data_completeness: ArrayLike,
+) -> Dict[str, np.ndarray]:
+    """Calculate confidence vectors for many decisions at once.
+
+    Takes per-decision passed and failed rule counts; scalar arguments
+    broadcast against them. Returns one int64 column per confidence
+    component, matching :func:`calculate_confidence_vector` row by row.
+    """
+    passed, failed, retrieval, completeness = np.broadcast_arrays(
+        np.asarray(passed_counts, dtype=np.int64),
+        np.asarray(failed_counts, dtype=np.int64),
+        np.asarray(retrieval_similarity, dtype=np.float64),
+        np.asarray(data_completeness, dtype=np.float64),
+    )
+    _validate_batch_inputs(passed, failed, total_rules, retrieval, completeness)
+
+    rules_evaluated = passed + failed
 
     return {
-        "rule_confidence": rule_confidence,
-        "retrieval_confidence": retrieval_confidence,
-        "data_completeness": completeness_confidence,
+        "rule_confidence": _to_percentages((rules_evaluated / total_rules) * 100.0),
+        "retrieval_confidence": _to_percentages(retrieval * 100.0),
+        "data_completeness": _to_percentages(completeness * 100.0),
     }
 
 
+def invalid_confidence_rows(retrieval_similarity: ArrayLike, data_completeness: ArrayLike) -> np.ndarray:
+    """Return a mask of rows whose similarity or completeness lies outside 0-1 (or is NaN)."""
+    retrieval = np.asarray(retrieval_similarity, dtype=np.float64)
+    completeness = np.asarray(data_completeness, dtype=np.float64)
+    return ~((retrieval >= 0.0) & (retrieval <= 1.0)) | ~((completeness >= 0.0) & (completeness <= 1.0))
+
+
 def _validate_inputs(
     passed_rules: List[Any],
     failed_rules: List[Any],
@@ -74,6 +111,32 @@ def _validate_inputs(
         raise ValueError("data_completeness must be between 0 and 1.")
 
 
-def _to_percentage(value: float) -> int:
-    """Round to nearest integer and bound output to 0-100."""
-    return max(0, min(100, int(round(value))))
+def _validate_batch_inputs(
+    passed: np.ndarray,
+    failed: np.ndarray,
+    total_rules: int,
+    retrieval: np.ndarray,
+    completeness: np.ndarray,
+) -> None:
+    if not isinstance(total_rules, int):
+        raise TypeError("total_rules must be an integer.")
+
+    if total_rules <= 0:
+        raise ValueError("total_rules must be greater than 0.")
+
+    if (passed < 0).any() or (failed < 0).any():
+        raise ValueError("Rule counts must be non-negative.")
+
+    if (passed + failed > total_rules).any():
+        raise ValueError("Evaluated rule count cannot exceed total_rules.")
+
+    if not ((retrieval >= 0.0) & (retrieval <= 1.0)).all():
+        raise ValueError("retrieval_similarity must be between 0 and 1.")
+
+    if not ((completeness >= 0.0) & (completeness <= 1.0)).all():
+        raise ValueError("data_completeness must be between 0 and 1.")
+
+
+def _to_percentages(values: np.ndarray) -> np.ndarray:
+    """Round to nearest integer (half to even, like ``round``) and bound output to 0-100."""
+    return np.clip(np.rint(values), 0, 100).astype(np.int64)
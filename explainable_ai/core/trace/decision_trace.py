@@ -2,18 +2,124 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List
+import hashlib
+from typing import Any, Dict, Iterator, List, Tuple
+
+
+class DecisionTrace:
+    """Decision timeline stored as its inputs and expanded into steps on demand.
+
+    Iterating yields the same step dicts :func:`generate_decision_trace`
+    returns, built one at a time; nothing is expanded until the trace is
+    serialised. Steps added with :meth:`append` follow the built-in ones.
+    """
+
+    __slots__ = (
+        "input_data",
+        "passed_rules",
+        "failed_rules",
+        "eligibility_score",
+        "confidence_vector",
+        "governance_decision",
+        "extra_steps",
+    )
 
+    def __init__(
+        self,
+        input_data: Dict[str, Any],
+        passed_rules: Tuple[str, ...],
+        failed_rules: Tuple[str, ...],
+        eligibility_score: int,
+        confidence_vector: Dict[str, Any],
+        governance_decision: str,
+        extra_steps: List[Dict[str, Any]] | None = None,
+    ) -> None:
+        self.input_data = input_data
+        self.passed_rules = passed_rules
+        self.failed_rules = failed_rules
+        self.eligibility_score = eligibility_score
+        self.confidence_vector = confidence_vector
+        self.governance_decision = governance_decision
+        self.extra_steps = extra_steps if extra_steps is not None else []
+
+    def append(self, step: Dict[str, Any]) -> None:
+        self.extra_steps.append(step)
+
+    def __len__(self) -> int:
+        return 5 + len(self.passed_rules) + len(self.failed_rules) + len(self.extra_steps)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return self._steps(document_reference=False)
+
+    def to_list(self, document_reference: bool = False) -> List[Dict[str, Any]]:
+        """Expand the trace for a response.
+
+        With ``document_reference`` the input step carries the document's
+        SHA-256 and length instead of echoing its text.
+        """
+        return list(self._steps(document_reference))
+
+    def to_state(self) -> Dict[str, Any]:
+        """Return a JSON-serialisable form accepted by :meth:`from_state`."""
+        return {
+            "input_data": self.input_data,
+            "passed_rules": list(self.passed_rules),
+            "failed_rules": list(self.failed_rules),
+            "eligibility_score": self.eligibility_score,
+            "confidence_vector": self.confidence_vector,
+            "governance_decision": self.governance_decision,
+            "extra_steps": self.extra_steps,
+        }
 
-def generate_decision_trace(
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> "DecisionTrace":
+        return cls(
+            input_data=state["input_data"],
+            passed_rules=tuple(state["passed_rules"]),
+            failed_rules=tuple(state["failed_rules"]),
+            eligibility_score=state["eligibility_score"],
+            confidence_vector=state["confidence_vector"],
+            governance_decision=state["governance_decision"],
+            extra_steps=list(state["extra_steps"]),
+        )
+
+    def _steps(self, document_reference: bool) -> Iterator[Dict[str, Any]]:
+        input_value = reference_document(self.input_data) if document_reference else dict(self.input_data)
+        yield {"step": "Input Received", "value": input_value}
+
+        for rule_id in self.passed_rules:
+            yield {"step": "Keyword Risk Scan", "rule_id": rule_id, "result": "PASS"}
+
+        for rule_id in self.failed_rules:
+            yield {"step": "Keyword Risk Scan", "rule_id": rule_id, "result": "FAIL"}
+
+        yield {"step": "Score Computed", "value": self.eligibility_score}
+        yield {"step": "Confidence Vector", "value": dict(self.confidence_vector)}
+        yield {"step": "Governance Decision", "value": self.governance_decision}
+        yield {"step": "Final Decision", "value": self.governance_decision}
+        yield from self.extra_steps
+
+
+def reference_document(input_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Return ``input_data`` with ``document_text`` replaced by its hash and length."""
+    referenced = dict(input_data)
+    document_text = referenced.pop("document_text", None)
+    if isinstance(document_text, str):
+        digest = hashlib.sha256(document_text.encode("utf-8", "surrogatepass")).hexdigest()
+        referenced["document_sha256"] = digest
+        referenced["document_length"] = len(document_text)
+    return referenced
+
+
+def build_decision_trace(
     input_data: dict,
     passed_rules: list,
     failed_rules: list,
     eligibility_score: int,
     confidence_vector: dict,
     governance_decision: str,
-) -> list:
-    """Generate an ordered, human-readable timeline of decision steps."""
+) -> DecisionTrace:
+    """Return the decision timeline as a compact, lazily expanded :class:`DecisionTrace`."""
     _validate_inputs(
         input_data=input_data,
         passed_rules=passed_rules,
@@ -23,37 +129,33 @@ def generate_decision_trace(
         governance_decision=governance_decision,
     )
 
-    timeline: List[Dict[str, Any]] = [
-        {
-            "step": "Input Received",
-            "value": dict(input_data),
-        }
-    ]
-
-    for rule_id in passed_rules:
-        timeline.append(
-            {
-                "step": "Keyword Risk Scan",
-                "rule_id": str(rule_id),
-                "result": "PASS",
-            }
-        )
-
-    for rule_id in failed_rules:
-        timeline.append(
-            {
-                "step": "Keyword Risk Scan",
-                "rule_id": str(rule_id),
-                "result": "FAIL",
-            }
-        )
+    return DecisionTrace(
+        input_data=dict(input_data),
+        passed_rules=tuple(str(rule_id) for rule_id in passed_rules),
+        failed_rules=tuple(str(rule_id) for rule_id in failed_rules),
+        eligibility_score=int(eligibility_score),
+        confidence_vector=dict(confidence_vector),
+        governance_decision=governance_decision,
+    )
 
-    timeline.append({"step": "Score Computed", "value": int(eligibility_score)})
-    timeline.append({"step": "Confidence Vector", "value": dict(confidence_vector)})
-    timeline.append({"step": "Governance Decision", "value": governance_decision})
-    timeline.append({"step": "Final Decision", "value": governance_decision})
 
-    return timeline
+def generate_decision_trace(
+    input_data: dict,
+    passed_rules: list,
+    failed_rules: list,
+    eligibility_score: int,
+    confidence_vector: dict,
+    governance_decision: str,
+) -> list:
+    """Generate an ordered, human-readable timeline of decision steps."""
+    return build_decision_trace(
+        input_data=input_data,
+        passed_rules=passed_rules,
+        failed_rules=failed_rules,
+        eligibility_score=eligibility_score,
+        confidence_vector=confidence_vector,
+        governance_decision=governance_decision,
+    ).to_list()
 
 
 def _validate_inputs(
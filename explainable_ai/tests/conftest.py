@@ -0,0 +1,66 @@
+"""Shared fixtures for the test suite."""
+
+from __future__ import annotations
+
+import os
+import random
+import shutil
+import tempfile
+from pathlib import Path
+from typing import List
+
+import pytest
+
+# Bound at import by the audit modules, so set before anything imports them;
+# keeps API tests from writing to the shipped logs directory.
+AUDIT_LOG_DIR = Path(tempfile.mkdtemp(prefix="audit-tests-"))
+os.environ["AUDIT_LOG_DIR"] = str(AUDIT_LOG_DIR)
+
+from explainable_ai.core.engine import keyword_matcher
+from explainable_ai.core.engine.rule_engine import RuleEngine
+
+
+# Overlapping keywords across rules, plus hard-gate keywords ("net 90",
+# "indemnification") shared with the built-in keyword scanner.
+TEST_POLICY = """
+rules:
+  - id: indemnification
+    keywords: ["indemnify", "indemnification", "hold harmless"]
+    weight: 30
+  - id: payment_delay
+    keywords: ["net 90", "net 9"]
+    weight: 15
+  - id: harm
+    keywords: ["harm", "less"]
+    weight: 20
+"""
+
+_DOCUMENT_WORDS = (
+    "indemnify", "indemnification", "hold harmless", "net 90", "net 9", "harm", "less",
+    "exclusivity", "NET 90", "Hold Harmless", "İstanbul", "clause", "\n", " ", ".",
+)
+
+
+@pytest.fixture(params=["substring", "automaton"])
+def rule_engine(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> RuleEngine:
+    """A rule engine for ``TEST_POLICY``, once per keyword search strategy."""
+    threshold = 0 if request.param == "automaton" else 10**9
+    monkeypatch.setattr(keyword_matcher, "KEYWORD_AUTOMATON_MIN_KEYWORDS", threshold)
+    return RuleEngine(Path("test_rules.yaml"), policy_source=TEST_POLICY.encode("utf-8"))
+
+
+@pytest.fixture
+def random_documents() -> List[str]:
+    """Seeded documents mixing policy keywords, case variants and line breaks."""
+    rng = random.Random(7)
+    return [
+        "".join(rng.choice(_DOCUMENT_WORDS) for _ in range(rng.randint(0, 60)))
+        for _ in range(200)
+    ]
+
+
+def pytest_sessionfinish(session: pytest.Session, exitstatus: int) -> None:
+    from explainable_ai.core.audit.audit_writer import close_audit_writers
+
+    close_audit_writers()
+    shutil.rmtree(AUDIT_LOG_DIR, ignore_errors=True)
@@ -0,0 +1,123 @@
+"""Decision lookups through the audit index, from the writer to the API."""
+
+from __future__ import annotations
+
+import shutil
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+from fastapi.testclient import TestClient
+
+from explainable_ai.api import routes
+from explainable_ai.api.routes import app
+from explainable_ai.core.audit.audit_index import INDEX_FILE_NAME
+from explainable_ai.core.audit.audit_reader import list_segments, read_record, rebuild_index, update_index
+from explainable_ai.core.audit.audit_writer import close_audit_writers, get_audit_writer
+
+
+def _entry(decision_id: str) -> Dict[str, Any]:
+    return {
+        "decision_id": decision_id,
+        "timestamp_utc": datetime.utcnow().isoformat(),
+        "input_data": {"document_length": 12},
+        "deterministic_label": "LOW_RISK",
+        "governance_decision": "APPROVED",
+    }
+
+
+def _write(directory: Path, decision_ids: List[str]) -> None:
+    writer = get_audit_writer(directory)
+    for decision_id in decision_ids:
+        writer.write(_entry(decision_id))
+    close_audit_writers()
+
+
+def _copy_segments(source: Path, target: Path) -> None:
+    target.mkdir()
+    for segment in list_segments(source):
+        shutil.copy(segment, target / segment.name)
+
+
+def test_written_records_are_found_by_id(tmp_path: Path) -> None:
+    decision_ids = [f"decision-{index}" for index in range(50)]
+    _write(tmp_path, decision_ids)
+
+    for decision_id in decision_ids:
+        record = read_record(decision_id, tmp_path)
+        assert record is not None and record["decision_id"] == decision_id
+    assert read_record("unknown", tmp_path) is None
+
+
+def test_update_index_picks_up_unindexed_records(tmp_path: Path) -> None:
+    source = tmp_path / "source"
+    _write(source, ["first", "second"])
+    copy = tmp_path / "copy"
+    _copy_segments(source, copy)
+    assert not (copy / INDEX_FILE_NAME).exists()
+
+    assert read_record("first", copy) is None
+    assert update_index(copy) == 2
+    assert read_record("first", copy)["decision_id"] == "first"
+    # Already-indexed bytes are not read again.
+    assert update_index(copy) == 0
+
+
+def test_update_index_reads_only_appended_records(tmp_path: Path) -> None:
+    _write(tmp_path, ["first"])
+    legacy = tmp_path / "decisions.jsonl"
+    legacy.write_text('{"decision_id": "legacy"}\nnot json\n', encoding="utf-8")
+
+    assert update_index(tmp_path) == 1
+    with legacy.open("a", encoding="utf-8") as file:
+        file.write('{"decision_id": "appended"}\n')
+    assert update_index(tmp_path) == 1
+    assert read_record("legacy", tmp_path)["decision_id"] == "legacy"
+    assert read_record("appended", tmp_path)["decision_id"] == "appended"
+
+
+def test_rebuild_index_reindexes_every_record(tmp_path: Path) -> None:
+    _write(tmp_path, ["first", "second", "third"])
+
+    assert rebuild_index(tmp_path) == 3
+    assert read_record("second", tmp_path)["decision_id"] == "second"
+
+
+def test_decision_lookup_endpoint() -> None:
+    with TestClient(app) as client:
+        response = client.post("/evaluate", json={"document_text": "Payment terms are net 90."})
+        assert response.status_code == 200
+        decision_id = response.json()["decision_id"]
+        close_audit_writers()
+
+        found = client.get(f"/decisions/{decision_id}")
+        assert found.status_code == 200
+        assert found.json()["decision_id"] == decision_id
+        assert client.get("/decisions/unknown").status_code == 404
+
+
+def test_clause_pages_segment_the_document_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    document_text = "".join(f"  Clause {index} requires net 90.\n\n" for index in range(25))
+    segmentations = []
+    segment_clauses = routes.segment_clauses
+    monkeypatch.setattr(
+        routes,
+        "segment_clauses",
+        lambda text: segmentations.append(len(text)) or segment_clauses(text),
+    )
+
+    with TestClient(app) as client:
+        decision_id = client.post("/evaluate", json={"document_text": document_text}).json()["decision_id"]
+        close_audit_writers()
+
+        pages = [
+            client.get(f"/decisions/{decision_id}/clauses", params={"offset": offset, "limit": 10}).json()
+            for offset in (0, 10, 20)
+        ]
+
+    assert len(segmentations) == 1
+    assert [page["total"] for page in pages] == [25, 25, 25]
+    clauses = [clause for page in pages for clause in page["clauses"]]
+    assert [clause["text"] for clause in clauses] == [f"Clause {index} requires net 90." for index in range(25)]
+    assert all(document_text[clause["start"] : clause["end"]] == clause["text"] for clause in clauses)
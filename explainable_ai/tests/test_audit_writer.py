@@ -0,0 +1,116 @@
+"""The audit writer must survive I/O failures without losing or blocking on records."""
+
+from __future__ import annotations
+
+import shutil
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from threading import Event
+from typing import Any, Dict
+
+import pytest
+
+from explainable_ai.core.audit import audit_writer
+from explainable_ai.core.audit.audit_reader import read_record
+from explainable_ai.core.audit.audit_summary import partition_key
+from explainable_ai.core.audit.audit_writer import AuditWriter
+
+
+def _entry(decision_id: str, moment: datetime | None = None) -> Dict[str, Any]:
+    return {
+        "decision_id": decision_id,
+        "timestamp_utc": (moment or datetime.utcnow()).isoformat(),
+        "governance_decision": "APPROVED",
+    }
+
+
+def _wait_until_written(writer: AuditWriter) -> None:
+    deadline = time.monotonic() + 5.0
+    while not writer._queue.empty() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    # Let the writer finish the batch it took off the queue.
+    time.sleep(0.1)
+
+
+def test_writer_recovers_after_its_directory_is_removed(tmp_path: Path) -> None:
+    directory = tmp_path / "audit"
+    writer = AuditWriter(directory, fsync_interval_seconds=0.05)
+    writer.write(_entry("before"))
+    _wait_until_written(writer)
+
+    shutil.rmtree(directory)
+    writer.write(_entry("after", datetime.utcnow() + timedelta(days=2)))
+    _wait_until_written(writer)
+
+    assert writer._thread is not None and writer._thread.is_alive()
+    writer.close()
+    assert read_record("after", directory)["decision_id"] == "after"
+
+
+def test_records_for_an_unopenable_segment_are_spilled(tmp_path: Path) -> None:
+    writer = AuditWriter(tmp_path, fsync_interval_seconds=0.05)
+    writer.write(_entry("first"))
+    _wait_until_written(writer)
+
+    moment = datetime.utcnow() + timedelta(days=2)
+    writer.segment_path(partition_key(moment.isoformat(), writer.partition_granularity)).mkdir()
+    writer.write(_entry("blocked", moment))
+    writer.write(_entry("later"))
+    _wait_until_written(writer)
+
+    assert writer._thread is not None and writer._thread.is_alive()
+    writer.close()
+    for decision_id in ("first", "blocked", "later"):
+        assert read_record(decision_id, tmp_path)["decision_id"] == decision_id
+
+
+def test_dead_writer_thread_is_restarted(tmp_path: Path) -> None:
+    writer = AuditWriter(tmp_path, fsync_interval_seconds=0.05)
+    writer.write(_entry("first"))
+    writer._queue.put(audit_writer._STOP)
+    writer._thread.join(5.0)
+
+    writer.write(_entry("second"))
+
+    assert writer._thread.is_alive()
+    writer.close()
+    assert read_record("second", tmp_path)["decision_id"] == "second"
+
+
+def test_close_spills_records_a_dead_writer_left_queued(tmp_path: Path) -> None:
+    writer = AuditWriter(tmp_path, fsync_interval_seconds=0.05)
+    writer.write(_entry("first"))
+    writer._queue.put(audit_writer._STOP)
+    writer._thread.join(5.0)
+    writer._queue.put(_entry("stranded"))
+
+    started = time.monotonic()
+    writer.close()
+
+    assert time.monotonic() - started < 1.0
+    assert read_record("stranded", tmp_path)["decision_id"] == "stranded"
+
+
+def test_rotation_summaries_do_not_stall_commits(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    release = Event()
+    summarised = []
+
+    def slow_summary(segment: Path, partition: str) -> None:
+        release.wait(5.0)
+        summarised.append(segment.name)
+
+    monkeypatch.setattr(audit_writer, "write_summary", slow_summary)
+    writer = AuditWriter(tmp_path, fsync_interval_seconds=0.05)
+    writer.write(_entry("first"))
+    _wait_until_written(writer)
+
+    # Rotating to another partition seals the first segment.
+    writer.write(_entry("rotated", datetime.utcnow() + timedelta(days=2)))
+    _wait_until_written(writer)
+
+    assert read_record("rotated", tmp_path)["decision_id"] == "rotated"
+    assert summarised == []
+    release.set()
+    writer.close()
+    assert len(summarised) == 2
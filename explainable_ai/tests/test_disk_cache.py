@@ -0,0 +1,42 @@
+"""The disk cache tier must not leave partial writes behind."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from explainable_ai.core.cache.disk_cache import DiskCache
+
+
+def _files(directory: Path) -> List[str]:
+    return sorted(path.name for path in directory.rglob("*") if path.is_file())
+
+
+def test_values_round_trip(tmp_path: Path) -> None:
+    cache = DiskCache(tmp_path)
+    cache.put("key", {"decision": "APPROVED", "scores": [1, 2]})
+
+    assert cache.get("key") == {"decision": "APPROVED", "scores": [1, 2]}
+    assert cache.get("missing", "default") == "default"
+    assert all(name.endswith(".json") for name in _files(tmp_path))
+
+
+def test_unserialisable_value_leaves_no_temporary_file(tmp_path: Path) -> None:
+    cache = DiskCache(tmp_path)
+    cache.put("key", {"value": object()})
+
+    assert cache.get("key") is None
+    assert _files(tmp_path) == []
+
+
+def test_failed_replace_leaves_no_temporary_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    def failing_replace(source: str, target: Path) -> None:
+        raise OSError("disk full")
+
+    monkeypatch.setattr(os, "replace", failing_replace)
+    DiskCache(tmp_path).put("key", {"value": 1})
+
+    assert _files(tmp_path) == []
@@ -0,0 +1,29 @@
+"""Documents the JSON parser accepts must also be hashable for caches and traces."""
+
+from __future__ import annotations
+
+from fastapi.testclient import TestClient
+
+from explainable_ai.api.routes import app
+from explainable_ai.core.engine.result_cache import result_cache_key
+from explainable_ai.core.engine.revision_store import document_hash
+from explainable_ai.core.trace.decision_trace import reference_document
+
+
+# JSON allows unpaired surrogate escapes, which Python decodes to lone surrogates.
+LONE_SURROGATE_TEXT = "Payment terms are net 90. \ud800"
+
+
+def test_lone_surrogates_are_hashed() -> None:
+    assert document_hash(LONE_SURROGATE_TEXT) != document_hash(LONE_SURROGATE_TEXT[:-1])
+    assert result_cache_key(LONE_SURROGATE_TEXT, "digest", False).endswith(":digest:0")
+    assert reference_document({"document_text": LONE_SURROGATE_TEXT})["document_length"] == len(LONE_SURROGATE_TEXT)
+
+
+def test_evaluate_accepts_lone_surrogates() -> None:
+    body = b'{"document_text": "Payment terms are net 90. \\ud800", "trace_document": "hash", "track_revision": true}'
+    with TestClient(app) as client:
+        response = client.post("/evaluate", content=body, headers={"Content-Type": "application/json"})
+
+    assert response.status_code == 200
+    assert response.json()["decision"] == "REVIEW_REQUIRED"
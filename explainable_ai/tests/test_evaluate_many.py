@@ -0,0 +1,76 @@
+"""Batch evaluation must agree with evaluating each document on its own."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import List
+
+import numpy as np
+import pytest
+
+from explainable_ai.core.engine.rule_engine import RuleEngine
+from explainable_ai.core.engine.rule_hit_matrix import RuleHitMatrix
+
+
+def _assert_matches_evaluate(engine: RuleEngine, documents: List[str], matrix: RuleHitMatrix) -> None:
+    assert len(matrix) == len(documents)
+    scores = matrix.scores()
+    labels = matrix.labels()
+    for row, document in enumerate(documents):
+        expected = engine.evaluate(document)
+        assert matrix.failed_rules(row) == expected["failed_rules"]
+        assert matrix.passed_rules(row) == expected["passed_rules"]
+        assert int(scores[row]) == expected["eligibility_score"]
+        assert labels[row] == expected["deterministic_label"]
+
+
+def test_evaluate_many_matches_looped_evaluate(rule_engine: RuleEngine, random_documents: List[str]) -> None:
+    matrix = rule_engine.evaluate_many(iter(random_documents))
+
+    _assert_matches_evaluate(rule_engine, random_documents, matrix)
+    assert matrix.policy_digest == rule_engine.policy_digest
+    assert matrix.rule_hit_counts() == {
+        rule.id: sum(rule.id in rule_engine.evaluate(document)["failed_rules"] for document in random_documents)
+        for rule in rule_engine.rules
+    }
+
+
+def test_evaluate_many_packs_more_than_eight_rules() -> None:
+    policy = "rules:\n" + "".join(
+        f"  - id: rule_{index}\n    keywords: [term{index}x]\n    weight: {index + 1}\n"
+        for index in range(11)
+    )
+    engine = RuleEngine(Path("wide_rules.yaml"), policy_source=policy.encode("utf-8"))
+    documents = ["", "term0x term10x", "TERM7X and term8x", " ".join(f"term{index}x" for index in range(11))]
+
+    matrix = engine.evaluate_many(documents)
+
+    assert matrix.packed.shape == (len(documents), 2)
+    _assert_matches_evaluate(engine, documents, matrix)
+
+
+def test_matrix_round_trips_through_npz(rule_engine: RuleEngine, random_documents: List[str], tmp_path: Path) -> None:
+    matrix = rule_engine.evaluate_many(random_documents)
+    path = tmp_path / "hits.npz"
+
+    matrix.save(path)
+    loaded = RuleHitMatrix.load(path)
+
+    assert loaded.rule_ids == matrix.rule_ids
+    assert loaded.policy_digest == matrix.policy_digest
+    np.testing.assert_array_equal(loaded.packed, matrix.packed)
+    np.testing.assert_array_equal(loaded.scores(), matrix.scores())
+
+
+def test_evaluate_many_of_nothing_is_empty(rule_engine: RuleEngine) -> None:
+    matrix = rule_engine.evaluate_many([])
+
+    assert len(matrix) == 0
+    assert matrix.packed.shape == (0, 1)
+    assert matrix.scores().shape == (0,)
+    assert matrix.rule_hit_counts() == {rule.id: 0 for rule in rule_engine.rules}
+
+
+def test_evaluate_many_rejects_non_strings(rule_engine: RuleEngine) -> None:
+    with pytest.raises(TypeError):
+        rule_engine.evaluate_many(["net 90", b"net 90"])
@@ -0,0 +1,100 @@
+"""Chunked scanning must find keywords split across chunk boundaries."""
+
+from __future__ import annotations
+
+import random
+from pathlib import Path
+from typing import List, Set
+
+import pytest
+
+from explainable_ai.core.engine.keyword_matcher import KeywordMatcher
+from explainable_ai.core.engine.rule_engine import RuleEngine, _ChunkLowercaser
+
+
+KEYWORDS = ["net 90", "net 9", "hold harmless", "harm", "less", "ss"]
+
+
+def _split(text: str, rng: random.Random) -> List[str]:
+    cuts = sorted(rng.sample(range(len(text) + 1), min(len(text) + 1, rng.randint(0, 8))))
+    bounds = [0] + cuts + [len(text)]
+    return [text[start:stop] for start, stop in zip(bounds, bounds[1:])]
+
+
+def _completed_in(text: str, chunk_start: int, chunk_end: int) -> Set[int]:
+    """Keyword indexes with an occurrence ending inside ``text[chunk_start:chunk_end]``."""
+    return {
+        index
+        for index, keyword in enumerate(KEYWORDS)
+        for end in range(chunk_start + 1, chunk_end + 1)
+        if end >= len(keyword) and text.startswith(keyword, end - len(keyword))
+    }
+
+
+@pytest.mark.parametrize("use_automaton", [False, True])
+def test_match_stream_reports_keywords_in_the_chunk_completing_them(use_automaton: bool) -> None:
+    rng = random.Random(4)
+    matcher = KeywordMatcher(KEYWORDS, use_automaton=use_automaton)
+
+    for _ in range(300):
+        text = "".join(rng.choice(["net 9", "0", " hold ", "harm", "less", "s", " "]) for _ in range(12))
+        stream = matcher.stream()
+        position = 0
+        for chunk in _split(text, rng):
+            assert stream.feed(chunk) == _completed_in(text, position, position + len(chunk))
+            position += len(chunk)
+
+
+@pytest.mark.parametrize("use_automaton", [False, True])
+def test_match_stream_handles_one_character_chunks(use_automaton: bool) -> None:
+    stream = KeywordMatcher(KEYWORDS, use_automaton=use_automaton).stream()
+    found: Set[int] = set()
+    for char in "pay net 90 and hold harmless":
+        found |= stream.feed(char)
+    assert found == set(range(len(KEYWORDS)))
+
+
+def test_evaluate_stream_matches_evaluate(rule_engine: RuleEngine, random_documents: List[str]) -> None:
+    rng = random.Random(5)
+    for document in random_documents:
+        assert rule_engine.evaluate_stream(_split(document, rng)) == rule_engine.evaluate(document)
+        assert rule_engine.evaluate_stream(iter(document)) == rule_engine.evaluate(document)
+
+
+def test_evaluate_stream_rejects_non_string_chunks(rule_engine: RuleEngine) -> None:
+    with pytest.raises(TypeError):
+        rule_engine.evaluate_stream(["net", b" 90"])
+
+
+# Capital sigma lowercases to final sigma at the end of a word, looking past
+# case-ignorable characters such as apostrophes and combining accents.
+GREEK_POLICY = """
+rules:
+  - id: term
+    keywords: ["όρος", "ορος"]
+    weight: 40
+  - id: sigma
+    keywords: ["σα"]
+    weight: 10
+"""
+_GREEK_WORDS = ("ΟΡΟΣ", "ΌΡΟΣ", "ΟΡΟ", "Σ", "ΣΑ", "Α", "'", ".", "\u0301", " ", "a")
+
+
+def test_chunk_lowercasing_matches_whole_text_lowercasing() -> None:
+    rng = random.Random(6)
+    for _ in range(2000):
+        text = "".join(rng.choice(_GREEK_WORDS) for _ in range(rng.randint(0, 10)))
+        lowercaser = _ChunkLowercaser()
+        lowered = "".join(lowercaser.feed(chunk) for chunk in _split(text, rng)) + lowercaser.flush()
+        assert lowered == text.lower()
+
+
+def test_evaluate_stream_matches_evaluate_on_final_sigma() -> None:
+    engine = RuleEngine(Path("greek_rules.yaml"), policy_source=GREEK_POLICY.encode("utf-8"))
+    assert engine.evaluate_stream(["ΟΡΟ", "Σ."])["failed_rules"] == ["term"]
+    assert engine.evaluate_stream(["ΟΡΟΣ", "Α"])["failed_rules"] == ["sigma"]
+
+    rng = random.Random(8)
+    for _ in range(500):
+        document = "".join(rng.choice(_GREEK_WORDS) for _ in range(rng.randint(0, 12)))
+        assert engine.evaluate_stream(_split(document, rng)) == engine.evaluate(document)
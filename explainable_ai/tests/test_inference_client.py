@@ -0,0 +1,167 @@
+"""Circuit breaker state transitions and the retrying client around it."""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List
+
+import pytest
+import requests
+
+from explainable_ai.core.explanation.inference_client import (
+    STATE_CLOSED,
+    STATE_HALF_OPEN,
+    STATE_OPEN,
+    CircuitBreaker,
+    InferenceClient,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeResponse:
+    def __init__(self, status_code: int, body: Any = None) -> None:
+        self.status_code = status_code
+        self._body = body
+
+    def json(self) -> Any:
+        if self._body is None:
+            raise ValueError("no JSON body")
+        return self._body
+
+
+class StubSession:
+    """Stands in for ``requests.Session``, replaying scripted outcomes."""
+
+    def __init__(self, outcomes: List[Any]) -> None:
+        self.outcomes = list(outcomes)
+        self.calls = 0
+
+    def post(self, url: str, **_: Any) -> FakeResponse:
+        self.calls += 1
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return outcome
+
+
+def _client(breaker: CircuitBreaker, outcomes: List[Any], max_retries: int = 0) -> InferenceClient:
+    client = InferenceClient(
+        url_template="http://inference.test/{model_id}",
+        max_retries=max_retries,
+        backoff_seconds=0.0,
+        breaker=breaker,
+    )
+    client._session = StubSession(outcomes)
+    return client
+
+
+def _generate(client: InferenceClient, payload: Dict[str, Any] | None = None) -> Any:
+    return client.generate(model_id="model", token="token", payload=payload or {"inputs": "x"}, timeout=1.0)
+
+
+def test_breaker_opens_after_consecutive_failures() -> None:
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout_seconds=10, clock=FakeClock())
+
+    breaker.record_failure()
+    assert breaker.state == STATE_CLOSED and breaker.allow_request()
+
+    breaker.record_failure()
+    assert breaker.state == STATE_OPEN
+    assert not breaker.allow_request()
+
+
+def test_success_resets_the_failure_count() -> None:
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout_seconds=10, clock=FakeClock())
+
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state == STATE_CLOSED
+
+
+def test_half_open_allows_a_single_trial_call() -> None:
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout_seconds=10, clock=clock)
+    breaker.record_failure()
+
+    clock.now = 9.9
+    assert not breaker.allow_request()
+
+    clock.now = 10.0
+    assert breaker.allow_request()
+    assert breaker.state == STATE_HALF_OPEN
+    assert not breaker.allow_request()
+
+
+@pytest.mark.parametrize("succeeds, expected_state", [(True, STATE_CLOSED), (False, STATE_OPEN)])
+def test_half_open_trial_outcome_closes_or_reopens(succeeds: bool, expected_state: str) -> None:
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout_seconds=10, clock=clock)
+    for _ in range(3):
+        breaker.record_failure()
+
+    clock.now = 10.0
+    assert breaker.allow_request()
+    if succeeds:
+        breaker.record_success()
+    else:
+        breaker.record_failure()
+
+    assert breaker.state == expected_state
+    # A reopened breaker waits a full cooldown from the failed trial.
+    clock.now = 15.0
+    assert breaker.allow_request() == succeeds
+
+
+def test_invalid_threshold_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        CircuitBreaker(failure_threshold=0)
+
+
+def test_client_retries_retryable_statuses() -> None:
+    breaker = CircuitBreaker(failure_threshold=1, clock=FakeClock())
+    client = _client(breaker, [FakeResponse(503), FakeResponse(200, [{"generated_text": "ok"}])], max_retries=1)
+
+    assert _generate(client) == [{"generated_text": "ok"}]
+    assert client._session.calls == 2
+    assert breaker.state == STATE_CLOSED
+
+
+def test_client_does_not_retry_timeouts() -> None:
+    breaker = CircuitBreaker(failure_threshold=1, clock=FakeClock())
+    client = _client(breaker, [requests.Timeout(), FakeResponse(200, [])], max_retries=2)
+
+    assert _generate(client) is None
+    assert client._session.calls == 1
+    assert breaker.state == STATE_OPEN
+
+
+def test_open_breaker_skips_the_backend() -> None:
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout_seconds=10, clock=FakeClock())
+    breaker.record_failure()
+    client = _client(breaker, [])
+
+    assert _generate(client) is None
+    assert client._session.calls == 0
+
+
+def test_half_open_trial_that_raises_reopens_the_breaker() -> None:
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout_seconds=10, clock=clock)
+    breaker.record_failure()
+    clock.now = 10.0
+    client = _client(breaker, [RuntimeError("transport bug"), FakeResponse(200, [])])
+
+    with pytest.raises(RuntimeError):
+        _generate(client)
+    assert breaker.state == STATE_OPEN
+
+    clock.now = 20.0
+    assert _generate(client) == []
+    assert breaker.state == STATE_CLOSED
@@ -0,0 +1,82 @@
+"""KeywordMatcher must report exactly what plain substring search finds."""
+
+from __future__ import annotations
+
+import random
+from typing import List, Sequence, Set, Tuple
+
+import pytest
+
+from explainable_ai.core.engine.keyword_matcher import KEYWORD_AUTOMATON_MIN_KEYWORDS, KeywordMatcher
+
+
+# Overlapping keywords: shared prefixes, suffixes and keywords inside keywords.
+OVERLAPPING_KEYWORDS = ["a", "ab", "aba", "bab", "b", "abab", "ba", "c a"]
+STRATEGIES = [False, True]
+
+
+def _random_text(rng: random.Random, size: int) -> str:
+    return "".join(rng.choice("ab c") for _ in range(size))
+
+
+def _substring_keywords(keywords: Sequence[str], text: str) -> Set[int]:
+    return {index for index, keyword in enumerate(keywords) if keyword in text}
+
+
+def _substring_matches(keywords: Sequence[str], text: str) -> List[Tuple[int, int, int]]:
+    return sorted(
+        (start, start + len(keyword), index)
+        for index, keyword in enumerate(keywords)
+        for start in range(len(text))
+        if text.startswith(keyword, start)
+    )
+
+
+@pytest.mark.parametrize("use_automaton", STRATEGIES)
+def test_find_keywords_matches_substring_search(use_automaton: bool) -> None:
+    rng = random.Random(1)
+    matcher = KeywordMatcher(OVERLAPPING_KEYWORDS, use_automaton=use_automaton)
+
+    for _ in range(300):
+        text = _random_text(rng, rng.randint(0, 40))
+        assert matcher.find_keywords(text) == _substring_keywords(OVERLAPPING_KEYWORDS, text)
+
+
+@pytest.mark.parametrize("use_automaton", STRATEGIES)
+def test_iter_matches_reports_every_overlapping_occurrence(use_automaton: bool) -> None:
+    rng = random.Random(2)
+    matcher = KeywordMatcher(OVERLAPPING_KEYWORDS, use_automaton=use_automaton)
+
+    for _ in range(300):
+        text = _random_text(rng, rng.randint(0, 40))
+        matches = list(matcher.iter_matches(text))
+        assert sorted(matches) == _substring_matches(OVERLAPPING_KEYWORDS, text)
+        # Ordered by end offset, longer keywords first on ties.
+        assert matches == sorted(matches, key=lambda match: (match[1], match[0]))
+
+
+def test_strategies_return_identical_match_sequences() -> None:
+    rng = random.Random(3)
+    substring = KeywordMatcher(OVERLAPPING_KEYWORDS, use_automaton=False)
+    automaton = KeywordMatcher(OVERLAPPING_KEYWORDS, use_automaton=True)
+
+    for _ in range(100):
+        text = _random_text(rng, rng.randint(0, 200))
+        assert list(substring.iter_matches(text)) == list(automaton.iter_matches(text))
+
+
+def test_repeated_keyword_occurrences_are_all_reported() -> None:
+    matcher = KeywordMatcher(["aa"])
+    assert list(matcher.iter_matches("aaaa")) == [(0, 2, 0), (1, 3, 0), (2, 4, 0)]
+
+
+def test_strategy_follows_keyword_count_by_default() -> None:
+    assert not KeywordMatcher(["net 90"]).uses_automaton
+    keywords = [f"keyword {index}" for index in range(KEYWORD_AUTOMATON_MIN_KEYWORDS)]
+    assert KeywordMatcher(keywords).uses_automaton
+
+
+@pytest.mark.parametrize("keywords", [[""], ["ok", None]])
+def test_invalid_keywords_are_rejected(keywords: list) -> None:
+    with pytest.raises(ValueError):
+        KeywordMatcher(keywords)
@@ -0,0 +1,43 @@
+"""Policies whose rule ids would collide in scans and hit matrices are rejected."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from explainable_ai.core.engine.rule_engine import RuleEngine
+from explainable_ai.core.risk.keyword_scanner import HARD_GATE_RULE_ID
+
+
+def _engine(policy: str) -> RuleEngine:
+    return RuleEngine(Path("rules.yaml"), policy_source=policy.encode("utf-8"))
+
+
+def test_duplicate_rule_ids_are_rejected() -> None:
+    policy = (
+        "rules:\n"
+        "  - id: payment\n    keywords: [net 90]\n    weight: 10\n"
+        "  - id: payment\n    keywords: [net 120]\n    weight: 20\n"
+    )
+    with pytest.raises(ValueError, match="more than one rule"):
+        _engine(policy)
+
+
+def test_hard_gate_rule_id_is_reserved() -> None:
+    policy = f"rules:\n  - id: {HARD_GATE_RULE_ID}\n    keywords: [net 90]\n    weight: 10\n"
+    with pytest.raises(ValueError, match="reserved"):
+        _engine(policy)
+
+
+def test_rules_sharing_keywords_fail_independently() -> None:
+    engine = _engine(
+        "rules:\n"
+        "  - id: payment\n    keywords: [net 90, late fee]\n    weight: 10\n"
+        "  - id: penalty\n    keywords: [late fee]\n    weight: 20\n"
+    )
+
+    result = engine.evaluate("Payment is net 90.")
+
+    assert result["failed_rules"] == ["payment"]
+    assert engine.evaluate_many(["Payment is net 90."]).failed_rules(0) == ["payment"]
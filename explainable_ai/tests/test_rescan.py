@@ -0,0 +1,74 @@
+"""Incremental rescans must equal a full scan of the revised document."""
+
+from __future__ import annotations
+
+import random
+from pathlib import Path
+from typing import List
+
+from explainable_ai.core.engine.rule_engine import RuleEngine
+
+
+def _revise(document: str, rng: random.Random, donors: List[str]) -> str:
+    """Delete, insert, duplicate and move lines of ``document``."""
+    lines = document.splitlines(keepends=True)
+    for _ in range(rng.randint(0, 4)):
+        action = rng.choice(["delete", "insert", "duplicate", "swap"])
+        if action == "delete" and lines:
+            del lines[rng.randrange(len(lines))]
+        elif action == "insert":
+            lines.insert(rng.randint(0, len(lines)), rng.choice(donors) + "\n")
+        elif action == "duplicate" and lines:
+            lines.insert(rng.randint(0, len(lines)), rng.choice(lines))
+        elif action == "swap" and len(lines) > 1:
+            first, second = rng.sample(range(len(lines)), 2)
+            lines[first], lines[second] = lines[second], lines[first]
+    return "".join(lines)
+
+
+def test_rescan_matches_full_scan(rule_engine: RuleEngine, random_documents: List[str]) -> None:
+    rng = random.Random(18)
+    for previous_text in random_documents:
+        previous_scan = rule_engine.scan(previous_text)
+        document_text = _revise(previous_text, rng, random_documents)
+        result, _ = rule_engine.rescan(document_text, previous_text, previous_scan)
+        assert result == rule_engine.scan(document_text)
+
+
+def test_rescan_reuses_unchanged_lines(rule_engine: RuleEngine) -> None:
+    previous_text = "Payment is NET 90.\nSupplier shall hold harmless.\nGoverning law.\n"
+    document_text = "Payment is NET 90.\nSupplier shall indemnify.\nGoverning law.\n"
+
+    result, reused = rule_engine.rescan(document_text, previous_text, rule_engine.scan(previous_text))
+
+    assert reused == 2
+    assert result == rule_engine.scan(document_text)
+    assert rule_engine.evaluate(document_text, scan=result) == rule_engine.evaluate(document_text)
+
+
+def test_rescan_with_another_policy_scans_everything(rule_engine: RuleEngine) -> None:
+    other = RuleEngine(
+        Path("other_rules.yaml"),
+        policy_source=b"rules:\n  - id: other\n    keywords: [indemnify]\n    weight: 1\n",
+    )
+    text = "indemnify\nnet 90\n"
+
+    result, reused = rule_engine.rescan(text, text, other.scan(text))
+
+    assert reused == 0
+    assert result == rule_engine.scan(text)
+
+
+def test_rescan_with_multiline_keyword_scans_everything() -> None:
+    engine = RuleEngine(
+        Path("multiline_rules.yaml"),
+        policy_source=b'rules:\n  - id: split\n    keywords: ["net\\n90"]\n    weight: 1\n',
+    )
+    previous_text = "Payment net\n90.\n"
+    document_text = "Terms.\nPayment net\n90.\n"
+
+    result, reused = engine.rescan(document_text, previous_text, engine.scan(previous_text))
+
+    assert reused == 0
+    assert result == engine.scan(document_text)
+    assert [match.keyword for match in result.matches] == ["net\n90"]
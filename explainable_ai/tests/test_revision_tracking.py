@@ -0,0 +1,44 @@
+"""Tracked revisions must be kept whether or not the evaluation was cached."""
+
+from __future__ import annotations
+
+from typing import Iterator
+
+import pytest
+
+from explainable_ai.core.engine.main import evaluate_contract
+from explainable_ai.core.engine.result_cache import clear_result_cache
+from explainable_ai.core.engine.revision_store import clear_revision_store, get_revision
+
+
+PREVIOUS_TEXT = "Payment terms are net 90.\nSupplier shall indemnify the buyer.\nGoverning law applies.\n"
+REVISED_TEXT = "Payment terms are net 30.\nSupplier shall indemnify the buyer.\nGoverning law applies.\n"
+
+
+@pytest.fixture(autouse=True)
+def empty_caches() -> Iterator[None]:
+    clear_result_cache()
+    clear_revision_store()
+    yield
+    clear_result_cache()
+    clear_revision_store()
+
+
+def test_untracked_evaluation_keeps_no_revision() -> None:
+    evaluate_contract(PREVIOUS_TEXT)
+    assert get_revision(PREVIOUS_TEXT) is None
+
+
+def test_cached_evaluation_still_tracks_its_revision() -> None:
+    evaluate_contract(PREVIOUS_TEXT)
+    cached = evaluate_contract(PREVIOUS_TEXT, track_revision=True)
+    assert cached["cache_hit"]
+
+    revised = evaluate_contract(REVISED_TEXT, previous_document_text=PREVIOUS_TEXT, track_revision=True)
+
+    assert not revised["cache_hit"]
+    assert revised["reused_clauses"] == 2
+    clear_result_cache()
+    full = evaluate_contract(REVISED_TEXT)
+    assert revised["decision"] == full["decision"]
+    assert revised["trace"].to_list() == full["trace"].to_list()
@@ -0,0 +1,86 @@
+"""One RuleEngine.scan must serve rule evaluation, the hard gate and the highlighter."""
+
+from __future__ import annotations
+
+import random
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from explainable_ai.core.engine.rule_engine import RuleEngine, _lowered_offset_map
+from explainable_ai.core.risk.keyword_scanner import HARD_GATE_RULE_ID, scan_for_risks
+
+
+def test_scan_offsets_point_at_the_matched_text(rule_engine: RuleEngine, random_documents: List[str]) -> None:
+    for document in random_documents:
+        for match in rule_engine.scan(document).matches:
+            assert document[match.start : match.end].lower() == match.keyword
+
+
+def test_scan_finds_every_keyword_occurrence(rule_engine: RuleEngine, random_documents: List[str]) -> None:
+    for document in random_documents:
+        # Keep lowered offsets equal to original ones; remapping is tested separately.
+        document = document.replace("İ", "I")
+        lowered = document.lower()
+        matches = rule_engine.scan(document).matches
+        for rule in rule_engine.rules:
+            expected = sorted(
+                (start, start + len(keyword))
+                for keyword in rule.keywords
+                for start in range(len(lowered))
+                if lowered.startswith(keyword, start)
+            )
+            found = sorted((match.start, match.end) for match in matches if match.rule_id == rule.id)
+            assert found == expected
+
+
+def test_scan_offsets_survive_length_changing_lowercase(rule_engine: RuleEngine) -> None:
+    # "İ" lowercases to two characters, shifting every later offset in the lowered text.
+    document = "İİ Hold Harmless and NET 90"
+    spans = {
+        (match.keyword, document[match.start : match.end])
+        for match in rule_engine.scan(document).matches
+    }
+    assert ("hold harmless", "Hold Harmless") in spans
+    assert ("net 90", "NET 90") in spans
+
+
+def test_lowered_offset_map_matches_per_character_expansion() -> None:
+    rng = random.Random(9)
+    for _ in range(500):
+        text = "".join(rng.choice(["İ", "ﬃ", "a", "Σ", " "]) for _ in range(rng.randint(0, 30)))
+        offset_map = _lowered_offset_map(text, text.lower())
+        expected = [position for position, char in enumerate(text) for _ in char.lower()]
+        if offset_map is None:
+            assert expected == list(range(len(text)))
+        else:
+            assert [offset_map.original(position) for position in range(len(expected))] == expected
+
+
+def test_evaluate_with_shared_scan_matches_direct_evaluation(
+    rule_engine: RuleEngine,
+    random_documents: List[str],
+) -> None:
+    for document in random_documents:
+        scan = rule_engine.scan(document)
+        assert rule_engine.evaluate(document, scan=scan) == rule_engine.evaluate(document)
+
+
+def test_hard_gate_from_shared_scan_matches_text_scan(
+    rule_engine: RuleEngine,
+    random_documents: List[str],
+) -> None:
+    for document in random_documents:
+        scan = rule_engine.scan(document)
+        assert scan_for_risks(document, scan=scan) == scan_for_risks(document)
+        assert HARD_GATE_RULE_ID not in rule_engine.evaluate(document, scan=scan)["failed_rules"]
+
+
+def test_scan_from_another_policy_is_rejected(rule_engine: RuleEngine) -> None:
+    other = RuleEngine(
+        Path("other_rules.yaml"),
+        policy_source=b"rules:\n  - id: other\n    keywords: [indemnify]\n    weight: 1\n",
+    )
+    with pytest.raises(ValueError):
+        rule_engine.evaluate("indemnify", scan=other.scan("indemnify"))